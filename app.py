@@ -1,113 +1,146 @@
-from flask import Flask, render_template, request, jsonify
-import time
-import random
-import csv
-import io
+from flask import Flask, Response, render_template, request, jsonify, stream_with_context
+import json
 import os
+import time
 from datetime import datetime
 
+from csv_ingest import ColumnNotFoundError, load_column
+from budget import BudgetScheduler, annotate_with_plan, extrapolated_result
+from cancellation import Cancelled, interrupted_result, run_in_subprocess
+import distributions
+from dataset_store import DatasetStore, DatasetTooLargeError
+from jobs import JobManager
+from memory_profile import measure_memory
+from record_sort import MixedColumnError, SortedView, load_table, pack_keys, parse_keys, unpack_permutation
+from result_cache import ResultCache, cache_key, cacheable_result, dataset_fingerprint
+import sort_registry
+from timing import measure, round_stats
+from verification import fingerprint, verify_output
+
 app = Flask(__name__)
 
-# Implementasi algoritma sorting manual
-
-def bubble_sort(arr):
-    """Bubble Sort implementation"""
-    n = len(arr)
-    for i in range(n):
-        for j in range(0, n - i - 1):
-            if arr[j] > arr[j + 1]:
-                arr[j], arr[j + 1] = arr[j + 1], arr[j]
-    return arr
-
-def selection_sort(arr):
-    """Selection Sort implementation"""
-    n = len(arr)
-    for i in range(n):
-        min_idx = i
-        for j in range(i + 1, n):
-            if arr[j] < arr[min_idx]:
-                min_idx = j
-        arr[i], arr[min_idx] = arr[min_idx], arr[i]
-    return arr
-
-def quick_sort(arr):
-    """Quick Sort implementation"""
-    if len(arr) <= 1:
-        return arr
-    pivot = arr[len(arr) // 2]
-    left = [x for x in arr if x < pivot]
-    middle = [x for x in arr if x == pivot]
-    right = [x for x in arr if x > pivot]
-    return quick_sort(left) + middle + quick_sort(right)
-
-def merge_sort(arr):
-    """Merge Sort implementation"""
-    if len(arr) <= 1:
-        return arr
-    
-    mid = len(arr) // 2
-    left = arr[:mid]
-    right = arr[mid:]
-    
-    left = merge_sort(left)
-    right = merge_sort(right)
-    
-    return merge(left, right)
-
-def merge(left, right):
-    """Merge function for merge sort"""
-    result = []
-    i = j = 0
-    
-    while i < len(left) and j < len(right):
-        if left[i] <= right[j]:
-            result.append(left[i])
-            i += 1
-        else:
-            result.append(right[j])
-            j += 1
-    
-    result.extend(left[i:])
-    result.extend(right[j:])
-    return result
+# Batas waktu pengukuran per algoritma untuk endpoint sinkron (detik)
+WEB_TIME_BUDGET_S = 2.0
+
+# Batas keras per algoritma: pengukuran jalan di subprocess yang di-kill setelah ini,
+# jadi response time endpoint sinkron tetap terbatas walau prediksi budget meleset
+WEB_HARD_TIMEOUT_S = 10.0
+
+# Cell yang diprediksi melebihi budget tidak dijalankan; app tidak punya checkpoint
+# kooperatif, jadi hard_factor=1.0 (jalankan atau ekstrapolasi, tanpa deadline)
+web_scheduler = BudgetScheduler(WEB_TIME_BUDGET_S, hard_factor=1.0)
+
+# Dataset hasil upload disimpan di server, client cukup mengirim dataset_id
+dataset_store = DatasetStore()
 
-def test_sorting_algorithm(algorithm, data, algorithm_name):
+# Hasil per cell di-cache (memori + results/cache di disk); entry otomatis tidak
+# terpakai lagi kalau source algoritma, dataset atau parameter berubah
+result_cache = ResultCache()
+
+# Benchmark berat dijalankan di background worker; client mengikuti progress lewat
+# stream SSE /jobs/<id>/events (atau polling /jobs/<id>). Cell job memakai cache yang sama.
+job_manager = JobManager(result_cache=result_cache)
+
+# Seed default untuk dashboard (tombol "Test 1K, 10K, 50K" dan /run_multiple_tests),
+# supaya klik berulang tanpa seed memakai data yang sama dan dilayani dari cache
+DASHBOARD_SEED = 0
+
+# Interval keepalive stream SSE saat tidak ada event baru (detik)
+SSE_KEEPALIVE_S = 15.0
+
+def test_sorting_algorithm(algorithm, data, algorithm_name, profile_memory=False):
     """Test sorting algorithm and return execution time"""
-    # Copy data to avoid modifying original
-    test_data = data.copy()
-    
-    # Measure execution time
-    start_time = time.time()
-    sorted_data = algorithm(test_data)
-    end_time = time.time()
-    
-    execution_time = (end_time - start_time) * 1000  # Convert to milliseconds
+    # Warmup + pengulangan adaptif; budget waktu lebih kecil supaya request tetap responsif
+    start = time.perf_counter()
+    try:
+        stats, sorted_data = run_in_subprocess(WEB_HARD_TIMEOUT_S, None, algorithm_name,
+                                               measure, algorithm, data, max_time_s=WEB_TIME_BUDGET_S)
+    except Cancelled as e:
+        return interrupted_result(algorithm_name, len(data), e, (time.perf_counter() - start) * 1000)
     
-    # Verify sorting is correct
-    is_sorted = all(sorted_data[i] <= sorted_data[i + 1] for i in range(len(sorted_data) - 1))
+    # Verify sorting is correct: urutan dan permutasi input, di luar waktu yang diukur
+    verification = verify_output(sorted_data, fingerprint(data))
     
-    return {
+    result = {
         'algorithm': algorithm_name,
-        'time_ms': round(execution_time, 2),
+        'time_ms': round(stats['median_ms'], 2),
+        'time_stats': round_stats(stats),
         'data_size': len(data),
-        'is_correct': is_sorted
+        'is_correct': verification['is_correct'],
+        'verification': verification
     }
+    
+    if profile_memory:
+        # tracemalloc global per proses: ukur di child supaya tidak mengganggu job yang
+        # sedang mengukur waktu di thread lain, dan dibatasi WEB_HARD_TIMEOUT_S
+        try:
+            result['memory'] = run_in_subprocess(WEB_HARD_TIMEOUT_S, None, algorithm_name,
+                                                 measure_memory, algorithm, data)
+        except Cancelled:
+            result['memory'] = None
+    
+    return result
+
+def run_budgeted(algorithm, data, algorithm_name, profile_memory=False):
+    """Measure one algorithm, or extrapolate its time when it would exceed the web budget
+
+    Algorithms that do not apply to the data (e.g. counting sort on a wide
+    key range) are skipped.
+    """
+    reason = sort_registry.not_applicable_reason(algorithm_name, data)
+    if reason is not None:
+        return sort_registry.skipped_result(algorithm_name, len(data), reason)
+    plan = web_scheduler.plan(algorithm, data)
+    if plan['action'] == 'extrapolate':
+        return extrapolated_result(algorithm_name, len(data), plan)
+    result = test_sorting_algorithm(algorithm, data, algorithm_name, profile_memory)
+    result.setdefault('mode', 'measured')
+    return annotate_with_plan(result, plan)
+
+def cached_run(algorithm, data, algorithm_name, data_fp, params, profile_memory=False):
+    """run_budgeted through the result cache; the result says whether it was 'cached'"""
+    key = cache_key(algorithm_name, algorithm, data_fp,
+                    dict(params, profile_memory=profile_memory, budget_s=WEB_TIME_BUDGET_S))
+    result, hit = result_cache.get_or_compute(
+        key, lambda: run_budgeted(algorithm, data, algorithm_name, profile_memory), cacheable_result)
+    result['cached'] = hit
+    return result
+
+def web_algorithms():
+    """(function, name) pairs offered by the web endpoints - the same registry the CLIs use"""
+    return sort_registry.get_algorithms()
+
+def distribution_params(params, default_seed=None):
+    """Read and validate 'distribution' and 'seed' from request JSON (no seed: default_seed or a new one)"""
+    distribution = params.get('distribution') or distributions.DEFAULT_DISTRIBUTION
+    if distribution not in distributions.DISTRIBUTIONS:
+        raise ValueError(f"Unknown distribution '{distribution}'. "
+                         f"Available: {', '.join(distributions.DISTRIBUTIONS)}")
+    seed = params.get('seed', default_seed)
+    seed = distributions.new_seed() if seed is None else int(seed)
+    return distribution, seed
 
 @app.route('/')
 def index():
-    return render_template('index.html')
+    return render_template('index.html', dashboard_seed=DASHBOARD_SEED)
 
 @app.route('/generate_data', methods=['POST'])
 def generate_data():
     """Generate random data for testing"""
     data_size = int(request.json['size'])
+    try:
+        distribution, seed = distribution_params(request.json)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     
     # Generate random data
-    random_data = [random.randint(1, 1000000) for _ in range(data_size)]
+    random_data = distributions.generate_data(distribution, data_size, seed)
     
     return jsonify({
         'message': f'Generated {data_size} random numbers',
         'data_size': data_size,
+        'distribution': distribution,
+        'seed': seed,
         'sample_data': random_data[:10]  # Return first 10 for preview
     })
 
@@ -125,75 +158,123 @@ def upload_data():
     if not file.filename.endswith('.csv'):
         return jsonify({'error': 'Please upload a CSV file'}), 400
     
+    column = request.form.get('column') or None
+    
     try:
-        # Read CSV file
-        stream = io.StringIO(file.stream.read().decode("UTF8"), newline=None)
-        csv_reader = csv.reader(stream)
-        
-        # Extract data (assuming first column contains numbers)
-        data = []
-        for i, row in enumerate(csv_reader):
-            if i == 0:  # Skip header
-                continue
-            if row:  # Check if row is not empty
-                try:
-                    data.append(int(float(row[0])))  # Convert to int
-                except (ValueError, IndexError):
-                    continue
+        # Baca CSV secara streaming per chunk, hanya kolom yang dipilih
+        data = load_column(file.stream, column)
         
         if not data:
             return jsonify({'error': 'No valid numeric data found in CSV'}), 400
         
+        dataset_id = dataset_store.add(data, name=file.filename)
+        
         return jsonify({
             'message': f'Successfully loaded {len(data)} numbers from CSV',
+            'dataset_id': dataset_id,
             'data_size': len(data),
-            'sample_data': data[:10]  # Return first 10 for preview
+            'sample_data': data[:10].tolist()  # Return first 10 for preview
         })
         
+    except ColumnNotFoundError as e:
+        return jsonify({'error': str(e), 'available_columns': e.available}), 400
+    except DatasetTooLargeError as e:
+        return jsonify({'error': str(e), 'max_bytes': e.max_bytes}), 413
     except Exception as e:
         return jsonify({'error': f'Error processing file: {str(e)}'}), 500
 
+@app.route('/sort_records', methods=['POST'])
+def sort_records():
+    """Sort whole CSV records by one or more keys and stream the result as CSV"""
+    file = request.files.get('file')
+    if file is None or file.filename == '':
+        return jsonify({'error': 'No file uploaded'}), 400
+    if not file.filename.endswith('.csv'):
+        return jsonify({'error': 'Please upload a CSV file'}), 400
+    
+    algorithms = dict((name, func) for func, name in web_algorithms())
+    algorithm_name = request.form.get('algorithm') or "Built-in sorted"
+    if algorithm_name not in algorithms:
+        return jsonify({'error': f"Unknown algorithm '{algorithm_name}'",
+                        'available_algorithms': list(algorithms)}), 400
+    
+    algorithm = algorithms[algorithm_name]
+    try:
+        keys = parse_keys(request.form.get('keys') or 'total_amount')
+        # Baris disimpan per kolom, yang diurutkan hanya permutasi indeks
+        table = load_table(file.stream)
+        packed = pack_keys(table, keys)
+        reason = sort_registry.not_applicable_reason(algorithm_name, packed)
+        if reason is not None:
+            return jsonify({'error': f"{algorithm_name} does not apply to these keys: {reason}"}), 400
+        # Batas yang sama dengan endpoint benchmark: cell yang diprediksi melebihi
+        # budget ditolak, sisanya jalan di subprocess dengan batas keras
+        plan = web_scheduler.plan(algorithm, packed)
+        if plan['action'] == 'extrapolate':
+            return jsonify({'error': f"{algorithm_name} is predicted to take {plan['predicted_ms']:,.0f} ms "
+                                     f"for {len(table):,} records, over the {WEB_TIME_BUDGET_S:g} s web budget; "
+                                     f"choose a faster algorithm",
+                            'predicted_ms': round(plan['predicted_ms'], 2)}), 400
+        start = time.perf_counter()
+        ordered = run_in_subprocess(WEB_HARD_TIMEOUT_S, None, algorithm_name, algorithm, packed)
+        sort_ms = (time.perf_counter() - start) * 1000
+        permutation = unpack_permutation(ordered, len(table))
+    except ColumnNotFoundError as e:
+        return jsonify({'error': str(e), 'available_columns': e.available}), 400
+    except MixedColumnError as e:
+        return jsonify({'error': str(e), 'column': e.column}), 400
+    except Cancelled as e:
+        return jsonify({'error': f'Error sorting records: {e}'}), 504
+    except Exception as e:
+        return jsonify({'error': f'Error sorting records: {str(e) or type(e).__name__}'}), 400
+    
+    view = SortedView(table, permutation)
+    return Response(stream_with_context(view.iter_csv()), mimetype='text/csv', headers={
+        'Content-Disposition': f'attachment; filename=sorted_{os.path.basename(file.filename)}',
+        'X-Sort-Algorithm': algorithm_name,
+        'X-Sort-Time-Ms': f'{sort_ms:.2f}',
+        'X-Record-Count': str(len(view)),
+    })
+
 @app.route('/run_comparison', methods=['POST'])
 def run_comparison():
     """Run sorting algorithms comparison"""
-    data_size = int(request.json['data_size'])
-    use_uploaded_data = request.json.get('use_uploaded_data', False)
-    uploaded_data = request.json.get('uploaded_data', [])
+    data_size = int(request.json.get('data_size', 0))
+    dataset_id = request.json.get('dataset_id')
+    profile_memory = bool(request.json.get('profile_memory', False))
+    try:
+        distribution, seed = distribution_params(request.json)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     
     # Prepare test data
-    if use_uploaded_data and uploaded_data:
-        test_data = uploaded_data
+    if dataset_id:
+        dataset = dataset_store.get(dataset_id)
+        if dataset is None:
+            return jsonify({'error': 'Dataset not found or expired, please upload again'}), 404
+        test_data = dataset.tolist()
+        data_size = len(test_data)
+        distribution, seed = 'dataset', None
     else:
-        test_data = [random.randint(1, 1000000) for _ in range(data_size)]
+        test_data = distributions.generate_data(distribution, data_size, seed)
     
     # Define algorithms to test
-    algorithms = [
-        (bubble_sort, "Bubble Sort"),
-        (selection_sort, "Selection Sort"), 
-        (quick_sort, "Quick Sort"),
-        (merge_sort, "Merge Sort")
-    ]
+    algorithms = web_algorithms()
+    data_fp = dataset_fingerprint(test_data)
+    params = {'data_size': data_size, 'distribution': distribution, 'seed': seed}
     
     results = []
     
-    # Test each algorithm
+    # Test each algorithm (dari cache kalau cell yang sama sudah pernah diukur)
     for algorithm, name in algorithms:
-        if data_size > 10000 and name == "Bubble Sort":
-            # Skip bubble sort for large datasets (too slow)
-            results.append({
-                'algorithm': name,
-                'time_ms': 'Timeout',
-                'data_size': data_size,
-                'is_correct': 'Skipped'
-            })
-            continue
-            
-        result = test_sorting_algorithm(algorithm, test_data, name)
+        result = cached_run(algorithm, test_data, name, data_fp, params, profile_memory)
         results.append(result)
     
     return jsonify({
         'results': results,
         'data_size': data_size,
+        'distribution': distribution,
+        'seed': seed,
         'test_timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     })
 
@@ -202,38 +283,116 @@ def run_multiple_tests():
     """Run tests for multiple data sizes"""
     test_sizes = [1000, 10000, 50000]
     all_results = []
+    try:
+        distribution, seed = distribution_params(request.get_json(silent=True) or {}, default_seed=DASHBOARD_SEED)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     
     for size in test_sizes:
         # Generate test data for this size
-        test_data = [random.randint(1, 1000000) for _ in range(size)]
+        test_data = distributions.generate_data(distribution, size, seed)
+        data_fp = dataset_fingerprint(test_data)
+        params = {'data_size': size, 'distribution': distribution, 'seed': seed}
         
-        algorithms = [
-            (quick_sort, "Quick Sort"),
-            (merge_sort, "Merge Sort"),
-            (selection_sort, "Selection Sort")
-        ]
+        algorithms = [(sort_registry.get(name).func, name)
+                      for name in ("Quick Sort", "Merge Sort", "Selection Sort")]
         
         size_results = {'data_size': size, 'results': []}
         
         for algorithm, name in algorithms:
-            if size == 50000 and name == "Selection Sort":
-                # Skip selection sort for 50k (too slow)
-                size_results['results'].append({
-                    'algorithm': name,
-                    'time_ms': 'Timeout',
-                    'is_correct': 'Skipped'
-                })
-                continue
-                
-            result = test_sorting_algorithm(algorithm, test_data, name)
+            result = cached_run(algorithm, test_data, name, data_fp, params)
             size_results['results'].append(result)
         
         all_results.append(size_results)
     
     return jsonify({
         'multiple_results': all_results,
+        'distribution': distribution,
+        'seed': seed,
         'test_timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     })
 
+@app.route('/jobs', methods=['POST'])
+def submit_job():
+    """Submit a benchmark job and return its ID immediately"""
+    params = request.json or {}
+    dataset_id = params.get('dataset_id')
+    profile_memory = bool(params.get('profile_memory', False))
+    try:
+        distribution, seed = distribution_params(params)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    if dataset_id:
+        dataset = dataset_store.get(dataset_id)
+        if dataset is None:
+            return jsonify({'error': 'Dataset not found or expired, please upload again'}), 404
+        test_data = dataset.tolist()
+        test_data_by_size = {len(test_data): test_data}
+        distribution, seed = 'dataset', None
+    else:
+        data_sizes = params.get('data_sizes') or [params.get('data_size', 1000)]
+        test_data_by_size = {}
+        for size in data_sizes:
+            size = int(size)
+            test_data_by_size[size] = distributions.generate_data(distribution, size, seed)
+    
+    timeout_s = params.get('timeout_s')
+    try:
+        job = job_manager.submit(test_data_by_size, params.get('algorithms'), profile_memory,
+                                 tags={'distribution': distribution, 'seed': seed},
+                                 timeout_s=float(timeout_s) if timeout_s else None)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    return jsonify({'job_id': job.job_id, 'status': job.status}), 202
+
+@app.route('/jobs/<job_id>', methods=['GET'])
+def job_status(job_id):
+    """Return status, per-algorithm progress and partial results of a job"""
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify(job.snapshot())
+
+def sse_stream(job, after_id):
+    """Yield the job's events as server-sent events until its 'end' event"""
+    while True:
+        events = job.wait_events(after_id, SSE_KEEPALIVE_S)
+        if not events:
+            if job.finished:
+                return
+            # Komentar SSE supaya proxy tidak menutup koneksi yang diam
+            yield ": keepalive\n\n"
+            continue
+        for event_id, event, data in events:
+            yield f"id: {event_id}\nevent: {event}\ndata: {json.dumps(data)}\n\n"
+            after_id = event_id
+            if event == 'end':
+                return
+
+@app.route('/jobs/<job_id>/events', methods=['GET'])
+def job_events(job_id):
+    """Stream start, progress, done and end events of a job (text/event-stream)
+
+    A reconnecting EventSource sends Last-Event-ID and resumes after it.
+    """
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    after_id = request.headers.get('Last-Event-ID', type=int) or 0
+    return Response(stream_with_context(sse_stream(job, after_id)), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no',
+    })
+
+@app.route('/jobs/<job_id>/cancel', methods=['POST'])
+def cancel_job(job_id):
+    """Cancel a queued or running job; the current algorithm stops at its next checkpoint"""
+    job = job_manager.cancel(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify(job.snapshot())
+
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
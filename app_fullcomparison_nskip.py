@@ -1,152 +1,142 @@
+import argparse
+import itertools
 import time
-import random
-import sys
 from datetime import datetime
 
-# Increase recursion limit for large datasets
-sys.setrecursionlimit(100000)
+from binary_dataset import cached_dataset
+from budget import BudgetScheduler, annotate_with_plan, display_time, extrapolated_result, single_run_options
+from cancellation import CancellationToken, Cancelled, interrupted_result, run_in_subprocess
+from distributions import DEFAULT_DISTRIBUTION, DISTRIBUTIONS, generate_data, new_seed
+from memory_profile import format_bytes, format_memory, measure_memory
+from op_counter import count_operations, format_count
+from results_db import DEFAULT_DB_PATH, ResultsDB
+import sort_registry
+from timing import format_spread, limited_options, measure, round_stats
+from verification import fingerprint, verify_output
 
 class FullSortingComparator:
-    def __init__(self):
+    def __init__(self, progress_callback=None, timing_options=None, profile_memory=False,
+                 time_budget_s=None, timeout_s=None, hard_timeout=False, cancel_token=None,
+                 count_ops=False, dataset_dir=None, verify_sample=None):
         self.results = []
+        # Kalau diset, data uji disimpan sebagai dataset biner di sini dan di-mmap ulang
+        # pada run berikutnya dengan distribusi, ukuran dan seed yang sama
+        self.dataset_dir = dataset_dir
+        # Verifikasi urutan disampling kalau n lebih besar dari ini (None = cek penuh)
+        self.verify_sample = verify_sample
+        # Dengan time_budget_s, setiap cell dijadwalkan lewat cost model (lihat budget.py)
+        self.scheduler = BudgetScheduler(time_budget_s) if time_budget_s else None
+        # Batas waktu per cell; dengan hard_timeout cell dijalankan di subprocess yang bisa di-kill
+        self.timeout_s = timeout_s
+        self.hard_timeout = hard_timeout
+        # Token pembatalan dari luar (mis. job yang dibatalkan) dan token run yang sedang jalan
+        self.cancel_token = cancel_token
+        self.token = None
+        # Kalau True, setiap algoritma dijalankan sekali lagi di bawah tracemalloc
+        self.profile_memory = profile_memory
+        # Kalau True, setiap algoritma dijalankan sekali lagi dengan elemen terinstrumentasi
+        # untuk menghitung perbandingan dan penulisan (lihat op_counter.py)
+        self.count_ops = count_ops
+        # Opsi untuk timing.measure (warmup, repetisi, target error, dll)
+        self.timing_options = timing_options or {}
+        # Dipanggil dengan (nama_algoritma, persen) setiap checkpoint progress
+        self.progress_callback = progress_callback
     
-    # SELECTION SORT dengan progress indicator
-    def selection_sort(self, arr):
-        n = len(arr)
-        for i in range(n):
-            # Progress indicator untuk data besar
-            if n > 10000 and i % 1000 == 0:
-                progress = (i / n) * 100
-                print(f"   Selection Sort progress: {progress:.1f}%", end='\r')
-            
-            min_idx = i
-            for j in range(i + 1, n):
-                if arr[j] < arr[min_idx]:
-                    min_idx = j
-            arr[i], arr[min_idx] = arr[min_idx], arr[i]
-        return arr
+    def report_progress(self, algorithm_name, progress):
+        """Print progress and forward it to progress_callback if set"""
+        print(f"   {algorithm_name} progress: {progress:.1f}%", end='\r')
+        if self.progress_callback is not None:
+            self.progress_callback(algorithm_name, progress)
     
-    # BUBBLE SORT dengan optimisasi
-    def bubble_sort(self, arr):
-        n = len(arr)
-        for i in range(n):
-            # Progress indicator
-            if n > 5000 and i % 500 == 0:
-                progress = (i / n) * 100
-                print(f"   Bubble Sort progress: {progress:.1f}%", end='\r')
-            
-            swapped = False
-            for j in range(0, n - i - 1):
-                if arr[j] > arr[j + 1]:
-                    arr[j], arr[j + 1] = arr[j + 1], arr[j]
-                    swapped = True
-            # Jika tidak ada swap, array sudah sorted
-            if not swapped:
-                break
-        return arr
+    def checkpoint(self, algorithm_name, i, n):
+        """Progress checkpoint from the O(n²) sorts; stops them if cancelled or past their deadline"""
+        # Progress indicator untuk data besar
+        if n > 5000 and i % 500 == 0:
+            self.report_progress(algorithm_name, (i / n) * 100)
+        if self.token is not None:
+            self.token.check(algorithm_name, (i / n) * 100)
     
-    # QUICK SORT
-    def quick_sort(self, arr):
-        if len(arr) <= 1:
-            return arr
-        pivot = arr[len(arr) // 2]
-        left = [x for x in arr if x < pivot]
-        middle = [x for x in arr if x == pivot]
-        right = [x for x in arr if x > pivot]
-        return self.quick_sort(left) + middle + self.quick_sort(right)
+    def get_algorithms(self):
+        """Return the (function, name) pairs benchmarked by run_comparison"""
+        return sort_registry.get_algorithms(checkpoint=self.checkpoint)
     
-    # MERGE SORT
-    def merge_sort(self, arr):
-        if len(arr) <= 1:
-            return arr
-        
-        mid = len(arr) // 2
-        left = arr[:mid]
-        right = arr[mid:]
-        
-        left = self.merge_sort(left)
-        right = self.merge_sort(right)
-        
-        return self.merge(left, right)
+    def generate_test_data(self, size, distribution=DEFAULT_DISTRIBUTION, seed=None):
+        """Generate test data from the given input distribution (or reload it from dataset_dir)"""
+        if self.dataset_dir:
+            return cached_dataset(self.dataset_dir, distribution, size, seed)
+        return generate_data(distribution, size, seed)
     
-    def merge(self, left, right):
-        result = []
-        i = j = 0
-        
-        while i < len(left) and j < len(right):
-            if left[i] <= right[j]:
-                result.append(left[i])
-                i += 1
-            else:
-                result.append(right[j])
-                j += 1
-        
-        result.extend(left[i:])
-        result.extend(right[j:])
-        return result
-    
-    # HEAP SORT
-    def heap_sort(self, arr):
-        def heapify(arr, n, i):
-            largest = i
-            left = 2 * i + 1
-            right = 2 * i + 2
-            
-            if left < n and arr[left] > arr[largest]:
-                largest = left
-                
-            if right < n and arr[right] > arr[largest]:
-                largest = right
-                
-            if largest != i:
-                arr[i], arr[largest] = arr[largest], arr[i]
-                heapify(arr, n, largest)
-        
-        n = len(arr)
-        
-        # Build max heap
-        for i in range(n // 2 - 1, -1, -1):
-            heapify(arr, n, i)
-        
-        # Extract elements from heap
-        for i in range(n - 1, 0, -1):
-            arr[i], arr[0] = arr[0], arr[i]
-            heapify(arr, i, 0)
-        
-        return arr
-    
-    def generate_test_data(self, size):
-        """Generate random test data"""
-        return [random.randint(1, 1000000) for _ in range(size)]
+    def group_results(self, all_results):
+        """Group results by (distribution, data size), in run order"""
+        groups = {}
+        for result in all_results:
+            key = (result.get('distribution', DEFAULT_DISTRIBUTION), result['data_size'])
+            groups.setdefault(key, []).append(result)
+        return groups
     
-    def verify_sorted(self, arr):
-        """Verify if array is correctly sorted"""
-        return all(arr[i] <= arr[i + 1] for i in range(len(arr) - 1))
+    def verify_sorted(self, arr, data):
+        """Verify that arr is sorted and a permutation of data (outside the timed region)"""
+        return verify_output(arr, fingerprint(data), self.verify_sample)
     
-    def test_algorithm(self, algorithm, data, algorithm_name, data_size):
-        """Test a single algorithm and return results"""
-        test_data = data.copy()
+    def test_algorithm(self, algorithm, data, algorithm_name, data_size, deadline_s=None):
+        """Test a single algorithm and return results
         
+        With deadline_s (from the budget scheduler) the algorithm runs once.
+        Each run is bounded by the earlier of deadline_s and self.timeout_s,
+        and repetitions stop once that much time has been spent: Bubble and
+        Selection Sort stop at their next checkpoint, and with hard_timeout
+        any algorithm is killed in its subprocess. Samples from runs that
+        finished are kept; a cell stopped before its first sample reports
+        elapsed_ms and the percentage completed.
+        """
+        start = time.perf_counter()
+        limits = [t for t in (deadline_s, self.timeout_s) if t]
         try:
             print(f"   🔄 Menjalankan {algorithm_name}...")
-            start_time = time.time()
-            sorted_data = algorithm(test_data)
-            end_time = time.time()
-            
-            execution_time = (end_time - start_time) * 1000  # Convert to milliseconds
-            is_correct = self.verify_sorted(sorted_data)
+            # Warmup + pengulangan adaptif, waktu yang dilaporkan adalah median
+            timing_options = single_run_options(self.timing_options) if deadline_s else self.timing_options
+            limit = min(limits) if limits else None
+            if limit is not None:
+                timing_options = limited_options(timing_options, limit)
+            self.token = CancellationToken(limit, parent=self.cancel_token)
+            try:
+                if self.hard_timeout and limit is not None:
+                    # Total waktu: budget pengulangan + satu run terakhir, masing-masing <= limit
+                    stats, sorted_data = run_in_subprocess(2 * limit, self.token, algorithm_name, measure,
+                                                           algorithm, data, before_run=self.token.restart,
+                                                           **timing_options)
+                else:
+                    stats, sorted_data = measure(algorithm, data, before_run=self.token.restart,
+                                                 **timing_options)
+            finally:
+                self.token = None
+            execution_time = stats['median_ms']
+            verification = self.verify_sorted(sorted_data, data)
             
             # Clear progress line
             print(' ' * 50, end='\r')
             
-            return {
+            result = {
                 'algorithm': algorithm_name,
                 'time_ms': round(execution_time, 2),
+                'time_stats': round_stats(stats),
                 'data_size': data_size,
-                'is_correct': is_correct,
+                'is_correct': verification['is_correct'],
+                'verification': verification,
                 'status': 'Completed'
             }
             
+            if self.profile_memory:
+                result['memory'] = measure_memory(algorithm, data)
+            
+            if self.count_ops:
+                result['ops'] = self.count_cell_operations(algorithm, data, algorithm_name)
+            
+            return result
+            
+        except Cancelled as e:
+            print(' ' * 50, end='\r')
+            return interrupted_result(algorithm_name, data_size, e, (time.perf_counter() - start) * 1000)
         except Exception as e:
             return {
                 'algorithm': algorithm_name,
@@ -156,61 +146,184 @@ class FullSortingComparator:
                 'status': f'Error: {str(e)}'
             }
     
-    def run_comparison(self, data_sizes=[1000, 10000, 50000]):
-        """Run comparison for all algorithms on given data sizes"""
+    def count_cell_operations(self, algorithm, data, algorithm_name):
+        """Operation counts for one algorithm, or None if unavailable or timed out
+        
+        The instrumented run is several times slower than the timed one,
+        so it is bounded by the same timeout and cancel token.
+        """
+        self.token = CancellationToken(self.timeout_s, parent=self.cancel_token)
+        entry = sort_registry.get(algorithm_name)
+        try:
+            return count_operations(algorithm, data, buffers=entry is not None and entry.buffers,
+                                    in_place=entry is not None and entry.in_place)
+        except Cancelled:
+            return None
+        except TypeError:
+            # Mis. NumPy tidak bisa mengurutkan elemen terinstrumentasi
+            return None
+        finally:
+            self.token = None
+    
+    def run_cell(self, algorithm, data, algorithm_name, data_size):
+        """Run one cell, through the time-budget scheduler when one is configured
+
+        Cells the algorithm does not apply to (e.g. counting sort on a wide
+        key range) are skipped - this is not a speed-based skip.
+        """
+        reason = sort_registry.not_applicable_reason(algorithm_name, data)
+        if reason is not None:
+            return sort_registry.skipped_result(algorithm_name, data_size, reason)
+        if self.scheduler is None:
+            return self.test_algorithm(algorithm, data, algorithm_name, data_size)
+        
+        plan = self.scheduler.plan(algorithm, data)
+        if plan['action'] == 'extrapolate':
+            print(f"   📐 {algorithm_name}: diperkirakan {plan['predicted_ms']:,.0f} ms ({plan['model']}), tidak dijalankan")
+            return extrapolated_result(algorithm_name, data_size, plan)
+        
+        result = self.test_algorithm(algorithm, data, algorithm_name, data_size, plan['deadline_s'])
+        return annotate_with_plan(result, plan)
+    
+    def run_comparison(self, data_sizes=[1000, 10000, 50000], parallel=False, max_workers=None,
+                       distributions=None, seed=None):
+        """Run comparison for all algorithms on given data sizes
+        
+        distributions is a list of input distribution names (see
+        distributions.DISTRIBUTIONS) swept as a second axis; the default is
+        uniform only. Every cell records its distribution and seed. With
+        parallel=True every (algorithm, size) cell runs in its own worker
+        process pinned to one core, see parallel_runner.
+        """
         print("🚀 MEMULAI PERBANDINGAN ALGORITMA SORTING - TANPA SKIP")
         print("=" * 80)
         
+        distributions = distributions or [DEFAULT_DISTRIBUTION]
+        if seed is None:
+            seed = new_seed()
+        print(f"🎲 Distribusi: {', '.join(distributions)} | seed: {seed}")
+        
+        if parallel:
+            return self.run_comparison_parallel(data_sizes, max_workers, distributions, seed)
+        
         all_results = []
         
-        for size in data_sizes:
-            print(f"\n📊 MENGUJI DENGAN {size:,} DATA...")
+        for distribution, size in itertools.product(distributions, data_sizes):
+            print(f"\n📊 MENGUJI DENGAN {size:,} DATA ({distribution})...")
             print("-" * 60)
             
             # Generate test data once for consistent comparison
-            test_data = self.generate_test_data(size)
+            test_data = self.generate_test_data(size, distribution, seed)
             
-            algorithms = [
-                (self.selection_sort, "Selection Sort"),
-                (self.bubble_sort, "Bubble Sort"),
-                (self.quick_sort, "Quick Sort"),
-                (self.merge_sort, "Merge Sort"),
-                (self.heap_sort, "Heap Sort")
-            ]
+            algorithms = self.get_algorithms()
             
             size_results = []
             
             for algorithm, name in algorithms:
                 # TIDAK ADA SKIP - semua algoritma dijalankan
-                if size >= 10000 and name in ["Bubble Sort", "Selection Sort"]:
+                if sort_registry.exceeds_practical_limit(name, size):
                     print(f"   ⏳ {name} mungkin membutuhkan waktu lama...")
                 
-                result = self.test_algorithm(algorithm, test_data, name, size)
+                result = self.run_cell(algorithm, test_data, name, size)
+                result['distribution'] = distribution
+                result['seed'] = seed
                 size_results.append(result)
                 
                 if result['status'] == 'Completed':
                     print(f"   ✅ {name}: {result['time_ms']:>12,.1f} ms")
-                else:
+                elif result['status'] in ('Timed out', 'Cancelled'):
+                    print(f"   ⏱️  {name}: {result['status']} setelah {result['elapsed_ms']:,.0f} ms "
+                          f"({result['progress'] if result['progress'] is not None else '?'}% selesai)")
+                elif result['status'] == 'Skipped (not applicable)':
+                    print(f"   ⏭️  {name}: tidak berlaku ({result['reason']})")
+                elif result['status'] != 'Extrapolated':
                     print(f"   ❌ {name}: {result['status']}")
             
             all_results.extend(size_results)
-            self.display_size_summary(size_results, size)
+            self.display_size_summary(size_results, size, distribution)
+        
+        return all_results
+    
+    def run_comparison_parallel(self, data_sizes, max_workers=None, distributions=None, seed=None):
+        """Run every (algorithm, size) cell concurrently on a process pool"""
+        from parallel_runner import available_cores, run_cells_parallel
+        
+        workers = max_workers or len(available_cores())
+        print(f"\n⚙️  MODE PARALEL: {workers} worker, satu cell per core")
+        print("-" * 60)
+        
+        distributions = distributions or [DEFAULT_DISTRIBUTION]
+        algorithm_names = [name for _, name in self.get_algorithms()]
+        
+        def on_result(result):
+            label = f"{result['algorithm']} ({result['data_size']:,})"
+            if result['status'] == 'Completed':
+                print(f"   ✅ {label}: {result['time_ms']:>12,.1f} ms")
+            elif result['status'] in ('Timed out', 'Cancelled'):
+                print(f"   ⏱️  {label}: {result['status']} setelah {result['elapsed_ms']:,.0f} ms "
+                      f"({result['progress'] if result['progress'] is not None else '?'}% selesai)")
+            elif result['status'] == 'Skipped (not applicable)':
+                print(f"   ⏭️  {label}: tidak berlaku ({result['reason']})")
+            elif result['status'] == 'Extrapolated':
+                print(f"   📐 {label}: diperkirakan {result['predicted_ms']:,.0f} ms ({result['cost_model']}), "
+                      f"tidak dijalankan")
+            else:
+                print(f"   ❌ {label}: {result['status']}")
+        
+        comparator_options = {'timing_options': self.timing_options, 'profile_memory': self.profile_memory,
+                              'time_budget_s': self.scheduler.budget_s if self.scheduler else None,
+                              'timeout_s': self.timeout_s, 'hard_timeout': self.hard_timeout,
+                              'count_ops': self.count_ops, 'verify_sample': self.verify_sample}
+        all_results = []
+        for distribution in distributions:
+            test_data_by_size = {size: self.generate_test_data(size, distribution, seed) for size in data_sizes}
+            results = run_cells_parallel(test_data_by_size, algorithm_names, max_workers, on_result,
+                                         comparator_options)
+            for result in results:
+                result['distribution'] = distribution
+                result['seed'] = seed
+            all_results.extend(results)
+        
+        for (distribution, size), results in self.group_results(all_results).items():
+            self.display_size_summary(results, size, distribution)
         
         return all_results
     
-    def display_size_summary(self, results, data_size):
+    def display_size_summary(self, results, data_size, distribution=DEFAULT_DISTRIBUTION):
         """Display summary for a specific data size"""
-        print(f"\n📈 RINGKASAN {data_size:,} DATA:")
-        print("-" * 70)
-        print(f"{'ALGORITMA':<15} {'WAKTU (ms)':<15} {'STATUS':<15} {'HASIL':<10}")
-        print("-" * 70)
+        print(f"\n📈 RINGKASAN {data_size:,} DATA ({distribution}):")
+        memory_header = f" {'PEAK MEM':>12} {'RETAINED':>12} {'NET BLOCKS':>10}" if self.profile_memory else ""
+        if self.count_ops:
+            memory_header += f" {'CMP':>8} {'CMP/nlogn':>10} {'CMP/n²':>8} {'WRITES':>8} {'AUX-WR':>8} {'WR/nlogn':>10}"
+        print("-" * (90 + len(memory_header)))
+        print(f"{'ALGORITMA':<15} {'WAKTU (ms)':<15} {'CI 95%':<20} {'STATUS':<15} {'HASIL':<10}{memory_header}")
+        print("-" * (90 + len(memory_header)))
         
         for result in results:
             time_display = f"{result['time_ms']:,.1f} ms" if isinstance(result['time_ms'], (int, float)) else result['time_ms']
+            spread = format_spread(result.get('time_stats'))
             status = result['status']
-            result_icon = "✅" if result['is_correct'] else "❌"
+            result_icon = "✅" if result['is_correct'] else ("➖" if result['is_correct'] is None else "❌")
             
-            print(f"{result['algorithm']:<15} {str(time_display):<15} {status:<15} {result_icon:<10}")
+            memory_cols = ""
+            if self.profile_memory:
+                memory = result.get('memory')
+                if memory:
+                    memory_cols = (f" {format_bytes(memory['peak_bytes']):>12} {format_bytes(memory['retained_bytes']):>12}"
+                                   f" {memory['net_blocks']:>+10,}")
+                else:
+                    memory_cols = f" {'-':>12} {'-':>12} {'-':>10}"
+            if self.count_ops:
+                ops = result.get('ops') or {}
+                ratio = lambda key: f"{ops[key]:.3f}" if ops.get(key) is not None else "-"
+                memory_cols += (f" {format_count(ops.get('comparisons')):>8} {ratio('comparisons_per_n_log_n'):>10}"
+                                f" {ratio('comparisons_per_n2'):>8} {format_count(ops.get('writes')):>8}"
+                                f" {format_count(ops.get('buffer_writes')):>8} {ratio('writes_per_n_log_n'):>10}")
+            
+            print(f"{result['algorithm']:<15} {str(time_display):<15} {spread:<20} {status:<15} {result_icon:<10}{memory_cols}")
+        if self.count_ops:
+            print("WRITES = semua penulisan elemen, ke list input dan buffer bantu (swap = 2); AUX-WR = bagian "
+                  "yang ke buffer bantu; '-' untuk algoritma yang buffernya tidak terhitung (mis. built-in, integer)")
     
     def display_comparison_table(self, all_results):
         """Display final comparison table - TANPA SKIP"""
@@ -218,27 +331,21 @@ class FullSortingComparator:
         print("📊 TABEL PERBANDINGAN AKHIR - SEMUA ALGORITMA DIJALANKAN")
         print(f"{'='*100}")
         
-        # Organize results by data size
-        results_by_size = {}
-        for result in all_results:
-            size = result['data_size']
-            if size not in results_by_size:
-                results_by_size[size] = []
-            results_by_size[size].append(result)
+        # Organize results by distribution and data size
+        results_by_group = self.group_results(all_results)
         
         # Header
-        header = f"{'DATA SIZE':<12} {'Selection Sort':<18} {'Bubble Sort':<18} {'Quick Sort':<18} {'Merge Sort':<18} {'Heap Sort':<18}"
+        algorithm_names = [name for _, name in self.get_algorithms()]
+        header = f"{'DISTRIBUSI':<14} {'DATA SIZE':<12} " + "".join(f"{name:<19}" for name in algorithm_names)
         print(header)
-        print("-" * 102)
+        print("-" * len(header))
         
         # Data rows - semua algoritma ditampilkan
-        sizes = sorted(results_by_size.keys())
-        for size in sizes:
-            results = results_by_size[size]
-            times = {r['algorithm']: r['time_ms'] for r in results}
+        for (distribution, size), results in sorted(results_by_group.items(), key=lambda item: item[0][1]):
+            times = {r['algorithm']: display_time(r) for r in results}
             
-            row = f"{size:<12,} "
-            for algo in ["Selection Sort", "Bubble Sort", "Quick Sort", "Merge Sort", "Heap Sort"]:
+            row = f"{distribution:<14} {size:<12,} "
+            for algo in algorithm_names:
                 time_val = times.get(algo, 'N/A')
                 if isinstance(time_val, (int, float)):
                     if time_val < 1000:
@@ -255,18 +362,10 @@ class FullSortingComparator:
         print("🔍 ANALISIS PERFORMANCE DETAIL")
         print(f"{'='*80}")
         
-        results_by_size = {}
-        for result in all_results:
-            size = result['data_size']
-            if size not in results_by_size:
-                results_by_size[size] = []
-            results_by_size[size].append(result)
-        
-        for size in sorted(results_by_size.keys()):
-            print(f"\n📈 ANALISIS UNTUK {size:,} DATA:")
+        for (distribution, size), results in self.group_results(all_results).items():
+            print(f"\n📈 ANALISIS UNTUK {size:,} DATA ({distribution}):")
             print("-" * 60)
             
-            results = results_by_size[size]
             valid_results = [r for r in results if isinstance(r['time_ms'], (int, float))]
             
             if valid_results:
@@ -287,15 +386,7 @@ class FullSortingComparator:
                         print(f"   {result['algorithm']:<15}: {result['time_ms']:>10,.1f} ms ({ratio:>5.1f}x lebih lambat)")
             
             print("\n📚 KOMPLEKSITAS ALGORITMA:")
-            complexities = {
-                "Selection Sort": "O(n²) - Quadratic",
-                "Bubble Sort": "O(n²) - Quadratic", 
-                "Quick Sort": "O(n log n) - Linearithmic (average)",
-                "Merge Sort": "O(n log n) - Linearithmic", 
-                "Heap Sort": "O(n log n) - Linearithmic"
-            }
-            for algo, comp in complexities.items():
-                print(f"   {algo:<15}: {comp}")
+            sort_registry.print_complexity_table([r['algorithm'] for r in results])
     
     def save_results_to_file(self, all_results, filename="full_sorting_comparison.txt"):
         """Save results to a text file"""
@@ -304,26 +395,68 @@ class FullSortingComparator:
             f.write("=" * 60 + "\n")
             f.write(f"Tanggal Test: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
             
-            results_by_size = {}
-            for result in all_results:
-                size = result['data_size']
-                if size not in results_by_size:
-                    results_by_size[size] = []
-                results_by_size[size].append(result)
-            
-            for size in sorted(results_by_size.keys()):
-                f.write(f"\nDATA SIZE: {size:,}\n")
+            for (distribution, size), results in self.group_results(all_results).items():
+                f.write(f"\nDATA SIZE: {size:,} | DISTRIBUSI: {distribution} | SEED: {results[0].get('seed', '-')}\n")
                 f.write("-" * 50 + "\n")
-                for result in results_by_size[size]:
+                for result in results:
                     time_display = f"{result['time_ms']:,.1f} ms" if isinstance(result['time_ms'], (int, float)) else result['time_ms']
                     status_icon = "✓" if result['is_correct'] else "✗"
-                    f.write(f"{result['algorithm']:<15} : {time_display:<15} | {status_icon} {result['status']}\n")
+                    spread = format_spread(result.get('time_stats'))
+                    f.write(f"{result['algorithm']:<15} : {time_display:<15} {spread:<20} | {status_icon} {result['status']}\n")
+                    if 'memory' in result:
+                        f.write(f"{'':<15}   memori: {format_memory(result['memory'])}\n")
         
         print(f"\n💾 Hasil lengkap disimpan dalam file: {filename}")
+    
+    def save_results_to_db(self, all_results, db_path=DEFAULT_DB_PATH):
+        """Append results to the benchmark history database, returns the run ID"""
+        db = ResultsDB(db_path)
+        try:
+            run_id = db.record_run(all_results, source="nskip")
+        finally:
+            db.close()
+        print(f"🗄️  Hasil dicatat di {db_path} sebagai run #{run_id}")
+        return run_id
 
 def main():
     """Main function to run the full comparison"""
-    comparator = FullSortingComparator()
+    parser = argparse.ArgumentParser(description="Perbandingan lengkap algoritma sorting")
+    parser.add_argument('--parallel', action='store_true',
+                        help="jalankan setiap cell (algoritma x ukuran) di proses terpisah")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="jumlah worker paralel (default: jumlah core)")
+    parser.add_argument('--profile-memory', action='store_true',
+                        help="ukur peak memory, memori tersisa dan perubahan bersih jumlah blok setiap algoritma (tracemalloc)")
+    parser.add_argument('--count-ops', action='store_true',
+                        help="hitung perbandingan dan penulisan elemen (list input dan buffer bantu) setiap algoritma (independen dari hardware)")
+    parser.add_argument('--distributions', nargs='+', default=[DEFAULT_DISTRIBUTION],
+                        choices=list(DISTRIBUTIONS),
+                        help="distribusi input yang diuji (default: uniform)")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="seed untuk data uji (default: acak, dicetak di output)")
+    parser.add_argument('--verify-sample', type=int, default=None,
+                        help="cek urutan hasil hanya pada N pasangan acak (untuk n sangat besar)")
+    parser.add_argument('--dataset-dir', default=None,
+                        help="simpan data uji sebagai dataset biner di direktori ini dan pakai ulang di run berikutnya")
+    parser.add_argument('--budget', type=float, default=None,
+                        help="budget waktu per cell dalam detik; cell yang diprediksi lebih lama diekstrapolasi")
+    parser.add_argument('--timeout', type=float, default=None,
+                        help="batas waktu per cell dalam detik; cell yang melewatinya dihentikan")
+    parser.add_argument('--hard-timeout', action='store_true',
+                        help="jalankan setiap cell di subprocess yang di-kill saat --timeout habis")
+    parser.add_argument('--scaling', type=float, default=None, metavar='DETIK',
+                        help="setelah perbandingan, fit kurva skala tiap algoritma pada ukuran 2^8..2^22 "
+                             "dengan budget DETIK per algoritma (lihat scaling.py)")
+    parser.add_argument('--target-n', type=int, default=None,
+                        help="dengan --scaling: rekomendasikan algoritma untuk ukuran data ini")
+    parser.add_argument('--slo-ms', type=float, default=None,
+                        help="dengan --target-n: batas latensi (ms) yang harus dipenuhi")
+    args = parser.parse_args()
+    
+    comparator = FullSortingComparator(profile_memory=args.profile_memory, count_ops=args.count_ops,
+                                       time_budget_s=args.budget, dataset_dir=args.dataset_dir,
+                                       verify_sample=args.verify_sample,
+                                       timeout_s=args.timeout, hard_timeout=args.hard_timeout)
     
     # Data sizes to test
     data_sizes = [1000, 10000, 50000]
@@ -338,12 +471,22 @@ def main():
     print("   Silakan tunggu dengan sabar...\n")
     
     # Run comparison
-    all_results = comparator.run_comparison(data_sizes)
+    all_results = comparator.run_comparison(data_sizes, parallel=args.parallel, max_workers=args.workers,
+                                            distributions=args.distributions, seed=args.seed)
     
     # Display results
     comparator.display_comparison_table(all_results)
     comparator.display_performance_analysis(all_results)
     comparator.save_results_to_file(all_results)
+    comparator.save_results_to_db(all_results)
+    
+    if args.scaling:
+        from scaling import run_scaling_analysis
+        report = run_scaling_analysis(budget_s=args.scaling, distribution=args.distributions[0],
+                                      seed=args.seed or 0)
+        report.display()
+        if args.target_n:
+            report.display_recommendation(args.target_n, args.slo_ms)
     
     print(f"\n🎉 PERBANDINGAN LENGKAP SELESAI!")
     print(f"📅 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
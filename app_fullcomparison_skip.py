@@ -1,133 +1,119 @@
+import argparse
+import itertools
 import time
-import random
-import sys
 from datetime import datetime
 
-# Increase recursion limit for large datasets in Quick Sort
-sys.setrecursionlimit(100000)
+from binary_dataset import cached_dataset
+from budget import BudgetScheduler, annotate_with_plan, display_time, extrapolated_result, single_run_options
+from cancellation import CancellationToken, Cancelled, interrupted_result, run_in_subprocess
+from distributions import DEFAULT_DISTRIBUTION, DISTRIBUTIONS, generate_data, new_seed
+from memory_profile import format_bytes, format_memory, measure_memory
+from results_db import DEFAULT_DB_PATH, ResultsDB
+import sort_registry
+from timing import format_spread, limited_options, measure, round_stats
+from verification import fingerprint, verify_output
+
+# Budget waktu default per cell (detik); cell yang diprediksi jauh lebih lama diekstrapolasi
+DEFAULT_TIME_BUDGET_S = 10.0
+
 
 class SortingComparator:
-    def __init__(self):
+    def __init__(self, timing_options=None, profile_memory=False, time_budget_s=DEFAULT_TIME_BUDGET_S,
+                 timeout_s=None, hard_timeout=False, dataset_dir=None, verify_sample=None):
         self.results = []
+        # Kalau diset, data uji disimpan sebagai dataset biner di sini dan di-mmap ulang
+        # pada run berikutnya dengan distribusi, ukuran dan seed yang sama
+        self.dataset_dir = dataset_dir
+        # Verifikasi urutan disampling kalau n lebih besar dari ini (None = cek penuh)
+        self.verify_sample = verify_sample
+        # Cost model per cell menggantikan aturan skip yang di-hardcode (lihat budget.py)
+        self.scheduler = BudgetScheduler(time_budget_s) if time_budget_s else None
+        # Batas waktu per cell; dengan hard_timeout cell dijalankan di subprocess yang bisa di-kill
+        self.timeout_s = timeout_s
+        self.hard_timeout = hard_timeout
+        # Token pembatalan run yang sedang jalan, dicek di loop luar algoritma O(n²)
+        self.token = None
+        # Kalau True, setiap algoritma dijalankan sekali lagi di bawah tracemalloc
+        self.profile_memory = profile_memory
+        # Opsi untuk timing.measure (warmup, repetisi, target error, dll)
+        self.timing_options = timing_options or {}
     
-    # SELECTION SORT
-    def selection_sort(self, arr):
-        n = len(arr)
-        for i in range(n):
-            min_idx = i
-            for j in range(i + 1, n):
-                if arr[j] < arr[min_idx]:
-                    min_idx = j
-            arr[i], arr[min_idx] = arr[min_idx], arr[i]
-        return arr
-    
-    # BUBBLE SORT  
-    def bubble_sort(self, arr):
-        n = len(arr)
-        for i in range(n):
-            for j in range(0, n - i - 1):
-                if arr[j] > arr[j + 1]:
-                    arr[j], arr[j + 1] = arr[j + 1], arr[j]
-        return arr
+    def checkpoint(self, algorithm_name, i, n):
+        """Stop the running algorithm if it was cancelled or its deadline passed"""
+        if self.token is not None:
+            self.token.check(algorithm_name, (i / n) * 100)
     
-    # QUICK SORT
-    def quick_sort(self, arr):
-        if len(arr) <= 1:
-            return arr
-        pivot = arr[len(arr) // 2]
-        left = [x for x in arr if x < pivot]
-        middle = [x for x in arr if x == pivot]
-        right = [x for x in arr if x > pivot]
-        return self.quick_sort(left) + middle + self.quick_sort(right)
+    def get_algorithms(self):
+        """Return the (function, name) pairs benchmarked by run_comparison"""
+        return sort_registry.get_algorithms(checkpoint=self.checkpoint)
     
-    # MERGE SORT
-    def merge_sort(self, arr):
-        if len(arr) <= 1:
-            return arr
-        
-        mid = len(arr) // 2
-        left = arr[:mid]
-        right = arr[mid:]
-        
-        left = self.merge_sort(left)
-        right = self.merge_sort(right)
-        
-        return self.merge(left, right)
+    def generate_test_data(self, size, distribution=DEFAULT_DISTRIBUTION, seed=None):
+        """Generate test data from the given input distribution (or reload it from dataset_dir)"""
+        if self.dataset_dir:
+            return cached_dataset(self.dataset_dir, distribution, size, seed)
+        return generate_data(distribution, size, seed)
     
-    def merge(self, left, right):
-        result = []
-        i = j = 0
-        
-        while i < len(left) and j < len(right):
-            if left[i] <= right[j]:
-                result.append(left[i])
-                i += 1
-            else:
-                result.append(right[j])
-                j += 1
-        
-        result.extend(left[i:])
-        result.extend(right[j:])
-        return result
-    
-    # HEAP SORT
-    def heap_sort(self, arr):
-        def heapify(arr, n, i):
-            largest = i
-            left = 2 * i + 1
-            right = 2 * i + 2
-            
-            if left < n and arr[left] > arr[largest]:
-                largest = left
-                
-            if right < n and arr[right] > arr[largest]:
-                largest = right
-                
-            if largest != i:
-                arr[i], arr[largest] = arr[largest], arr[i]
-                heapify(arr, n, largest)
-        
-        n = len(arr)
-        
-        # Build max heap
-        for i in range(n // 2 - 1, -1, -1):
-            heapify(arr, n, i)
-        
-        # Extract elements from heap
-        for i in range(n - 1, 0, -1):
-            arr[i], arr[0] = arr[0], arr[i]
-            heapify(arr, i, 0)
-        
-        return arr
-    
-    def generate_test_data(self, size):
-        """Generate random test data"""
-        return [random.randint(1, 1000000) for _ in range(size)]
+    def group_results(self, all_results):
+        """Group results by (distribution, data size), in run order"""
+        groups = {}
+        for result in all_results:
+            key = (result.get('distribution', DEFAULT_DISTRIBUTION), result['data_size'])
+            groups.setdefault(key, []).append(result)
+        return groups
     
-    def verify_sorted(self, arr):
-        """Verify if array is correctly sorted"""
-        return all(arr[i] <= arr[i + 1] for i in range(len(arr) - 1))
+    def verify_sorted(self, arr, data):
+        """Verify that arr is sorted and a permutation of data (outside the timed region)"""
+        return verify_output(arr, fingerprint(data), self.verify_sample)
     
-    def test_algorithm(self, algorithm, data, algorithm_name, data_size):
-        """Test a single algorithm and return results"""
-        test_data = data.copy()
+    def test_algorithm(self, algorithm, data, algorithm_name, data_size, deadline_s=None):
+        """Test a single algorithm and return results
         
+        With deadline_s the algorithm runs once. Each run is bounded by the
+        earlier of deadline_s and self.timeout_s, cooperatively at
+        checkpoints or, with hard_timeout, by killing its subprocess, and
+        repetitions stop once that much time has been spent. Samples from
+        runs that finished are kept.
+        """
+        start = time.perf_counter()
+        limits = [t for t in (deadline_s, self.timeout_s) if t]
         try:
-            start_time = time.time()
-            sorted_data = algorithm(test_data)
-            end_time = time.time()
-            
-            execution_time = (end_time - start_time) * 1000  # Convert to milliseconds
-            is_correct = self.verify_sorted(sorted_data)
+            # Warmup + pengulangan adaptif, waktu yang dilaporkan adalah median
+            timing_options = single_run_options(self.timing_options) if deadline_s else self.timing_options
+            limit = min(limits) if limits else None
+            if limit is not None:
+                timing_options = limited_options(timing_options, limit)
+            self.token = CancellationToken(limit)
+            try:
+                if self.hard_timeout and limit is not None:
+                    # Total waktu: budget pengulangan + satu run terakhir, masing-masing <= limit
+                    stats, sorted_data = run_in_subprocess(2 * limit, self.token, algorithm_name, measure,
+                                                           algorithm, data, before_run=self.token.restart,
+                                                           **timing_options)
+                else:
+                    stats, sorted_data = measure(algorithm, data, before_run=self.token.restart,
+                                                 **timing_options)
+            finally:
+                self.token = None
+            execution_time = stats['median_ms']
+            verification = self.verify_sorted(sorted_data, data)
             
-            return {
+            result = {
                 'algorithm': algorithm_name,
                 'time_ms': round(execution_time, 2),
+                'time_stats': round_stats(stats),
                 'data_size': data_size,
-                'is_correct': is_correct,
+                'is_correct': verification['is_correct'],
+                'verification': verification,
                 'status': 'Completed'
             }
             
+            if self.profile_memory:
+                result['memory'] = measure_memory(algorithm, data)
+            
+            return result
+            
+        except Cancelled as e:
+            return interrupted_result(algorithm_name, data_size, e, (time.perf_counter() - start) * 1000)
         except Exception as e:
             return {
                 'algorithm': algorithm_name,
@@ -137,71 +123,106 @@ class SortingComparator:
                 'status': f'Error: {str(e)}'
             }
     
-    def run_comparison(self, data_sizes=[1000, 10000, 50000]):
-        """Run comparison for all algorithms on given data sizes"""
+    def run_cell(self, algorithm, data, algorithm_name, data_size):
+        """Run one cell, through the time-budget scheduler when one is configured
+        
+        Cells the algorithm does not apply to (e.g. counting sort on a wide
+        key range) are skipped. Without a scheduler the registry's
+        practical n limit decides which other cells are skipped.
+        """
+        reason = sort_registry.not_applicable_reason(algorithm_name, data)
+        if reason is not None:
+            return sort_registry.skipped_result(algorithm_name, data_size, reason)
+        if self.scheduler is None:
+            if sort_registry.exceeds_practical_limit(algorithm_name, data_size):
+                return sort_registry.skipped_result(algorithm_name, data_size)
+            return self.test_algorithm(algorithm, data, algorithm_name, data_size)
+        
+        plan = self.scheduler.plan(algorithm, data)
+        if plan['action'] == 'extrapolate':
+            return extrapolated_result(algorithm_name, data_size, plan)
+        
+        result = self.test_algorithm(algorithm, data, algorithm_name, data_size, plan['deadline_s'])
+        return annotate_with_plan(result, plan)
+    
+    def run_comparison(self, data_sizes=[1000, 10000, 50000], distributions=None, seed=None):
+        """Run comparison for all algorithms on given data sizes
+        
+        distributions is a list of input distribution names swept as a
+        second axis (default: uniform only).
+        """
         print("🚀 MEMULAI PERBANDINGAN ALGORITMA SORTING")
         print("=" * 80)
         
+        distributions = distributions or [DEFAULT_DISTRIBUTION]
+        if seed is None:
+            seed = new_seed()
+        print(f"🎲 Distribusi: {', '.join(distributions)} | seed: {seed}")
+        
         all_results = []
         
-        for size in data_sizes:
-            print(f"\n📊 MENGUJI DENGAN {size:,} DATA...")
+        for distribution, size in itertools.product(distributions, data_sizes):
+            print(f"\n📊 MENGUJI DENGAN {size:,} DATA ({distribution})...")
             print("-" * 60)
             
             # Generate test data once for consistent comparison
-            test_data = self.generate_test_data(size)
+            test_data = self.generate_test_data(size, distribution, seed)
             
-            algorithms = [
-                (self.selection_sort, "Selection Sort"),
-                (self.bubble_sort, "Bubble Sort"),
-                (self.quick_sort, "Quick Sort"),
-                (self.merge_sort, "Merge Sort"),
-                (self.heap_sort, "Heap Sort")
-            ]
+            algorithms = self.get_algorithms()
             
             size_results = []
             
             for algorithm, name in algorithms:
-                # Skip slow algorithms for large datasets
-                if size >= 10000 and name in ["Bubble Sort", "Selection Sort"]:
-                    result = {
-                        'algorithm': name,
-                        'time_ms': 'Skipped',
-                        'data_size': size,
-                        'is_correct': True,
-                        'status': 'Skipped (too slow)'
-                    }
-                    size_results.append(result)
-                    print(f"⏭️  {name}: Skipped (terlalu lambat untuk data besar)")
-                    continue
-                
+                # Algoritma yang diprediksi melebihi budget tidak dijalankan, waktunya diekstrapolasi
                 print(f"🔄 Menjalankan {name}...")
-                result = self.test_algorithm(algorithm, test_data, name, size)
+                result = self.run_cell(algorithm, test_data, name, size)
+                result['distribution'] = distribution
+                result['seed'] = seed
                 size_results.append(result)
                 
                 if result['status'] == 'Completed':
                     print(f"✅ {name}: {result['time_ms']:>8} ms")
+                elif result['status'] == 'Extrapolated':
+                    print(f"⏭️  {name}: diperkirakan {result['predicted_ms']:,.0f} ms ({result['cost_model']}), tidak dijalankan")
+                elif result['status'] == 'Skipped (too slow)':
+                    print(f"⏭️  {name}: Skipped (terlalu lambat untuk data besar)")
+                elif result['status'] == 'Skipped (not applicable)':
+                    print(f"⏭️  {name}: Skipped (tidak berlaku: {result['reason']})")
+                elif result['status'] == 'Timed out':
+                    print(f"⏱️  {name}: dihentikan setelah {result['elapsed_ms']:,.0f} ms "
+                          f"({result['progress'] if result['progress'] is not None else '?'}% selesai)")
                 else:
                     print(f"❌ {name}: {result['status']}")
             
             all_results.extend(size_results)
-            self.display_size_summary(size_results, size)
+            self.display_size_summary(size_results, size, distribution)
         
         return all_results
     
-    def display_size_summary(self, results, data_size):
+    def display_size_summary(self, results, data_size, distribution=DEFAULT_DISTRIBUTION):
         """Display summary for a specific data size"""
-        print(f"\n📈 RINGKASAN {data_size:,} DATA:")
-        print("-" * 70)
-        print(f"{'ALGORITMA':<15} {'WAKTU (ms)':<12} {'STATUS':<20} {'HASIL':<10}")
-        print("-" * 70)
+        print(f"\n📈 RINGKASAN {data_size:,} DATA ({distribution}):")
+        memory_header = f" {'PEAK MEM':>12} {'RETAINED':>12} {'NET BLOCKS':>10}" if self.profile_memory else ""
+        print("-" * (90 + len(memory_header)))
+        print(f"{'ALGORITMA':<15} {'WAKTU (ms)':<12} {'CI 95%':<20} {'STATUS':<20} {'HASIL':<10}{memory_header}")
+        print("-" * (90 + len(memory_header)))
         
         for result in results:
             time_display = f"{result['time_ms']:,}" if isinstance(result['time_ms'], (int, float)) else result['time_ms']
             status = result['status']
-            result_icon = "✅" if result['is_correct'] else "❌"
+            result_icon = "✅" if result['is_correct'] else ("➖" if result['is_correct'] is None else "❌")
+            
+            spread = format_spread(result.get('time_stats'))
+            memory_cols = ""
+            if self.profile_memory:
+                memory = result.get('memory')
+                if memory:
+                    memory_cols = (f" {format_bytes(memory['peak_bytes']):>12} {format_bytes(memory['retained_bytes']):>12}"
+                                   f" {memory['net_blocks']:>+10,}")
+                else:
+                    memory_cols = f" {'-':>12} {'-':>12} {'-':>10}"
             
-            print(f"{result['algorithm']:<15} {str(time_display):<12} {status:<20} {result_icon:<10}")
+            print(f"{result['algorithm']:<15} {str(time_display):<12} {spread:<20} {status:<20} {result_icon:<10}{memory_cols}")
     
     def display_comparison_table(self, all_results):
         """Display final comparison table"""
@@ -209,27 +230,21 @@ class SortingComparator:
         print("📊 TABEL PERBANDINGAN AKHIR")
         print(f"{'='*80}")
         
-        # Organize results by data size
-        results_by_size = {}
-        for result in all_results:
-            size = result['data_size']
-            if size not in results_by_size:
-                results_by_size[size] = []
-            results_by_size[size].append(result)
+        # Organize results by distribution and data size
+        results_by_group = self.group_results(all_results)
         
         # Header
-        header = f"{'DATA SIZE':<12} {'Selection Sort':<15} {'Bubble Sort':<15} {'Quick Sort':<15} {'Merge Sort':<15} {'Heap Sort':<15}"
+        algorithm_names = [name for _, name in self.get_algorithms()]
+        header = f"{'DISTRIBUSI':<14} {'DATA SIZE':<12} " + "".join(f"{name:<16}" for name in algorithm_names)
         print(header)
-        print("-" * 87)
+        print("-" * len(header))
         
         # Data rows
-        sizes = sorted(results_by_size.keys())
-        for size in sizes:
-            results = results_by_size[size]
-            times = {r['algorithm']: r['time_ms'] for r in results}
+        for (distribution, size), results in sorted(results_by_group.items(), key=lambda item: item[0][1]):
+            times = {r['algorithm']: display_time(r) for r in results}
             
-            row = f"{size:<12,} "
-            for algo in ["Selection Sort", "Bubble Sort", "Quick Sort", "Merge Sort", "Heap Sort"]:
+            row = f"{distribution:<14} {size:<12,} "
+            for algo in algorithm_names:
                 time_val = times.get(algo, 'N/A')
                 if isinstance(time_val, (int, float)):
                     row += f"{time_val:>13,.1f} ms "
@@ -243,18 +258,10 @@ class SortingComparator:
         print("🔍 ANALISIS PERFORMANCE")
         print(f"{'='*80}")
         
-        results_by_size = {}
-        for result in all_results:
-            size = result['data_size']
-            if size not in results_by_size:
-                results_by_size[size] = []
-            results_by_size[size].append(result)
-        
-        for size in sorted(results_by_size.keys()):
-            print(f"\n📈 ANALISIS UNTUK {size:,} DATA:")
+        for (distribution, size), results in self.group_results(all_results).items():
+            print(f"\n📈 ANALISIS UNTUK {size:,} DATA ({distribution}):")
             print("-" * 50)
             
-            results = results_by_size[size]
             valid_results = [r for r in results if isinstance(r['time_ms'], (int, float))]
             
             if valid_results:
@@ -270,11 +277,7 @@ class SortingComparator:
             
             # Complexity analysis
             print("\n📚 KOMPLEKSITAS ALGORITMA:")
-            print("Selection Sort: O(n²) - Quadratic")
-            print("Bubble Sort:    O(n²) - Quadratic") 
-            print("Quick Sort:     O(n log n) - Linearithmic (average case)")
-            print("Merge Sort:     O(n log n) - Linearithmic")
-            print("Heap Sort:      O(n log n) - Linearithmic")
+            sort_registry.print_complexity_table([r['algorithm'] for r in results])
     
     def save_results_to_file(self, all_results, filename="sorting_comparison_results.txt"):
         """Save results to a text file"""
@@ -283,25 +286,53 @@ class SortingComparator:
             f.write("=" * 50 + "\n")
             f.write(f"Tanggal Test: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
             
-            results_by_size = {}
-            for result in all_results:
-                size = result['data_size']
-                if size not in results_by_size:
-                    results_by_size[size] = []
-                results_by_size[size].append(result)
-            
-            for size in sorted(results_by_size.keys()):
-                f.write(f"\nDATA SIZE: {size:,}\n")
+            for (distribution, size), results in self.group_results(all_results).items():
+                f.write(f"\nDATA SIZE: {size:,} | DISTRIBUSI: {distribution} | SEED: {results[0].get('seed', '-')}\n")
                 f.write("-" * 40 + "\n")
-                for result in results_by_size[size]:
+                for result in results:
                     time_display = f"{result['time_ms']:,} ms" if isinstance(result['time_ms'], (int, float)) else result['time_ms']
-                    f.write(f"{result['algorithm']:<15} : {time_display:<15} | {result['status']}\n")
+                    spread = format_spread(result.get('time_stats'))
+                    f.write(f"{result['algorithm']:<15} : {time_display:<15} {spread:<20} | {result['status']}\n")
+                    if 'memory' in result:
+                        f.write(f"{'':<15}   memori: {format_memory(result['memory'])}\n")
         
         print(f"\n💾 Hasil disimpan dalam file: {filename}")
+    
+    def save_results_to_db(self, all_results, db_path=DEFAULT_DB_PATH):
+        """Append results to the benchmark history database, returns the run ID"""
+        db = ResultsDB(db_path)
+        try:
+            run_id = db.record_run(all_results, source="skip")
+        finally:
+            db.close()
+        print(f"🗄️  Hasil dicatat di {db_path} sebagai run #{run_id}")
+        return run_id
 
 def main():
     """Main function to run the comparison"""
-    comparator = SortingComparator()
+    parser = argparse.ArgumentParser(description="Perbandingan algoritma sorting")
+    parser.add_argument('--profile-memory', action='store_true',
+                        help="ukur peak memory, memori tersisa dan perubahan bersih jumlah blok setiap algoritma (tracemalloc)")
+    parser.add_argument('--distributions', nargs='+', default=[DEFAULT_DISTRIBUTION],
+                        choices=list(DISTRIBUTIONS),
+                        help="distribusi input yang diuji (default: uniform)")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="seed untuk data uji (default: acak, dicetak di output)")
+    parser.add_argument('--verify-sample', type=int, default=None,
+                        help="cek urutan hasil hanya pada N pasangan acak (untuk n sangat besar)")
+    parser.add_argument('--dataset-dir', default=None,
+                        help="simpan data uji sebagai dataset biner di direktori ini dan pakai ulang di run berikutnya")
+    parser.add_argument('--budget', type=float, default=DEFAULT_TIME_BUDGET_S,
+                        help="budget waktu per cell dalam detik (default: %(default)s); 0 = skip sesuai batas n praktis di sort_registry")
+    parser.add_argument('--timeout', type=float, default=None,
+                        help="batas waktu per cell dalam detik; cell yang melewatinya dihentikan")
+    parser.add_argument('--hard-timeout', action='store_true',
+                        help="jalankan setiap cell di subprocess yang di-kill saat --timeout habis")
+    args = parser.parse_args()
+    
+    comparator = SortingComparator(profile_memory=args.profile_memory, time_budget_s=args.budget,
+                                   dataset_dir=args.dataset_dir, verify_sample=args.verify_sample,
+                                   timeout_s=args.timeout, hard_timeout=args.hard_timeout)
     
     # Data sizes to test
     data_sizes = [1000, 10000, 50000]
@@ -311,12 +342,13 @@ def main():
     print("=" * 80)
     
     # Run comparison
-    all_results = comparator.run_comparison(data_sizes)
+    all_results = comparator.run_comparison(data_sizes, distributions=args.distributions, seed=args.seed)
     
     # Display results
     comparator.display_comparison_table(all_results)
     comparator.display_performance_analysis(all_results)
     comparator.save_results_to_file(all_results)
+    comparator.save_results_to_db(all_results)
     
     print(f"\n🎉 PERBANDINGAN SELESAI!")
     print(f"📅 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -0,0 +1,141 @@
+# Lima algoritma dasar - satu implementasi yang dipakai app.py dan kedua
+# comparator, supaya angka dari web UI dan CLI bisa dibandingkan.
+#
+# Algoritma O(n²) menerima hook opsional checkpoint(nama, i, n) yang dipanggil
+# di loop luar setiap CHECKPOINT_INTERVAL iterasi; comparator memakainya untuk
+# progress dan pembatalan kooperatif.
+#
+# Algoritma yang memakai list bantu (Quick Sort, Merge Sort) membuatnya lewat
+# hook opsional new_buffer(values); op_counter memakainya untuk menghitung
+# penulisan ke buffer bantu, bukan hanya ke list input.
+
+CHECKPOINT_INTERVAL = 100
+
+
+def list_buffer(values=()):
+    """Default new_buffer hook: the list holding values (a list is used as is, not copied)"""
+    return values if type(values) is list else list(values)
+
+
+def selection_sort(arr, checkpoint=None):
+    """Selection Sort implementation"""
+    n = len(arr)
+    for i in range(n):
+        if checkpoint is not None and i % CHECKPOINT_INTERVAL == 0:
+            checkpoint("Selection Sort", i, n)
+        min_idx = i
+        for j in range(i + 1, n):
+            if arr[j] < arr[min_idx]:
+                min_idx = j
+        arr[i], arr[min_idx] = arr[min_idx], arr[i]
+    return arr
+
+
+def bubble_sort(arr, checkpoint=None):
+    """Bubble Sort with early exit once a pass makes no swap"""
+    n = len(arr)
+    for i in range(n):
+        if checkpoint is not None and i % CHECKPOINT_INTERVAL == 0:
+            checkpoint("Bubble Sort", i, n)
+        swapped = False
+        for j in range(0, n - i - 1):
+            if arr[j] > arr[j + 1]:
+                arr[j], arr[j + 1] = arr[j + 1], arr[j]
+                swapped = True
+        # Jika tidak ada swap, array sudah sorted
+        if not swapped:
+            break
+    return arr
+
+
+def quick_sort(arr, new_buffer=list_buffer):
+    """Quick Sort implementation (explicit stack, no recursion)"""
+    # Partisi kiri diproses dulu, lalu elemen pivot, lalu partisi kanan
+    result = new_buffer()
+    stack = [(False, arr)]
+    while stack:
+        done, part = stack.pop()
+        if done or len(part) <= 1:
+            result.extend(part)
+            continue
+        pivot = part[len(part) // 2]
+        left = new_buffer([x for x in part if x < pivot])
+        middle = new_buffer([x for x in part if x == pivot])
+        right = new_buffer([x for x in part if x > pivot])
+        stack.append((False, right))
+        stack.append((True, middle))
+        stack.append((False, left))
+    return result
+
+
+def merge(src, dst, lo, mid, hi):
+    """Merge the sorted ranges src[lo:mid] and src[mid:hi] into dst[lo:hi]"""
+    i, j, k = lo, mid, lo
+    while i < mid and j < hi:
+        if src[i] <= src[j]:
+            dst[k] = src[i]
+            i += 1
+        else:
+            dst[k] = src[j]
+            j += 1
+        k += 1
+    dst[k:hi] = src[i:mid] if i < mid else src[j:hi]
+
+
+def merge_sort(arr, new_buffer=list_buffer):
+    """Merge Sort implementation (bottom-up, no recursion)"""
+    # Gabungkan run selebar width berpasangan (1, 2, 4, ...) bolak-balik antara
+    # dua list berukuran n - tanpa list kecil per elemen
+    n = len(arr)
+    if n <= 1:
+        return arr
+
+    src = new_buffer(list(arr))
+    dst = new_buffer([None] * n)
+    width = 1
+    while width < n:
+        for lo in range(0, n - width, 2 * width):
+            merge(src, dst, lo, lo + width, min(lo + 2 * width, n))
+        # Run terakhir tanpa pasangan disalin apa adanya
+        tail = ((n - 1) // (2 * width)) * 2 * width
+        if tail + width >= n:
+            dst[tail:n] = src[tail:n]
+        src, dst = dst, src
+        width *= 2
+
+    return src
+
+
+def heapify(arr, n, i):
+    """Iterative sift-down of arr[i] within the max-heap arr[:n]"""
+    while True:
+        largest = i
+        left = 2 * i + 1
+        right = 2 * i + 2
+
+        if left < n and arr[left] > arr[largest]:
+            largest = left
+
+        if right < n and arr[right] > arr[largest]:
+            largest = right
+
+        if largest == i:
+            break
+        arr[i], arr[largest] = arr[largest], arr[i]
+        i = largest
+
+
+def heap_sort(arr):
+    """Heap Sort implementation"""
+    n = len(arr)
+
+    # Build max heap
+    for i in range(n // 2 - 1, -1, -1):
+        heapify(arr, n, i)
+
+    # Extract elements from heap one by one
+    for i in range(n - 1, 0, -1):
+        arr[0], arr[i] = arr[i], arr[0]
+        heapify(arr, i, 0)
+
+    return arr
@@ -0,0 +1,205 @@
+import argparse
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from csv_ingest import DEFAULT_COLUMN, iter_column
+from distributions import DEFAULT_DISTRIBUTION, DISTRIBUTIONS, GENERATOR_VERSION, generate_data
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Format dataset biner: header 64 byte lalu int64 little-endian mentah.
+#   magic (8) | dtype (4) | length (u64) | seed (i64, -1 = tidak ada) | distribution (32, utf-8)
+# Data bisa di-mmap langsung tanpa parsing, jadi input yang sama bisa
+# dipakai ulang antar run, worker dan mesin.
+
+MAGIC = b'SORTDS01'
+DTYPE = b'i8'
+HEADER_FORMAT = '<8s4sQq32s'
+HEADER_SIZE = 64
+NO_SEED = -1
+EXTENSION = '.sortds'
+
+
+class DatasetFormatError(ValueError):
+    """Raised when a file is not a valid binary dataset"""
+
+
+def pack_header(length, seed=None, distribution=None):
+    header = struct.pack(HEADER_FORMAT, MAGIC, DTYPE, length, NO_SEED if seed is None else seed,
+                         (distribution or '').encode('utf-8')[:32])
+    return header.ljust(HEADER_SIZE, b'\0')
+
+
+def read_header(f):
+    """Parse the header from an open binary file; returns the metadata dict"""
+    raw = f.read(HEADER_SIZE)
+    if len(raw) < HEADER_SIZE:
+        raise DatasetFormatError("File too short for a dataset header")
+    magic, dtype, length, seed, distribution = struct.unpack_from(HEADER_FORMAT, raw)
+    if magic != MAGIC:
+        raise DatasetFormatError("Not a binary dataset (bad magic)")
+    if dtype.rstrip(b'\0') != DTYPE:
+        raise DatasetFormatError(f"Unsupported dtype {dtype!r}")
+    return {
+        'dtype': 'int64',
+        'length': length,
+        'seed': None if seed == NO_SEED else seed,
+        'distribution': distribution.rstrip(b'\0').decode('utf-8') or None,
+    }
+
+
+def write_dataset(path, values, seed=None, distribution=None):
+    """Write values as a binary dataset; returns the number of values written"""
+    data = values if isinstance(values, array) and values.typecode == 'q' else array('q', values)
+    if sys.byteorder == 'big':
+        data = array('q', data)
+        data.byteswap()
+    with open(path, 'wb') as f:
+        f.write(pack_header(len(data), seed, distribution))
+        data.tofile(f)
+    return len(data)
+
+
+class MappedDataset:
+    """A dataset file mapped read-only into memory
+
+    values is a zero-copy memoryview of int64 over the mapping (on
+    little-endian hosts; big-endian hosts get a byteswapped copy). Use
+    as a context manager, or call close() once the views are released.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self.meta = read_header(self._file)
+            size = HEADER_SIZE + self.meta['length'] * 8
+            if os.fstat(self._file.fileno()).st_size < size:
+                raise DatasetFormatError("File is shorter than the length in its header")
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.meta['length'] else None
+        except Exception:
+            self._file.close()
+            raise
+        if self._mmap is None:
+            self.values = memoryview(array('q'))
+        elif sys.byteorder == 'little':
+            self.values = memoryview(self._mmap)[HEADER_SIZE:size].cast('q')
+        else:
+            copy = array('q', self._mmap[HEADER_SIZE:size])
+            copy.byteswap()
+            self.values = memoryview(copy)
+
+    def __len__(self):
+        return self.meta['length']
+
+    def numpy(self):
+        """np.memmap view of the values (requires NumPy)"""
+        if np is None:
+            raise RuntimeError("NumPy is not installed")
+        return np.memmap(self.path, dtype='<i8', mode='r', offset=HEADER_SIZE, shape=(self.meta['length'],))
+
+    def tolist(self):
+        return self.values.tolist()
+
+    def close(self):
+        self.values.release()
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def load_dataset(path):
+    """Read a dataset into a list plus its metadata (mmap, then one C-level copy)"""
+    with MappedDataset(path) as dataset:
+        return dataset.tolist(), dict(dataset.meta)
+
+
+def cache_path(directory, distribution, size, seed):
+    return os.path.join(directory, f"{distribution}_{size}_{seed}_g{GENERATOR_VERSION}{EXTENSION}")
+
+
+def cached_dataset(directory, distribution, size, seed):
+    """Generated test data, stored in directory on first use and reloaded afterwards"""
+    path = cache_path(directory, distribution, size, seed)
+    if os.path.exists(path):
+        return load_dataset(path)[0]
+    data = generate_data(distribution, size, seed)
+    os.makedirs(directory, exist_ok=True)
+    write_dataset(path, data, seed, distribution)
+    return data
+
+
+def csv_to_dataset(csv_path, out_path, column=None):
+    """Convert one numeric column of a CSV (e.g. Data/*.csv) into a binary dataset"""
+    with open(csv_path, 'rb') as f:
+        values = array('q', iter_column(f, column))
+    name = f"csv:{column or DEFAULT_COLUMN}"
+    return write_dataset(out_path, values, distribution=name)
+
+
+def dataset_to_csv(path, csv_path, column='value'):
+    """Write a binary dataset back out as a one-column CSV"""
+    with MappedDataset(path) as dataset, open(csv_path, 'w', encoding='utf-8') as out:
+        out.write(f"{column}\n")
+        for value in dataset.values:
+            out.write(f"{value}\n")
+    return len(dataset)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Dataset biner (int64) untuk input benchmark")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    from_csv = sub.add_parser('from-csv', help="konversi satu kolom CSV ke dataset biner")
+    from_csv.add_argument('csv')
+    from_csv.add_argument('output')
+    from_csv.add_argument('--column', default=None, help=f"kolom numerik (default: {DEFAULT_COLUMN})")
+
+    generate = sub.add_parser('generate', help="buat dataset dari distribusi dengan seed")
+    generate.add_argument('output')
+    generate.add_argument('--size', type=int, required=True)
+    generate.add_argument('--distribution', choices=list(DISTRIBUTIONS), default=DEFAULT_DISTRIBUTION)
+    generate.add_argument('--seed', type=int, default=0)
+
+    info = sub.add_parser('info', help="tampilkan header dataset")
+    info.add_argument('path')
+
+    to_csv = sub.add_parser('to-csv', help="tulis dataset sebagai CSV satu kolom")
+    to_csv.add_argument('path')
+    to_csv.add_argument('output')
+
+    args = parser.parse_args(argv)
+    if args.command == 'from-csv':
+        count = csv_to_dataset(args.csv, args.output, args.column)
+        print(f"✅ {count:,} nilai ditulis ke {args.output}")
+    elif args.command == 'generate':
+        count = write_dataset(args.output, generate_data(args.distribution, args.size, args.seed),
+                              args.seed, args.distribution)
+        print(f"✅ {count:,} nilai ({args.distribution}, seed {args.seed}) ditulis ke {args.output}")
+    elif args.command == 'info':
+        with MappedDataset(args.path) as dataset:
+            meta = dataset.meta
+            preview = dataset.values[:10].tolist()
+        print(f"{args.path}: {meta['length']:,} x {meta['dtype']} | distribusi: {meta['distribution']} "
+              f"| seed: {meta['seed']}")
+        print(f"   sampel: {preview}")
+    elif args.command == 'to-csv':
+        count = dataset_to_csv(args.path, args.output)
+        print(f"✅ {count:,} nilai ditulis ke {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+import math
+
+from timing import measure
+
+# Model kompleksitas empiris: waktu ≈ a · f(n)
+COST_MODELS = {
+    'n': lambda n: n,
+    'n log n': lambda n: n * math.log2(max(n, 2)),
+    'n²': lambda n: n * n,
+}
+
+DEFAULT_PROBE_SIZE = 500
+# Prefix yang diukur: probe_size · faktor. Tiga titik, supaya model dipilih dari
+# tren, bukan dari satu rasio yang bisa meleset karena noise
+PROBE_FACTORS = (1, 2, 4)
+PROBE_OPTIONS = {'warmup': 1, 'max_repeats': 5, 'max_time_s': 0.5}
+
+
+def fit_cost_model(probe_times):
+    """Pick the model whose coefficient is most stable across probe sizes
+
+    probe_times maps n -> measured milliseconds (at least three sizes).
+    Returns (model_name, coefficient a) so that time_ms ≈ a · f(n).
+    """
+    best = None
+    for name, f in COST_MODELS.items():
+        coefficients = [t / f(n) for n, t in probe_times.items() if t > 0]
+        if len(coefficients) < len(probe_times):
+            continue
+        spread = abs(math.log(max(coefficients) / min(coefficients)))
+        if best is None or spread < best[0]:
+            best = (spread, name, sum(coefficients) / len(coefficients))
+    if best is None:
+        return 'n', 0.0
+    return best[1], best[2]
+
+
+def predict_ms(model, coefficient, n):
+    return coefficient * COST_MODELS[model](n)
+
+
+class BudgetScheduler:
+    """Decide per (algorithm, n) whether to run, run with a deadline, or extrapolate
+
+    The algorithm is timed on prefixes of the input at probe_size,
+    2·probe_size and 4·probe_size, a cost model is fitted, and the time at the target n is
+    predicted. Up to budget_s it simply runs; up to budget_s·hard_factor it
+    runs with a cooperative deadline at that limit; beyond that the cell
+    is not run and the prediction is reported instead.
+    """
+
+    def __init__(self, budget_s, probe_size=DEFAULT_PROBE_SIZE, hard_factor=4.0):
+        self.budget_s = budget_s
+        self.probe_size = probe_size
+        self.hard_factor = hard_factor
+
+    def probe_sizes(self):
+        return [self.probe_size * factor for factor in PROBE_FACTORS]
+
+    def probe(self, algorithm, data):
+        probe_times = {}
+        for n in self.probe_sizes():
+            stats, _ = measure(algorithm, data[:n], **PROBE_OPTIONS)
+            probe_times[n] = stats['median_ms']
+        return probe_times
+
+    def plan(self, algorithm, data):
+        """Return {'action', 'model', 'predicted_ms', 'deadline_s'} for this cell"""
+        n = len(data)
+        if n <= self.probe_sizes()[-1]:
+            return {'action': 'run', 'model': None, 'predicted_ms': None, 'deadline_s': None}
+
+        try:
+            probe_times = self.probe(algorithm, data)
+        except ValueError:
+            # Algoritma menolak prefix kecil (mis. counting sort: rentang kunci terlalu lebar
+            # untuk n sekecil itu) - tanpa prediksi, cell dijalankan biasa
+            return {'action': 'run', 'model': None, 'predicted_ms': None, 'deadline_s': None}
+        model, coefficient = fit_cost_model(probe_times)
+        predicted = predict_ms(model, coefficient, n)
+        budget_ms = self.budget_s * 1000
+        if predicted <= budget_ms:
+            action, deadline = 'run', None
+        elif predicted <= budget_ms * self.hard_factor:
+            action, deadline = 'run_with_deadline', self.budget_s * self.hard_factor
+        else:
+            action, deadline = 'extrapolate', None
+        return {'action': action, 'model': model, 'predicted_ms': predicted, 'deadline_s': deadline}
+
+
+def extrapolated_result(algorithm_name, data_size, plan):
+    """Result dict for a cell that was predicted instead of measured"""
+    return {
+        'algorithm': algorithm_name,
+        'time_ms': 'Extrapolated',
+        'predicted_ms': round(plan['predicted_ms'], 2),
+        'cost_model': plan['model'],
+        'data_size': data_size,
+        'is_correct': None,
+        'status': 'Extrapolated',
+        'mode': 'extrapolated',
+    }
+
+
+def single_run_options(timing_options):
+    """Timing options for a run under a deadline: no warmup, one repetition"""
+    return dict(timing_options, warmup=0, max_repeats=1)
+
+
+def annotate_with_plan(result, plan):
+    """Attach the scheduler's prediction to a measured or timed-out result"""
+    if 'mode' not in result:
+        result['mode'] = 'measured' if result['status'] == 'Completed' else 'error'
+    if plan['predicted_ms'] is not None:
+        result['predicted_ms'] = round(plan['predicted_ms'], 2)
+        result['cost_model'] = plan['model']
+    return result
+
+
+def display_time(result):
+    """Value for comparison tables: measured ms, '~N ms' for extrapolated cells, else the label"""
+    if result.get('mode') == 'extrapolated':
+        return f"~{result['predicted_ms']:,.0f} ms"
+    return result['time_ms']
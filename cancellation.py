@@ -0,0 +1,152 @@
+import multiprocessing
+import sys
+import threading
+import time
+
+# Waktu tambahan sebelum child di-kill, supaya algoritma dengan checkpoint sempat
+# berhenti sendiri dan melaporkan progress-nya
+HARD_TIMEOUT_GRACE_S = 0.25
+
+# Fork tidak ada di Windows dan tidak aman di macOS untuk proses yang punya thread
+# (server Flask, job worker); di sana run_in_subprocess berjalan di proses ini
+FORK_AVAILABLE = sys.platform != 'darwin' and 'fork' in multiprocessing.get_all_start_methods()
+
+
+class Cancelled(Exception):
+    """Raised when a running algorithm is stopped before it finished
+
+    progress is the percentage completed at the last checkpoint, or None
+    when it is unknown (the run was killed from outside).
+    """
+
+    status = 'Cancelled'
+    mode = 'cancelled'
+    verb = 'dibatalkan'
+
+    def __init__(self, algorithm_name, progress=None):
+        self.algorithm_name = algorithm_name
+        self.progress = progress
+        where = f" pada {progress:.1f}%" if progress is not None else ""
+        super().__init__(f"{algorithm_name} {self.verb}{where}")
+
+    def __reduce__(self):
+        # Supaya bisa dikirim balik dari child process lewat pipe
+        return (self.__class__, (self.algorithm_name, self.progress))
+
+
+class DeadlineExceeded(Cancelled):
+    """Raised at a checkpoint once the cooperative deadline has passed"""
+
+    status = 'Timed out'
+    mode = 'timed_out'
+    verb = 'melewati batas waktu'
+
+
+class HardTimeout(DeadlineExceeded):
+    """The subprocess running the algorithm was killed at its hard timeout"""
+
+
+class CancellationToken:
+    """Thread-safe flag plus optional deadline, checked at algorithm checkpoints
+
+    A token created with a parent is also cancelled when the parent is,
+    e.g. a per-run deadline token under a job's cancel token.
+    """
+
+    def __init__(self, timeout_s=None, parent=None):
+        self._event = threading.Event()
+        self.timeout_s = timeout_s
+        self.deadline = None
+        self.parent = parent
+        self.restart()
+
+    def restart(self):
+        """Start a fresh deadline of timeout_s from now, e.g. before each timed run"""
+        self.deadline = None if self.timeout_s is None else time.perf_counter() + self.timeout_s
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set() or (self.parent is not None and self.parent.cancelled)
+
+    def expired(self):
+        if self.parent is not None and self.parent.expired():
+            return True
+        return self.deadline is not None and time.perf_counter() > self.deadline
+
+    def check(self, algorithm_name, progress=None):
+        """Raise Cancelled / DeadlineExceeded if the run should stop now"""
+        if self.cancelled:
+            raise Cancelled(algorithm_name, progress)
+        if self.expired():
+            raise DeadlineExceeded(algorithm_name, progress)
+
+
+def interrupted_result(algorithm_name, data_size, error, elapsed_ms):
+    """Result dict for a cell stopped by cancellation or a timeout"""
+    return {
+        'algorithm': algorithm_name,
+        'time_ms': error.status,
+        'elapsed_ms': round(elapsed_ms, 2),
+        'progress': round(error.progress, 1) if error.progress is not None else None,
+        'data_size': data_size,
+        'is_correct': None,
+        'status': error.status,
+        'mode': error.mode,
+    }
+
+
+def _child(conn, func, args, kwargs):
+    try:
+        conn.send((True, func(*args, **kwargs)))
+    except Cancelled as e:
+        conn.send((False, e))
+    except BaseException as e:
+        conn.send((False, repr(e)))
+    finally:
+        conn.close()
+
+
+def run_in_subprocess(timeout_s, token, algorithm_name, func, *args, **kwargs):
+    """Run func(*args, **kwargs) in a killable child process and return its result
+
+    The child is terminated after timeout_s (+ HARD_TIMEOUT_GRACE_S)
+    seconds (HardTimeout) or as soon as token is cancelled (Cancelled). This bounds the run time even
+    for algorithms without checkpoints. The fork start method is used so
+    that bound methods and closures need not be picklable; only the
+    return value travels back through the pipe. Progress callbacks fire
+    in the child and are not seen by the caller.
+
+    Where fork is unavailable or unsafe (FORK_AVAILABLE is False) func runs
+    in this process instead: token still stops algorithms with checkpoints,
+    but nothing bounds the others.
+    """
+    if not FORK_AVAILABLE:
+        return func(*args, **kwargs)
+    ctx = multiprocessing.get_context('fork')
+    parent_conn, child_conn = ctx.Pipe(duplex=False)
+    process = ctx.Process(target=_child, args=(child_conn, func, args, kwargs), daemon=True)
+    deadline = None if timeout_s is None else time.perf_counter() + timeout_s + HARD_TIMEOUT_GRACE_S
+    process.start()
+    child_conn.close()
+    try:
+        while not parent_conn.poll(0.05):
+            if token is not None and token.cancelled:
+                raise Cancelled(algorithm_name)
+            if deadline is not None and time.perf_counter() > deadline:
+                raise HardTimeout(algorithm_name)
+            if not process.is_alive() and not parent_conn.poll():
+                raise RuntimeError(f"Proses {algorithm_name} berhenti dengan exit code {process.exitcode}")
+        ok, value = parent_conn.recv()
+    finally:
+        if process.is_alive():
+            process.kill()
+        process.join()
+        parent_conn.close()
+    if not ok:
+        if isinstance(value, Cancelled):
+            raise value
+        raise RuntimeError(value)
+    return value
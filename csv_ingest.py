@@ -0,0 +1,86 @@
+import codecs
+import csv
+from array import array
+
+# Kolom numerik pada file Data/data_*.csv beserta skala fixed-point-nya.
+# Nilai uang (salary, price, total_amount) disimpan dalam satuan sen (x100)
+# supaya tetap bisa masuk ke buffer integer tanpa kehilangan presisi.
+NUMERIC_COLUMNS = {
+    'id': 1,
+    'age': 1,
+    'quantity': 1,
+    'salary': 100,
+    'price': 100,
+    'total_amount': 100,
+}
+
+DEFAULT_COLUMN = 'total_amount'
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+class ColumnNotFoundError(ValueError):
+    """Raised when the requested column is not present in the CSV header"""
+
+    def __init__(self, column, available):
+        self.column = column
+        self.available = available
+        super().__init__(f"Column '{column}' not found. Available columns: {', '.join(available)}")
+
+
+def iter_lines(stream, chunk_size=DEFAULT_CHUNK_SIZE, encoding='utf-8'):
+    """Yield decoded text lines from a binary stream, reading it in chunks"""
+    decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+    pending = ''
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        text = pending + decoder.decode(chunk)
+        lines = text.splitlines(keepends=True)
+        # Baris terakhir mungkin belum lengkap, simpan untuk chunk berikutnya
+        pending = lines.pop() if lines and not lines[-1].endswith(('\n', '\r')) else ''
+        yield from lines
+    pending += decoder.decode(b'', final=True)
+    if pending:
+        yield pending
+
+
+def parse_value(text, scale=1):
+    """Parse a numeric CSV cell into an int using the column's fixed-point scale"""
+    if scale == 1:
+        return int(float(text))
+    return int(round(float(text) * scale))
+
+
+def iter_column(stream, column=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield the numeric values of one column, streaming the CSV from a binary stream
+
+    When column is None the default column is used if the header has it,
+    otherwise the first column. Rows with a missing or non-numeric value
+    are skipped.
+    """
+    reader = csv.reader(iter_lines(stream, chunk_size))
+    header = next(reader, None)
+    if header is None:
+        return
+    header = [name.strip() for name in header]
+
+    if column is None:
+        column = DEFAULT_COLUMN if DEFAULT_COLUMN in header else header[0]
+    if column not in header:
+        raise ColumnNotFoundError(column, header)
+
+    index = header.index(column)
+    scale = NUMERIC_COLUMNS.get(column, 1)
+    for row in reader:
+        if len(row) <= index:
+            continue
+        try:
+            yield parse_value(row[index], scale)
+        except ValueError:
+            continue
+
+
+def load_column(stream, column=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Read one numeric column into an array('q') in a single streaming pass"""
+    return array('q', iter_column(stream, column, chunk_size))
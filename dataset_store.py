@@ -0,0 +1,100 @@
+import threading
+import uuid
+from array import array
+from collections import OrderedDict
+
+# NumPy opsional - kalau tidak ada, pakai array('q') bawaan Python
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def to_typed_array(values):
+    """Convert a sequence of ints into a compact typed buffer"""
+    if isinstance(values, array) and values.typecode == 'q':
+        return np.frombuffer(values, dtype=np.int64) if np is not None else values
+    if np is not None:
+        return np.asarray(values, dtype=np.int64)
+    return array('q', values)
+
+
+def buffer_nbytes(buf):
+    """Return the number of bytes held by a typed buffer"""
+    if np is not None and isinstance(buf, np.ndarray):
+        return int(buf.nbytes)
+    return len(buf) * buf.itemsize
+
+
+class DatasetTooLargeError(ValueError):
+    """Raised when a dataset is larger than the store's max_bytes"""
+
+    def __init__(self, nbytes, max_bytes):
+        self.nbytes = nbytes
+        self.max_bytes = max_bytes
+        super().__init__(f'Dataset terlalu besar ({nbytes:,} bytes, batas {max_bytes:,} bytes)')
+
+
+class DatasetStore:
+    """Thread-safe LRU store for uploaded datasets, referenced by ID"""
+
+    def __init__(self, max_datasets=8, max_bytes=256 * 1024 * 1024):
+        self.max_datasets = max_datasets
+        self.max_bytes = max_bytes
+        self._datasets = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def add(self, values, name=None):
+        """Store values as a typed array and return the new dataset ID"""
+        buf = to_typed_array(values)
+        nbytes = buffer_nbytes(buf)
+        if nbytes > self.max_bytes:
+            raise DatasetTooLargeError(nbytes, self.max_bytes)
+
+        dataset_id = uuid.uuid4().hex
+        with self._lock:
+            self._datasets[dataset_id] = {'data': buf, 'name': name, 'nbytes': nbytes}
+            self._total_bytes += nbytes
+            self._evict()
+        return dataset_id
+
+    def get(self, dataset_id):
+        """Return the typed array for dataset_id, or None if unknown/evicted"""
+        with self._lock:
+            entry = self._datasets.get(dataset_id)
+            if entry is None:
+                return None
+            self._datasets.move_to_end(dataset_id)
+            return entry['data']
+
+    def info(self, dataset_id):
+        """Return metadata (name, size, bytes) for dataset_id"""
+        with self._lock:
+            entry = self._datasets.get(dataset_id)
+            if entry is None:
+                return None
+            return {
+                'dataset_id': dataset_id,
+                'name': entry['name'],
+                'data_size': len(entry['data']),
+                'nbytes': entry['nbytes'],
+            }
+
+    def remove(self, dataset_id):
+        with self._lock:
+            entry = self._datasets.pop(dataset_id, None)
+            if entry is not None:
+                self._total_bytes -= entry['nbytes']
+            return entry is not None
+
+    def __len__(self):
+        with self._lock:
+            return len(self._datasets)
+
+    def _evict(self):
+        # Buang dataset yang paling lama tidak dipakai sampai di bawah batas
+        while self._datasets and (len(self._datasets) > self.max_datasets
+                                  or self._total_bytes > self.max_bytes):
+            _, entry = self._datasets.popitem(last=False)
+            self._total_bytes -= entry['nbytes']
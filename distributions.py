@@ -0,0 +1,112 @@
+import bisect
+import itertools
+import random
+
+# Semua generator menerima (size, rng, low, high) dan mengembalikan list int.
+# Dengan seed yang sama hasilnya selalu sama, jadi input bisa direplay - semua
+# memakai random.Random, terpasang NumPy atau tidak, jadi hasilnya sama di mesin mana pun.
+
+DEFAULT_LOW = 1
+DEFAULT_HIGH = 1000000
+
+# Naikkan kalau data untuk seed yang sama berubah, supaya cache dataset lama tidak dipakai
+GENERATOR_VERSION = 2
+
+
+def _uniform_values(size, rng, low, high):
+    return [rng.randint(low, high) for _ in range(size)]
+
+
+def sorted_data(size, rng, low=DEFAULT_LOW, high=DEFAULT_HIGH):
+    """Already sorted, like the id column of Data/*.csv"""
+    return sorted(_uniform_values(size, rng, low, high))
+
+
+def reversed_data(size, rng, low=DEFAULT_LOW, high=DEFAULT_HIGH):
+    """Sorted in descending order"""
+    return sorted(_uniform_values(size, rng, low, high), reverse=True)
+
+
+def nearly_sorted(size, rng, low=DEFAULT_LOW, high=DEFAULT_HIGH, swaps=None):
+    """Sorted data with k random pairs swapped (default k = 1% of n)"""
+    data = sorted_data(size, rng, low, high)
+    if size < 2:
+        return data
+    if swaps is None:
+        swaps = max(1, size // 100)
+    for _ in range(swaps):
+        i = rng.randrange(size)
+        j = rng.randrange(size)
+        data[i], data[j] = data[j], data[i]
+    return data
+
+
+def few_unique(size, rng, low=DEFAULT_LOW, high=DEFAULT_HIGH, unique=10):
+    """Only a handful of distinct values, heavily duplicated"""
+    values = [rng.randint(low, high) for _ in range(unique)]
+    return [rng.choice(values) for _ in range(size)]
+
+
+def sawtooth(size, rng, low=DEFAULT_LOW, high=DEFAULT_HIGH, teeth=10):
+    """Several ascending runs one after another"""
+    period = max(1, size // teeth)
+    step = max(1, (high - low) // period)
+    return [low + (i % period) * step for i in range(size)]
+
+
+def organ_pipe(size, rng, low=DEFAULT_LOW, high=DEFAULT_HIGH):
+    """Ascending to the middle, then descending"""
+    half = (size + 1) // 2
+    rising = sorted(_uniform_values(half, rng, low, high))
+    falling = sorted(_uniform_values(size - half, rng, low, high), reverse=True)
+    return rising + falling
+
+
+def gaussian(size, rng, low=DEFAULT_LOW, high=DEFAULT_HIGH):
+    """Normally distributed around the middle of the range, clamped to [low, high]"""
+    mu = (low + high) / 2
+    sigma = (high - low) / 8
+    return [min(high, max(low, int(rng.gauss(mu, sigma)))) for _ in range(size)]
+
+
+def zipf(size, rng, low=DEFAULT_LOW, high=DEFAULT_HIGH, exponent=1.2, distinct=1000):
+    """Zipf-distributed values: a few values dominate, like repeated prices"""
+    values = _uniform_values(distinct, rng, low, high)
+    cum_weights = list(itertools.accumulate(1 / (rank ** exponent) for rank in range(1, distinct + 1)))
+    total = cum_weights[-1]
+    return [values[bisect.bisect_left(cum_weights, rng.random() * total)] for _ in range(size)]
+
+
+def uniform(size, rng, low=DEFAULT_LOW, high=DEFAULT_HIGH):
+    """Uniform random ints, the original benchmark input"""
+    return _uniform_values(size, rng, low, high)
+
+
+DISTRIBUTIONS = {
+    'uniform': uniform,
+    'sorted': sorted_data,
+    'reversed': reversed_data,
+    'nearly_sorted': nearly_sorted,
+    'few_unique': few_unique,
+    'sawtooth': sawtooth,
+    'organ_pipe': organ_pipe,
+    'gaussian': gaussian,
+    'zipf': zipf,
+}
+
+DEFAULT_DISTRIBUTION = 'uniform'
+
+
+def new_seed():
+    """Pick a fresh seed so an unseeded run can still be replayed later"""
+    return random.SystemRandom().randrange(2 ** 32)
+
+
+def generate_data(distribution, size, seed=None, low=DEFAULT_LOW, high=DEFAULT_HIGH):
+    """Generate size values from the named distribution with a reproducible seed"""
+    try:
+        generator = DISTRIBUTIONS[distribution]
+    except KeyError:
+        raise ValueError(f"Unknown distribution '{distribution}'. "
+                         f"Available: {', '.join(DISTRIBUTIONS)}") from None
+    return generator(size, random.Random(seed), low, high)
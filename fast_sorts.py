@@ -0,0 +1,185 @@
+# Varian "production" dari quick sort dan merge sort.
+# Berbeda dengan versi edukasi di comparator, keduanya tidak membuat
+# list baru di setiap level rekursi.
+
+from basic_sorts import list_buffer
+
+INSERTION_CUTOFF = 16
+NINTHER_THRESHOLD = 128
+
+
+def insertion_sort_range(arr, lo, hi):
+    """Sort arr[lo:hi + 1] in place with insertion sort"""
+    for i in range(lo + 1, hi + 1):
+        value = arr[i]
+        j = i - 1
+        while j >= lo and arr[j] > value:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = value
+
+
+def _median_of_three(arr, a, b, c):
+    x, y, z = arr[a], arr[b], arr[c]
+    if x < y:
+        if y < z:
+            return b
+        return c if x < z else a
+    if x < z:
+        return a
+    return c if y < z else b
+
+
+def choose_pivot(arr, lo, hi):
+    """Median-of-three for small ranges, Tukey's ninther for large ones"""
+    mid = (lo + hi) // 2
+    if hi - lo < NINTHER_THRESHOLD:
+        return arr[_median_of_three(arr, lo, mid, hi)]
+    step = (hi - lo) // 8
+    return arr[_median_of_three(
+        arr,
+        _median_of_three(arr, lo, lo + step, lo + 2 * step),
+        _median_of_three(arr, mid - step, mid, mid + step),
+        _median_of_three(arr, hi - 2 * step, hi - step, hi),
+    )]
+
+
+def hoare_partition(arr, lo, hi, pivot):
+    """Partition arr[lo:hi + 1] around pivot; returns j with arr[lo..j] <= pivot <= arr[j+1..hi]"""
+    i = lo - 1
+    j = hi + 1
+    while True:
+        i += 1
+        while arr[i] < pivot:
+            i += 1
+        j -= 1
+        while arr[j] > pivot:
+            j -= 1
+        if i >= j:
+            return j
+        arr[i], arr[j] = arr[j], arr[i]
+
+
+def quick_sort_inplace(arr):
+    """In-place quick sort: Hoare partition, ninther pivot, insertion-sort cutoff
+
+    Uses an explicit stack instead of recursion. The larger partition is
+    pushed and the loop continues on the smaller one, so the stack never
+    holds more than O(log n) ranges.
+    """
+    stack = [(0, len(arr) - 1)]
+    while stack:
+        lo, hi = stack.pop()
+        while hi - lo >= INSERTION_CUTOFF:
+            p = hoare_partition(arr, lo, hi, choose_pivot(arr, lo, hi))
+            if p - lo < hi - p:
+                stack.append((p + 1, hi))
+                hi = p
+            else:
+                stack.append((lo, p))
+                lo = p + 1
+        insertion_sort_range(arr, lo, hi)
+    return arr
+
+
+def merge_sort_bottomup(arr, new_buffer=list_buffer):
+    """Iterative bottom-up merge sort with one preallocated auxiliary buffer
+
+    Runs of INSERTION_CUTOFF elements are insertion-sorted first, then
+    merged pass by pass, alternating the roles of arr and the buffer.
+    """
+    n = len(arr)
+    if n <= 1:
+        return arr
+
+    for lo in range(0, n, INSERTION_CUTOFF):
+        insertion_sort_range(arr, lo, min(lo + INSERTION_CUTOFF, n) - 1)
+
+    src = arr
+    dst = new_buffer([0] * n)
+    width = INSERTION_CUTOFF
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            i, j, k = lo, mid, lo
+            while i < mid and j < hi:
+                if src[i] <= src[j]:
+                    dst[k] = src[i]
+                    i += 1
+                else:
+                    dst[k] = src[j]
+                    j += 1
+                k += 1
+            while i < mid:
+                dst[k] = src[i]
+                i += 1
+                k += 1
+            while j < hi:
+                dst[k] = src[j]
+                j += 1
+                k += 1
+        src, dst = dst, src
+        width *= 2
+
+    # Hasil akhir ada di buffer bantu - salin balik ke arr
+    if src is not arr:
+        arr[:] = src
+    return arr
+
+
+def _sift_down(arr, lo, start, end):
+    """Sift arr[lo + start] down within the heap arr[lo:lo + end]"""
+    root = start
+    while True:
+        child = 2 * root + 1
+        if child >= end:
+            return
+        if child + 1 < end and arr[lo + child] < arr[lo + child + 1]:
+            child += 1
+        if arr[lo + root] < arr[lo + child]:
+            arr[lo + root], arr[lo + child] = arr[lo + child], arr[lo + root]
+            root = child
+        else:
+            return
+
+
+def heap_sort_range(arr, lo, hi):
+    """Sort arr[lo:hi + 1] in place with heap sort (same sift-down as the comparator's heap_sort)"""
+    n = hi - lo + 1
+    for i in range(n // 2 - 1, -1, -1):
+        _sift_down(arr, lo, i, n)
+    for end in range(n - 1, 0, -1):
+        arr[lo], arr[lo + end] = arr[lo + end], arr[lo]
+        _sift_down(arr, lo, 0, end)
+
+
+def introsort(arr):
+    """Introsort: in-place quick sort that falls back to heap sort on deep partitions
+
+    Each range carries a depth budget of 2·log2(n). A range that uses it
+    up (adversarial pivots) is finished with heap sort, so the worst case
+    stays O(n log n). Small ranges are left to insertion sort, as in
+    quick_sort_inplace.
+    """
+    n = len(arr)
+    if n <= 1:
+        return arr
+    stack = [(0, n - 1, 2 * n.bit_length())]
+    while stack:
+        lo, hi, depth = stack.pop()
+        while hi - lo >= INSERTION_CUTOFF:
+            if depth == 0:
+                heap_sort_range(arr, lo, hi)
+                break
+            depth -= 1
+            p = hoare_partition(arr, lo, hi, choose_pivot(arr, lo, hi))
+            if p - lo < hi - p:
+                stack.append((p + 1, hi, depth))
+                hi = p
+            else:
+                stack.append((lo, p, depth))
+                lo = p + 1
+        else:
+            insertion_sort_range(arr, lo, hi)
+    return arr
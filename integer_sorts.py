@@ -0,0 +1,164 @@
+from array import array
+
+from fast_sorts import insertion_sort_range
+
+# Sort non-perbandingan untuk data integer terbatas: semua data uji ada di
+# [1, 1_000_000] dan kolom CSV berupa integer / nilai uang fixed-point.
+# Semua fungsi mengurutkan arr in place dan mengembalikannya.
+
+RADIX_BITS = 8
+RADIX_MASK = (1 << RADIX_BITS) - 1
+
+# Counting sort dipilih kalau rentang kunci <= faktor ini × n (atau <= batas minimum)
+COUNTING_RANGE_FACTOR = 8
+COUNTING_MIN_RANGE = 1 << 16
+
+
+class KeyRangeTooWide(ValueError):
+    """Raised by counting_sort when the key range would need a count table far larger than the data"""
+
+    def __init__(self, n, lo, hi):
+        self.n = n
+        self.lo = lo
+        self.hi = hi
+        super().__init__(f"key range {hi - lo + 1:,} too wide for counting sort on {n:,} values "
+                         f"(limit {counting_range_limit(n):,})")
+
+
+def counting_range_limit(n):
+    """Largest key range counting sort accepts for n values"""
+    return max(COUNTING_MIN_RANGE, COUNTING_RANGE_FACTOR * n)
+
+
+def key_range(arr):
+    """(min, max) of arr in one pass"""
+    it = iter(arr)
+    lo = hi = next(it)
+    for value in it:
+        if value < lo:
+            lo = value
+        elif value > hi:
+            hi = value
+    return lo, hi
+
+
+def counting_sort(arr, bounds=None):
+    """Counting sort, O(n + k) for a key range of k values
+
+    bounds is an optional known (min, max); otherwise it is scanned.
+    Best for small ranges such as the age or quantity columns. A range
+    above counting_range_limit(n) would need a count table far larger
+    than the data (MemoryError for e.g. money columns), so such input is
+    refused with KeyRangeTooWide; integer_sort picks radix for it.
+    """
+    if len(arr) <= 1:
+        return arr
+    lo, hi = bounds or key_range(arr)
+    if hi - lo + 1 > counting_range_limit(len(arr)):
+        raise KeyRangeTooWide(len(arr), lo, hi)
+    counts = [0] * (hi - lo + 1)
+    for value in arr:
+        counts[value - lo] += 1
+    k = 0
+    for offset, count in enumerate(counts):
+        if count:
+            value = lo + offset
+            for k in range(k, k + count):
+                arr[k] = value
+            k += 1
+    return arr
+
+
+def radix_sort_lsd(arr, bounds=None):
+    """Byte-wise LSD radix sort over array('q') buffers
+
+    Keys are shifted by the minimum so negative values work, then sorted
+    by RADIX_BITS-bit digits from the least significant up, one stable
+    counting pass per digit. The number of passes depends only on the key
+    range (3 for [1, 1_000_000]).
+    """
+    n = len(arr)
+    if n <= 1:
+        return arr
+    lo, hi = bounds or key_range(arr)
+    src = array('q', (value - lo for value in arr))
+    dst = array('q', bytes(8 * n))
+    shift = 0
+    while (hi - lo) >> shift:
+        counts = [0] * (RADIX_MASK + 1)
+        for key in src:
+            counts[(key >> shift) & RADIX_MASK] += 1
+        total = 0
+        for digit, count in enumerate(counts):
+            counts[digit] = total
+            total += count
+        for key in src:
+            digit = (key >> shift) & RADIX_MASK
+            dst[counts[digit]] = key
+            counts[digit] += 1
+        src, dst = dst, src
+        shift += RADIX_BITS
+    for i, key in enumerate(src):
+        arr[i] = key + lo
+    return arr
+
+
+def bucket_sort(arr, bounds=None, bucket_count=None):
+    """Bucket sort: spread over n equal-width buckets, insertion-sort each
+
+    Linear on average for roughly uniform keys; skewed data only makes
+    some buckets larger.
+    """
+    n = len(arr)
+    if n <= 1:
+        return arr
+    lo, hi = bounds or key_range(arr)
+    bucket_count = bucket_count or n
+    width = (hi - lo) // bucket_count + 1
+    buckets = [[] for _ in range(bucket_count)]
+    for value in arr:
+        buckets[(value - lo) // width].append(value)
+    k = 0
+    for bucket in buckets:
+        if len(bucket) > 1:
+            insertion_sort_range(bucket, 0, len(bucket) - 1)
+        for value in bucket:
+            arr[k] = value
+            k += 1
+    return arr
+
+
+def choose_integer_sort(n, lo, hi):
+    """Name of the integer sort to use for n keys in [lo, hi]"""
+    if hi - lo + 1 <= counting_range_limit(n):
+        return 'counting'
+    return 'radix'
+
+
+def counting_skip_reason(data):
+    """Why counting_sort does not apply to data (key range too wide), or None"""
+    if len(data) <= 1:
+        return None
+    lo, hi = key_range(data)
+    if hi - lo + 1 <= counting_range_limit(len(data)):
+        return None
+    return str(KeyRangeTooWide(len(data), lo, hi))
+
+
+INTEGER_SORTS = {
+    'counting': counting_sort,
+    'radix': radix_sort_lsd,
+    'bucket': bucket_sort,
+}
+
+
+def integer_sort(arr, bounds=None):
+    """Sort integers with the non-comparison sort that fits the key range
+
+    bounds can be passed when the range is known in advance (e.g. a CSV
+    column); otherwise it is taken from the data.
+    """
+    if len(arr) <= 1:
+        return arr
+    lo, hi = bounds or key_range(arr)
+    return INTEGER_SORTS[choose_integer_sort(len(arr), lo, hi)](arr, (lo, hi))
@@ -0,0 +1,220 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from app_fullcomparison_nskip import FullSortingComparator
+from cancellation import CancellationToken
+from result_cache import cache_key, cacheable_result, dataset_fingerprint
+import sort_registry
+
+FINISHED_STATUSES = ('completed', 'failed', 'cancelled')
+
+# Budget waktu per cell job (detik): cell yang diprediksi lebih lama diekstrapolasi,
+# sama seperti default comparator skip (lihat budget.py)
+JOB_TIME_BUDGET_S = 10.0
+
+
+class BenchmarkJob:
+    """State of one submitted benchmark: status, per-algorithm progress and partial results"""
+
+    def __init__(self, test_data_by_size, algorithm_names, profile_memory=False, tags=None, timeout_s=None):
+        self.job_id = uuid.uuid4().hex
+        self.test_data_by_size = test_data_by_size
+        self.algorithm_names = algorithm_names
+        self.profile_memory = profile_memory
+        self.tags = tags or {}
+        self.timeout_s = timeout_s
+        self.token = CancellationToken()
+        self.status = 'queued'
+        self.current_algorithm = None
+        self.progress = {}
+        self.results = []
+        self.error = None
+        self.created_at = time.time()
+        self.finished_at = None
+        self.total_cells = len(test_data_by_size) * len(algorithm_names)
+        self._lock = threading.Lock()
+        # Log event untuk stream SSE; pembaca menunggu event baru lewat _changed
+        self.events = []
+        self._changed = threading.Condition(self._lock)
+
+    @property
+    def finished(self):
+        return self.status in FINISHED_STATUSES
+
+    def _emit(self, event, data):
+        # Dipanggil dengan _lock dipegang
+        self.events.append((len(self.events) + 1, event, data))
+        self._changed.notify_all()
+
+    def mark_running(self):
+        with self._lock:
+            self.status = 'running'
+            self._emit('status', {'status': self.status, 'total_cells': self.total_cells})
+
+    def update_progress(self, algorithm_name, progress):
+        with self._lock:
+            self.progress[algorithm_name] = round(progress, 1)
+            self._emit('progress', {'algorithm': algorithm_name, 'progress': self.progress[algorithm_name]})
+
+    def start_cell(self, algorithm_name, data_size=None):
+        with self._lock:
+            self.current_algorithm = algorithm_name
+            self.progress[algorithm_name] = 0.0
+            self._emit('start', {'algorithm': algorithm_name, 'data_size': data_size,
+                                 'cell': len(self.results) + 1, 'total_cells': self.total_cells})
+
+    def add_result(self, result):
+        result.update(self.tags)
+        with self._lock:
+            self.results.append(result)
+            self.progress[result['algorithm']] = 100.0
+            self.current_algorithm = None
+            self._emit('done', {'result': result, 'completed_cells': len(self.results),
+                                'total_cells': self.total_cells})
+
+    def cancel(self):
+        """Ask the job to stop; the running cell stops at its next checkpoint"""
+        self.token.cancel()
+        with self._lock:
+            if self.status in ('queued', 'running'):
+                self.status = 'cancelling'
+                self._emit('status', {'status': self.status, 'total_cells': self.total_cells})
+
+    def finish(self, status, error=None):
+        with self._lock:
+            self.status = status
+            self.error = error
+            self.current_algorithm = None
+            self.finished_at = time.time()
+            # Data uji tidak dibutuhkan lagi; job selesai tetap disimpan sampai tergusur
+            self.test_data_by_size = None
+            self._emit('end', {'status': status, 'error': error, 'completed_cells': len(self.results),
+                               'total_cells': self.total_cells})
+
+    def wait_events(self, after_id, timeout):
+        """Events with an ID above after_id, waiting up to timeout seconds for new ones
+
+        Returns an empty list on timeout; once the job has finished and
+        every event was read it returns immediately.
+        """
+        with self._changed:
+            self._changed.wait_for(lambda: len(self.events) > after_id or self.finished, timeout)
+            return self.events[after_id:]
+
+    def snapshot(self):
+        """Return a JSON-serializable view of the job"""
+        with self._lock:
+            return {
+                'job_id': self.job_id,
+                'status': self.status,
+                'current_algorithm': self.current_algorithm,
+                'progress': dict(self.progress),
+                'results': list(self.results),
+                'completed_cells': len(self.results),
+                'total_cells': self.total_cells,
+                'error': self.error,
+                'created_at': datetime.fromtimestamp(self.created_at).strftime('%Y-%m-%d %H:%M:%S'),
+            }
+
+
+class JobManager:
+    """Runs benchmark jobs on a background worker, one job at a time
+
+    Jobs are serialized on purpose: worker threads share the GIL, so two
+    jobs running at once would inflate each other's timings (and slow
+    down the web UI). Further jobs wait in the queue.
+
+    Every cell goes through the cost-model scheduler with time_budget_s,
+    so O(n²) sorts at large n are extrapolated instead of run. With
+    result_cache (a result_cache.ResultCache) every cell is looked up
+    there first and verified measurements are stored for later jobs.
+    """
+
+    def __init__(self, max_workers=1, max_jobs=100, result_cache=None, time_budget_s=JOB_TIME_BUDGET_S):
+        self.max_jobs = max_jobs
+        self.result_cache = result_cache
+        self.time_budget_s = time_budget_s
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='benchmark')
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, test_data_by_size, algorithm_names=None, profile_memory=False, tags=None, timeout_s=None):
+        """Queue a benchmark and return its job immediately
+
+        test_data_by_size maps data size -> list of numbers; every algorithm
+        runs on a copy of each list. With profile_memory each result also
+        gets a 'memory' entry, see memory_profile.measure_memory. tags
+        (e.g. distribution and seed) are copied into every result. Each
+        cell is stopped after timeout_s seconds at its next checkpoint.
+        """
+        available = sort_registry.algorithm_names()
+        if algorithm_names is None:
+            algorithm_names = available
+        unknown = [name for name in algorithm_names if name not in available]
+        if unknown:
+            raise ValueError(f"Unknown algorithm(s): {', '.join(unknown)}")
+
+        job = BenchmarkJob(test_data_by_size, list(algorithm_names), profile_memory, tags, timeout_s)
+        with self._lock:
+            self._jobs[job.job_id] = job
+            self._evict()
+        self._executor.submit(self._run, job)
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id):
+        """Cancel a queued or running job; returns the job, or None if unknown"""
+        job = self.get(job_id)
+        if job is not None and job.status in ('queued', 'running'):
+            job.cancel()
+        return job
+
+    def _evict(self):
+        # Hapus job lama yang sudah selesai kalau jumlah job melewati batas
+        for job_id in list(self._jobs):
+            if len(self._jobs) <= self.max_jobs:
+                break
+            if self._jobs[job_id].finished:
+                del self._jobs[job_id]
+
+    def _run_cell(self, job, comparator, algorithm, test_data, name, size, data_fp):
+        if self.result_cache is None:
+            return comparator.run_cell(algorithm, test_data, name, size)
+        params = {'runner': 'job', 'data_size': size, 'distribution': job.tags.get('distribution'),
+                  'profile_memory': job.profile_memory, 'timeout_s': job.timeout_s,
+                  'budget_s': self.time_budget_s}
+        result, hit = self.result_cache.get_or_compute(
+            cache_key(name, algorithm, data_fp, params),
+            lambda: comparator.run_cell(algorithm, test_data, name, size), cacheable_result)
+        result['cached'] = hit
+        return result
+
+    def _run(self, job):
+        if job.token.cancelled:
+            job.finish('cancelled')
+            return
+        job.mark_running()
+        comparator = FullSortingComparator(progress_callback=job.update_progress,
+                                           profile_memory=job.profile_memory, time_budget_s=self.time_budget_s,
+                                           timeout_s=job.timeout_s, cancel_token=job.token)
+        algorithms = dict((name, func) for func, name in comparator.get_algorithms())
+        try:
+            for size, test_data in job.test_data_by_size.items():
+                data_fp = dataset_fingerprint(test_data) if self.result_cache is not None else None
+                for name in job.algorithm_names:
+                    if job.token.cancelled:
+                        job.finish('cancelled')
+                        return
+                    job.start_cell(name, size)
+                    job.add_result(self._run_cell(job, comparator, algorithms[name], test_data, name, size, data_fp))
+        except Exception as e:
+            job.finish('failed', error=str(e))
+            return
+        job.finish('cancelled' if job.token.cancelled else 'completed')
@@ -1,90 +1,247 @@
 # MatplotlibExample.py
-import os
+# Grafik dibuat dari hasil yang sudah tersimpan di database riwayat
+# (results/benchmarks.sqlite, lihat results_db.py) - benchmark TIDAK dijalankan
+# ulang. Jalankan dulu app_fullcomparison_nskip.py (atau _skip), lalu:
+#
+#   python matplotlib.py                 # run terakhir
+#   python matplotlib.py --run 12        # run tertentu
+#   python matplotlib.py --force         # gambar ulang walau data tidak berubah
+#
+# Setiap grafik hanya digambar ulang kalau hash isi datanya berubah.
+import argparse
+import hashlib
+import json
 import math
-import matplotlib.pyplot as plt
-
-# === Jika kamu mengganti nama file (disarankan) ===
-from app_fullcomparison_nskip import FullSortingComparator
-
-# === Jika TIDAK mengganti nama file, gunakan import alternatif ini (hapus 3 baris import di atas):
-# import importlib.machinery, importlib.util
-# loader = importlib.machinery.SourceFileLoader("nskip", "app-fullcomparison-nskip.py")
-# spec = importlib.util.spec_from_loader(loader.name, loader)
-# nskip = importlib.util.module_from_spec(spec)
-# loader.exec_module(nskip)
-# FullSortingComparator = nskip.FullSortingComparator
-# ===================================================
-
-def main():
-    # Siapkan output folder
-    os.makedirs("results", exist_ok=True)
-
-    # Jalankan benchmark
-    comparator = FullSortingComparator()
-
-    # Sesuaikan ukuran data agar demo grafik tidak terlalu lama.
-    # Jika tetap ingin 50_000, siap-siap lama pada Bubble/Selection.
-    data_sizes = [1_000, 10_000, 50_000]
-    all_results = comparator.run_comparison(data_sizes)
-
-    # --- Susun data untuk plotting ---
-    # Bentuk: {size: {algo: time_ms}}
-    results_by_size = {}
-    for r in all_results:
-        size = r["data_size"]
-        algo = r["algorithm"]
-        t    = r["time_ms"]
-        results_by_size.setdefault(size, {})[algo] = t
-
-    algorithms = ["Selection Sort", "Bubble Sort", "Quick Sort", "Merge Sort", "Heap Sort"]
-    sizes = sorted(results_by_size.keys())
-
-    # Siapkan matriks waktu (ms). Jika ada 'Error', jadikan NaN agar tidak mematahkan plot.
-    series = {algo: [] for algo in algorithms}
-    for s in sizes:
-        row = results_by_size[s]
-        for algo in algorithms:
-            val = row.get(algo, float("nan"))
-            if not isinstance(val, (int, float)):
-                val = float("nan")
-            series[algo].append(val)
-
-    # --- Plot 1: Line chart (log scale) ---
+import os
+import sys
+
+from distributions import DEFAULT_DISTRIBUTION
+from results_db import DEFAULT_DB_PATH, ResultsDB
+from scaling import fit_models, predict
+
+OUTPUT_DIR = "results"
+CACHE_FILE = ".chart_cache.json"
+
+# Naikkan kalau cara menggambar berubah, supaya cache lama tidak dipakai
+CHART_VERSION = 2
+
+# Jumlah titik kurva fit per oktaf ukuran data
+FIT_POINTS_PER_OCTAVE = 8
+
+
+def _pyplot():
+    """Import pyplot lazily with the headless Agg backend
+
+    This file is itself called matplotlib.py, so with its directory on
+    sys.path `import matplotlib` would find this file instead of the
+    library; the directory is taken off sys.path for the import.
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    shadow = sys.modules.get('matplotlib')
+    if shadow is not None and os.path.abspath(getattr(shadow, '__file__', '') or '') == os.path.abspath(__file__):
+        del sys.modules['matplotlib']
+    saved_path = sys.path[:]
+    sys.path[:] = [p for p in sys.path if os.path.abspath(p or os.curdir) != here]
+    try:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+    finally:
+        sys.path[:] = saved_path
+        if shadow is not None and 'matplotlib' not in sys.modules:
+            sys.modules['matplotlib'] = shadow
+    return plt
+
+
+def load_cells(db_path=DEFAULT_DB_PATH, run_id=None):
+    """Cells of a saved run (default: the latest) and its run ID"""
+    if not os.path.exists(db_path):
+        raise FileNotFoundError(f"Database hasil tidak ditemukan: {db_path} - jalankan benchmark dulu")
+    db = ResultsDB(db_path)
+    try:
+        if run_id is None:
+            latest = db.latest_run_ids(1)
+            if not latest:
+                raise ValueError(f"Belum ada run tersimpan di {db_path}")
+            run_id = latest[0]
+        return db.get_cells(run_id), run_id
+    finally:
+        db.close()
+
+
+def build_series(cells):
+    """Per distribution: {algorithm: [(n, time_ms, err_low, err_high)]}, sorted by n
+
+    Cells without a measured time (errors, skipped or extrapolated) are
+    left out; the error bar is the stored 95% CI around the median.
+    """
+    by_distribution = {}
+    for cell in cells:
+        t = cell['time_ms']
+        if t is None:
+            continue
+        low, high = cell.get('ci_low_ms'), cell.get('ci_high_ms')
+        err_low = max(0.0, t - low) if low is not None else 0.0
+        err_high = max(0.0, high - t) if high is not None else 0.0
+        series = by_distribution.setdefault(cell['distribution'] or DEFAULT_DISTRIBUTION, {})
+        series.setdefault(cell['algorithm'], []).append((cell['data_size'], t, err_low, err_high))
+    for series in by_distribution.values():
+        for points in series.values():
+            points.sort()
+    return by_distribution
+
+
+def content_hash(kind, series):
+    payload = json.dumps({'version': CHART_VERSION, 'kind': kind, 'series': series}, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ChartCache:
+    """Content hashes of the data each chart was last drawn from"""
+
+    def __init__(self, directory):
+        self.path = os.path.join(directory, CACHE_FILE)
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                self.hashes = json.load(f)
+        except (OSError, ValueError):
+            self.hashes = {}
+
+    def is_fresh(self, chart_path, digest):
+        return self.hashes.get(os.path.basename(chart_path)) == digest and os.path.exists(chart_path)
+
+    def update(self, chart_path, digest):
+        self.hashes[os.path.basename(chart_path)] = digest
+
+    def save(self):
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(self.hashes, f, indent=2, sort_keys=True)
+
+
+def fit_curve(points):
+    """(xs, ys, label) of the best scaling fit through the points, or None"""
+    fits = fit_models([(n, t) for n, t, _, _ in points])
+    if not fits or len(points) < 3:
+        # Dua titik selalu pas dengan model apa pun - overlay tidak informatif
+        return None
+    fit = fits[0]
+    lo, hi = points[0][0], points[-1][0]
+    steps = max(1, int(math.log2(hi / lo) * FIT_POINTS_PER_OCTAVE))
+    xs = [lo * (hi / lo) ** (i / steps) for i in range(steps + 1)]
+    return xs, [predict(fit, x) for x in xs], f"fit {fit['model']} (R²={fit['r2']:.3f})"
+
+
+def draw_line_chart(plt, series, path, distribution):
+    """Log-log time per size with CI error bars and dashed scaling-fit overlays"""
     plt.figure(figsize=(10, 6))
-    for algo in algorithms:
-        plt.plot(sizes, series[algo], marker="o", label=algo)
-    plt.title("Perbandingan Waktu Eksekusi Sorting (ms) — log scale")
+    for algo, points in series.items():
+        sizes = [n for n, _, _, _ in points]
+        times = [t for _, t, _, _ in points]
+        errors = [[lo for _, _, lo, _ in points], [hi for _, _, _, hi in points]]
+        line = plt.errorbar(sizes, times, yerr=errors, marker="o", capsize=3, label=algo)
+        curve = fit_curve(points)
+        if curve is not None:
+            xs, ys, label = curve
+            plt.plot(xs, ys, linestyle="--", linewidth=1, alpha=0.6, color=line[0].get_color(),
+                     label=f"{algo}: {label}")
+    plt.title(f"Perbandingan Waktu Eksekusi Sorting (ms) — log scale ({distribution})")
     plt.xlabel("Ukuran Data (n)")
     plt.ylabel("Waktu (ms)")
+    plt.xscale("log")
     plt.yscale("log")  # Perbedaan skala jadi lebih terbaca
     plt.grid(True, which="both", linestyle="--", alpha=0.4)
-    plt.legend()
-    line_path = os.path.join("results", "sorting_comparison_line.png")
-    plt.savefig(line_path, dpi=150, bbox_inches="tight")
+    plt.legend(fontsize="small", ncol=2)
+    plt.savefig(path, dpi=150, bbox_inches="tight")
     plt.close()
 
-    # --- Plot 2: Grouped bar chart (log scale) ---
+
+def draw_bar_chart(plt, series, path, distribution):
+    """Grouped bars per size with CI error bars"""
+    sizes = sorted({n for points in series.values() for n, _, _, _ in points})
+    algorithms = list(series)
     plt.figure(figsize=(12, 6))
     x = range(len(sizes))
-    width = 0.15
+    width = 0.8 / len(algorithms)
     for i, algo in enumerate(algorithms):
+        by_size = {n: (t, lo, hi) for n, t, lo, hi in series[algo]}
+        values = [by_size.get(s, (float("nan"), 0.0, 0.0)) for s in sizes]
         offsets = [xi + (i - len(algorithms)/2)*width + width/2 for xi in x]
-        plt.bar(offsets, series[algo], width=width, label=algo)
-    plt.title("Perbandingan Waktu Eksekusi Sorting (ms) — Grouped Bars (log scale)")
+        plt.bar(offsets, [t for t, _, _ in values], width=width, label=algo,
+                yerr=[[lo for _, lo, _ in values], [hi for _, _, hi in values]], capsize=2)
+    plt.title(f"Perbandingan Waktu Eksekusi Sorting (ms) — Grouped Bars (log scale, {distribution})")
     plt.xlabel("Ukuran Data (n)")
     plt.ylabel("Waktu (ms)")
     plt.yscale("log")
     plt.xticks(list(x), [f"{s:,}" for s in sizes])
     plt.grid(True, which="both", axis="y", linestyle="--", alpha=0.4)
-    plt.legend()
-    bar_path = os.path.join("results", "sorting_comparison_bars.png")
-    plt.savefig(bar_path, dpi=150, bbox_inches="tight")
+    plt.legend(fontsize="small", ncol=2)
+    plt.savefig(path, dpi=150, bbox_inches="tight")
     plt.close()
 
-    print("✅ Grafik tersimpan:")
-    print(f" - {line_path}")
-    print(f" - {bar_path}")
+
+CHARTS = {
+    'line': draw_line_chart,
+    'bars': draw_bar_chart,
+}
+
+
+def chart_path(directory, kind, distribution):
+    # Distribusi default memakai nama file lama
+    suffix = "" if distribution == DEFAULT_DISTRIBUTION else f"_{distribution}"
+    return os.path.join(directory, f"sorting_comparison_{kind}{suffix}.png")
+
+
+def render_charts(cells, directory=OUTPUT_DIR, force=False):
+    """Draw every chart whose source data changed; returns (drawn, unchanged) paths"""
+    os.makedirs(directory, exist_ok=True)
+    cache = ChartCache(directory)
+    plt = None
+    drawn, unchanged = [], []
+    for distribution, series in build_series(cells).items():
+        for kind, draw in CHARTS.items():
+            path = chart_path(directory, kind, distribution)
+            digest = content_hash(kind, series)
+            if not force and cache.is_fresh(path, digest):
+                unchanged.append(path)
+                continue
+            if plt is None:
+                plt = _pyplot()
+            draw(plt, series, path, distribution)
+            cache.update(path, digest)
+            drawn.append(path)
+    cache.save()
+    return drawn, unchanged
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gambar grafik dari hasil benchmark yang tersimpan")
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help="lokasi file SQLite (default: %(default)s)")
+    parser.add_argument('--run', type=int, default=None, help="ID run (default: run terakhir)")
+    parser.add_argument('--out', default=OUTPUT_DIR, help="folder output grafik (default: %(default)s)")
+    parser.add_argument('--force', action='store_true', help="gambar ulang semua grafik")
+    args = parser.parse_args(argv)
+
+    try:
+        cells, run_id = load_cells(args.db, args.run)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    try:
+        drawn, unchanged = render_charts(cells, args.out, args.force)
+    except ImportError:
+        print("❌ matplotlib belum terpasang: pip install matplotlib")
+        return 1
+    print(f"📊 Run #{run_id}: {len(cells)} cell")
+    if drawn:
+        print("✅ Grafik tersimpan:")
+        for path in drawn:
+            print(f" - {path}")
+    if unchanged:
+        print(f"⏭️  {len(unchanged)} grafik tidak berubah (data sama), tidak digambar ulang")
     print("Tip: Gunakan skala log agar gap O(n²) vs O(n log n) mudah terlihat.")
+    return 0
+
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,72 @@
+import gc
+import sys
+import threading
+import tracemalloc
+
+# tracemalloc adalah state global per proses: dua pengukuran yang tumpang tindih
+# saling me-reset peak dan stop() milik yang satu mematikan tracing yang lain
+_tracing_lock = threading.Lock()
+
+
+def measure_memory(func, data):
+    """Run func on a copy of data under tracemalloc and report its allocations
+
+    Returns peak_bytes (highest traced memory above the starting point
+    while func ran), retained_bytes (traced memory still held afterwards,
+    including the returned list) and net_blocks (net change in live
+    blocks, sys.getallocatedblocks after minus before). tracemalloc only
+    sees live memory, so neither the total number of allocations nor the
+    total bytes allocated over the run are available; blocks freed again
+    before func returns do not show up in net_blocks. This run is
+    separate from the timed runs because tracing slows the algorithm
+    down considerably. Concurrent calls in one process are serialized;
+    tracing still slows other threads while it is on, so callers that
+    share a process with timed runs (the web app) run this in a
+    subprocess.
+    """
+    test_data = data.copy()
+    with _tracing_lock:
+        was_tracing = tracemalloc.is_tracing()
+        gc.collect()
+
+        if not was_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        blocks_before = sys.getallocatedblocks()
+        start_bytes, _ = tracemalloc.get_traced_memory()
+
+        try:
+            output = func(test_data)
+            current_bytes, peak_bytes = tracemalloc.get_traced_memory()
+            blocks_after = sys.getallocatedblocks()
+        finally:
+            if not was_tracing:
+                tracemalloc.stop()
+
+    del output
+    return {
+        'peak_bytes': max(0, peak_bytes - start_bytes),
+        'retained_bytes': current_bytes - start_bytes,
+        'net_blocks': blocks_after - blocks_before,
+    }
+
+
+def format_bytes(num_bytes):
+    """Human readable size, e.g. 1.5 MB"""
+    if num_bytes is None:
+        return '-'
+    size = float(num_bytes)
+    for unit in ('B', 'KB', 'MB'):
+        if abs(size) < 1024:
+            return f"{size:,.1f} {unit}"
+        size /= 1024
+    return f"{size:,.1f} GB"
+
+
+def format_memory(memory):
+    """One-line memory summary for result files"""
+    if not memory:
+        return '-'
+    return (f"peak {format_bytes(memory['peak_bytes'])}, "
+            f"retained {format_bytes(memory['retained_bytes'])}, "
+            f"net blocks {memory['net_blocks']:+,}")
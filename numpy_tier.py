@@ -0,0 +1,29 @@
+# NumPy opsional: kalau tidak terpasang, baseline np.sort tidak didaftarkan
+# (dan np bernilai None untuk modul lain yang memeriksanya).
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Jenis algoritma np.sort yang dipakai sebagai baseline native
+NUMPY_SORT_KINDS = ['quicksort', 'mergesort', 'heapsort', 'stable']
+
+
+def make_numpy_sort(kind):
+    """Return a sort function that runs np.sort with the given kind
+
+    The conversion from a Python list to an int64 array is part of the
+    measured time, just like the hand-written sorts pay for their own
+    element access.
+    """
+    def numpy_sort(arr):
+        return np.sort(np.asarray(arr, dtype=np.int64), kind=kind)
+    numpy_sort.__name__ = f'numpy_sort_{kind}'
+    return numpy_sort
+
+
+def numpy_algorithms():
+    """(function, name) pairs for the np.sort baselines, empty without NumPy"""
+    if np is None:
+        return []
+    return [(make_numpy_sort(kind), f"NumPy {kind}") for kind in NUMPY_SORT_KINDS]
@@ -0,0 +1,154 @@
+import functools
+import math
+
+# Mode instrumentasi: hitung operasi, bukan waktu. Angka ini tidak
+# bergantung pada hardware, jadi bisa dibandingkan antar mesin.
+
+
+class OpCounter:
+    """Shared tally of element comparisons and element stores (input list and auxiliary buffers)"""
+
+    def __init__(self):
+        self.comparisons = 0
+        self.input_writes = 0
+        self.buffer_writes = 0
+
+    def new_buffer(self, values=()):
+        """new_buffer hook for the sorts: an auxiliary buffer whose stores, initial values included, are counted"""
+        buffer = CountingList(self, field='buffer_writes')
+        buffer.extend(values)
+        return buffer
+
+
+class CountingItem:
+    """Wraps one value and counts every comparison made with it"""
+
+    __slots__ = ('value', 'counter')
+
+    def __init__(self, value, counter):
+        self.value = value
+        self.counter = counter
+
+    def _other(self, other):
+        self.counter.comparisons += 1
+        return other.value if isinstance(other, CountingItem) else other
+
+    def __lt__(self, other):
+        return self.value < self._other(other)
+
+    def __le__(self, other):
+        return self.value <= self._other(other)
+
+    def __gt__(self, other):
+        return self.value > self._other(other)
+
+    def __ge__(self, other):
+        return self.value >= self._other(other)
+
+    def __eq__(self, other):
+        return self.value == self._other(other)
+
+    def __ne__(self, other):
+        return self.value != self._other(other)
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __repr__(self):
+        return repr(self.value)
+
+
+class CountingList(list):
+    """List that counts element stores (a swap counts as two stores)
+
+    Stores are added to counter.<field>: input_writes for the list being
+    sorted, buffer_writes for auxiliary buffers. Filling the list at
+    construction is not counted.
+    """
+
+    def __init__(self, counter, iterable=(), field='input_writes'):
+        super().__init__(iterable)
+        self.counter = counter
+        self.field = field
+
+    def _count(self, stores):
+        setattr(self.counter, self.field, getattr(self.counter, self.field) + stores)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            self._count(len(value))
+        else:
+            self._count(1)
+        super().__setitem__(index, value)
+
+    def append(self, value):
+        self._count(1)
+        super().append(value)
+
+    def insert(self, index, value):
+        self._count(1)
+        super().insert(index, value)
+
+    def extend(self, iterable):
+        values = list(iterable)
+        self._count(len(values))
+        super().extend(values)
+
+    def __iadd__(self, iterable):
+        self.extend(iterable)
+        return self
+
+
+def _per(count, denominator):
+    return round(count / denominator, 4) if count is not None and denominator else None
+
+
+def count_operations(algorithm, data, buffers=False, in_place=False):
+    """Run algorithm once on instrumented data and return its operation counts
+
+    comparisons counts every element comparison. writes counts every
+    element store (assignment): input_writes into the input list plus
+    buffer_writes into auxiliary buffers, counting the values a buffer is
+    created with (a preallocated merge buffer adds n). A swap counts as
+    two stores.
+    With buffers the algorithm is given the new_buffer hook (see
+    basic_sorts), so stores into its buffers are counted too; an
+    in_place algorithm has no buffers. For any other algorithm (e.g.
+    Built-in sorted, the integer sorts) buffer_writes and writes are
+    None. Comparisons and writes are also given divided by n log2 n and
+    by n².
+    """
+    counter = OpCounter()
+    arr = CountingList(counter, (CountingItem(value, counter) for value in data))
+    if buffers:
+        algorithm = functools.partial(algorithm, new_buffer=counter.new_buffer)
+    algorithm(arr)
+    if buffers:
+        buffer_writes = counter.buffer_writes
+    else:
+        buffer_writes = 0 if in_place else None
+    writes = counter.input_writes + buffer_writes if buffer_writes is not None else None
+
+    n = len(data)
+    n_log_n = n * math.log2(n) if n > 1 else 0
+    return {
+        'comparisons': counter.comparisons,
+        'writes': writes,
+        'input_writes': counter.input_writes,
+        'buffer_writes': buffer_writes,
+        'comparisons_per_n_log_n': _per(counter.comparisons, n_log_n),
+        'comparisons_per_n2': _per(counter.comparisons, n * n),
+        'writes_per_n_log_n': _per(writes, n_log_n),
+        'writes_per_n2': _per(writes, n * n),
+    }
+
+
+def format_count(count):
+    """Compact count: 1.2K, 3.4M, 5.6G"""
+    if count is None:
+        return "-"
+    for unit, scale in (('G', 1e9), ('M', 1e6), ('K', 1e3)):
+        if count >= scale:
+            return f"{count / scale:.1f}{unit}"
+    return str(count)
@@ -0,0 +1,107 @@
+import contextlib
+import io
+import multiprocessing
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+
+def available_cores():
+    """Return the CPU cores this process may run on"""
+    if hasattr(os, 'sched_getaffinity'):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _pin_worker(core_queue):
+    # Setiap worker mengambil satu core dan menempel di sana,
+    # jadi tidak ada dua cell yang berebut core yang sama
+    core = core_queue.get()
+    if core is not None and hasattr(os, 'sched_setaffinity'):
+        try:
+            os.sched_setaffinity(0, {core})
+        except OSError:
+            pass
+
+
+def _run_cell(shm_name, length, size, algorithm_name, comparator_options):
+    """Worker: attach to the shared test data and benchmark one (algorithm, size) cell"""
+    from app_fullcomparison_nskip import FullSortingComparator
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        view = shm.buf.cast('q')
+        test_data = view[:length].tolist()
+        view.release()
+    finally:
+        shm.close()
+
+    comparator = FullSortingComparator(**comparator_options)
+    algorithms = dict((name, func) for func, name in comparator.get_algorithms())
+    # Output progress dari banyak proses akan saling tumpuk, jadi dibuang
+    with contextlib.redirect_stdout(io.StringIO()):
+        return comparator.run_cell(algorithms[algorithm_name], test_data, algorithm_name, size)
+
+
+def share_test_data(test_data):
+    """Copy a list of ints into a new shared memory block as int64"""
+    shm = shared_memory.SharedMemory(create=True, size=max(1, len(test_data)) * 8)
+    view = shm.buf.cast('q')
+    view[:len(test_data)] = array('q', test_data)
+    view.release()
+    return shm
+
+
+def run_cells_parallel(test_data_by_size, algorithm_names, max_workers=None, on_result=None,
+                       comparator_options=None):
+    """Benchmark every (algorithm, size) cell in its own process, one cell per core
+
+    Test data is placed in shared memory once per size instead of being
+    pickled for every cell. Results come back in the same order as the
+    sequential run (size by size, algorithm by algorithm). on_result, if
+    given, is called with each result as soon as its cell finishes.
+    comparator_options are passed to FullSortingComparator in each worker.
+    """
+    comparator_options = comparator_options or {}
+    cores = available_cores()
+    if max_workers is None:
+        max_workers = len(cores)
+
+    ctx = multiprocessing.get_context()
+    core_queue = ctx.Queue()
+    for i in range(max_workers):
+        core_queue.put(cores[i] if i < len(cores) else None)
+
+    blocks = {size: share_test_data(data) for size, data in test_data_by_size.items()}
+    cells = [(size, name) for size in test_data_by_size for name in algorithm_names]
+    results = {}
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=ctx,
+                                 initializer=_pin_worker, initargs=(core_queue,)) as executor:
+            futures = {
+                executor.submit(_run_cell, blocks[size].name, len(test_data_by_size[size]), size, name,
+                                comparator_options): (size, name)
+                for size, name in cells
+            }
+            for future in as_completed(futures):
+                size, name = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = {
+                        'algorithm': name,
+                        'time_ms': 'Error',
+                        'data_size': size,
+                        'is_correct': False,
+                        'status': f'Error: {str(e)}'
+                    }
+                results[(size, name)] = result
+                if on_result is not None:
+                    on_result(result)
+    finally:
+        for shm in blocks.values():
+            shm.close()
+            shm.unlink()
+
+    return [results[cell] for cell in cells]
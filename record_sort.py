@@ -0,0 +1,208 @@
+import csv
+import io
+from array import array
+from decimal import Decimal, InvalidOperation
+
+from csv_ingest import DEFAULT_CHUNK_SIZE, ColumnNotFoundError, iter_lines
+
+# Sorting record lengkap: baris CSV disimpan per kolom sebagai teks aslinya.
+# Tipe kolom kunci ditentukan dari datanya (angka atau teks), bukan dari daftar
+# nama kolom. Yang diurutkan hanya permutasi indeks, baris tidak pernah
+# dipindah - permutasi diterapkan saat output ditulis, dengan teks sel persis
+# seperti di input.
+
+STREAM_ROWS = 1000
+
+INT64_MAX = (1 << 63) - 1
+
+
+class MixedColumnError(ValueError):
+    """Raised when a sort key column mixes numbers and text"""
+
+    def __init__(self, column, example):
+        self.column = column
+        self.example = example
+        super().__init__(f"Column '{column}' mixes numbers and text (e.g. '{example}'); "
+                         f"clean the column or choose another key")
+
+
+class RecordTable:
+    """Column-wise table parsed from a CSV stream
+
+    columns holds the original cell text. Key columns are typed on first
+    use, see key_column.
+    """
+
+    def __init__(self, header, columns, length):
+        self.header = header
+        self.columns = columns
+        self.length = length
+        self._keys = {}
+
+    def __len__(self):
+        return self.length
+
+    def key_column(self, name):
+        """('numeric' | 'text' | 'mixed', values) for a column, typed from its data
+
+        Blank cells are None. In a numeric column the other values are
+        ints on a common fixed-point scale (12.5 and 3.25 become 1250 and
+        325); in a text column they are the stripped strings. For a
+        mixed column (numbers plus non-numeric text) values are the
+        non-numeric cells.
+        """
+        if name not in self.columns:
+            raise ColumnNotFoundError(name, self.header)
+        if name not in self._keys:
+            self._keys[name] = _typed_column(self.columns[name])
+        return self._keys[name]
+
+    def cell_text(self, name, i):
+        return self.columns[name][i]
+
+
+def _parse_number(text):
+    """Decimal value of a cell, or None if it is not a finite number"""
+    try:
+        number = Decimal(text)
+    except InvalidOperation:
+        return None
+    return number if number.is_finite() else None
+
+
+def _typed_column(values):
+    """Classify a column's cells, see RecordTable.key_column"""
+    cells = [value.strip() for value in values]
+    numbers = [_parse_number(cell) if cell else None for cell in cells]
+    text = [cell for cell, number in zip(cells, numbers) if cell and number is None]
+    present = [number for number in numbers if number is not None]
+    if not present:
+        return 'text', [cell or None for cell in cells]
+    if text:
+        return 'mixed', text
+    # Skala fixed-point bersama: cukup untuk digit desimal terbanyak di kolom
+    decimals = max(max(-number.as_tuple().exponent, 0) for number in present)
+    scale = 10 ** decimals
+    return 'numeric', [None if number is None else int(number * scale) for number in numbers]
+
+
+def load_table(stream, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Parse a whole CSV from a binary stream into a RecordTable
+
+    Rows whose field count does not match the header are skipped.
+    """
+    reader = csv.reader(iter_lines(stream, chunk_size))
+    header = [name.strip() for name in next(reader, [])]
+    raw = [[] for _ in header]
+    length = 0
+    for row in reader:
+        if len(row) != len(header):
+            continue
+        for values, cell in zip(raw, row):
+            values.append(cell)
+        length += 1
+    return RecordTable(header, dict(zip(header, raw)), length)
+
+
+def parse_keys(spec):
+    """'transaction_date,-total_amount' -> [('transaction_date', False), ('total_amount', True)]
+
+    A leading '-' sorts that key in descending order.
+    """
+    keys = []
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        descending = part.startswith('-')
+        keys.append((part.lstrip('-'), descending))
+    if not keys:
+        raise ValueError("At least one sort key is required")
+    return keys
+
+
+def _key_codes(table, name, descending):
+    """Map a column to non-negative ints that sort like the column; returns (codes, radix)
+
+    Blank cells get the highest code, so they sort last in either
+    direction. A column mixing numbers and text raises MixedColumnError
+    rather than being sorted as text.
+    """
+    kind, values = table.key_column(name)
+    if kind == 'mixed':
+        raise MixedColumnError(name, values[0])
+    present = [v for v in values if v is not None]
+    if kind == 'numeric':
+        lo, hi = min(present), max(present)
+        code = lambda v: v - lo
+    else:
+        # Kolom teks diganti rank-nya, jadi perbandingan selalu antar int
+        ranks = {value: rank for rank, value in enumerate(sorted(set(present)))}
+        lo, hi = 0, max(len(ranks) - 1, 0)
+        code = ranks.__getitem__
+    span = hi - lo + 1
+    if descending:
+        codes = [span if v is None else span - 1 - code(v) for v in values]
+    else:
+        codes = [span if v is None else code(v) for v in values]
+    radix = span + 1 if len(present) < len(values) else span
+    return codes, radix
+
+
+def pack_keys(table, keys):
+    """One int per row encoding all keys (mixed radix) with the row index last
+
+    Sorting these ints orders rows by the keys and, through the index,
+    keeps equal keys in their original order - so any algorithm,
+    stable or not, gives a stable record sort. Also lets the integer
+    sorts run on records. When the product of the key ranges would not
+    fit in int64 (e.g. age,salary,price,total_amount), the keys are
+    first replaced by the rank of each row's key tuple, as is done for
+    text columns, so every code stays below n².
+    """
+    n = len(table)
+    key_codes = [_key_codes(table, name, descending) for name, descending in keys]
+    capacity = n
+    for _, radix in key_codes:
+        capacity *= radix
+    if capacity > INT64_MAX:
+        rows = list(zip(*(codes for codes, _ in key_codes)))
+        ranks = {key: rank for rank, key in enumerate(sorted(set(rows)))}
+        key_codes = [([ranks[key] for key in rows], max(len(ranks), 1))]
+    packed = [0] * n
+    for codes, radix in key_codes:
+        packed = [p * radix + c for p, c in zip(packed, codes)]
+    return [p * n + i for i, p in enumerate(packed)]
+
+
+def unpack_permutation(ordered, n):
+    """Row indices (array('q')) from packed keys in sorted order"""
+    return array('q', (code % n for code in ordered))
+
+
+class SortedView:
+    """A table seen through a permutation; rows are only materialized when written"""
+
+    def __init__(self, table, permutation):
+        self.table = table
+        self.permutation = permutation
+
+    def __len__(self):
+        return len(self.permutation)
+
+    def row(self, i):
+        index = self.permutation[i]
+        return [self.table.cell_text(name, index) for name in self.table.header]
+
+    def iter_csv(self, rows_per_chunk=STREAM_ROWS):
+        """Yield the sorted table as CSV text, a chunk of rows at a time"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+        writer.writerow(self.table.header)
+        for i in range(len(self)):
+            writer.writerow(self.row(i))
+            if (i + 1) % rows_per_chunk == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue()
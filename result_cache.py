@@ -0,0 +1,274 @@
+import copy
+import hashlib
+import inspect
+import json
+import os
+import platform
+import tempfile
+import threading
+import time
+from array import array
+from collections import OrderedDict
+
+# Cache hasil benchmark. Key = hash dari:
+#   - versi algoritma: source modul tempat fungsi didefinisikan, ditambah source
+#     modul proyek yang diimpornya (transitif) + nama fungsi, jadi mengubah
+#     implementasi atau helper yang dipakainya (mis. fast_sorts.insertion_sort_range
+#     untuk Bucket Sort) otomatis membuat entry lama tidak terpakai
+#   - hash isi dataset sesuai urutan elemen (data acak dan data urut dengan isi
+#     yang sama adalah input berbeda)
+#   - parameter run (ukuran, distribusi, seed, opsi) dan versi Python
+# Tier memori: LRU dengan TTL. Tier disk: satu file JSON per key, bertahan
+# antar restart server. Tier disk dibatasi max_disk_entries file: entry
+# kadaluarsa disapu saat start, dan saat batas terlampaui entry kadaluarsa lalu
+# yang tertua dihapus sampai tersisa DISK_PRUNE_RATIO dari batas.
+
+DEFAULT_CACHE_DIR = os.path.join("results", "cache")
+DEFAULT_TTL_S = 6 * 3600
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_DISK_ENTRIES = 4096
+DISK_PRUNE_RATIO = 0.75
+STALE_TMP_S = 60
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_version_cache = {}
+
+
+def _project_modules(module):
+    """module plus every project module it imports from, directly or transitively, sorted by name"""
+    found = {}
+    pending = [module]
+    while pending:
+        current = pending.pop()
+        path = getattr(current, '__file__', None)
+        if current is None or current.__name__ in found or path is None:
+            continue
+        if os.path.dirname(os.path.abspath(path)) != PROJECT_DIR:
+            continue
+        found[current.__name__] = current
+        # Modul yang diimpor langsung, dan modul asal fungsi/kelas yang diimpor dengan from-import
+        for value in vars(current).values():
+            pending.append(value if inspect.ismodule(value) else inspect.getmodule(value))
+    return [found[name] for name in sorted(found)]
+
+
+def algorithm_version(func):
+    """Stable hash identifying the implementation of func
+
+    Python functions hash their qualified name plus the source of their
+    defining module and of every project module it imports, so editing a
+    shared helper invalidates the algorithms built on it. Builtins such
+    as sorted hash the Python version instead, and wrappers around NumPy
+    add the NumPy version.
+    """
+    while hasattr(func, 'func'):  # functools.partial
+        func = func.func
+    module = inspect.getmodule(func)
+    name = getattr(func, '__qualname__', repr(func))
+    cache_key = (getattr(module, '__name__', None), name)
+    if cache_key in _version_cache:
+        return _version_cache[cache_key]
+    modules = _project_modules(module) if module is not None else []
+    if modules:
+        source = "\n".join(f"# {m.__name__}\n{inspect.getsource(m)}" for m in modules)
+    else:
+        source = f"{getattr(module, '__name__', 'builtins')} {platform.python_version()}"
+    if getattr(module, 'np', None) is not None:
+        # Fungsi yang membungkus NumPy ikut berubah kalau versi NumPy berubah
+        source += f"\nnumpy {module.np.__version__}"
+    digest = hashlib.sha256(f"{name}\n{source}".encode('utf-8')).hexdigest()[:16]
+    _version_cache[cache_key] = digest
+    return digest
+
+
+def dataset_fingerprint(data):
+    """Short hex digest of the contents of data, in order"""
+    try:
+        payload = array('q', data).tobytes()
+    except (TypeError, OverflowError):
+        # Nilai di luar int64 atau bukan integer
+        payload = repr(list(data)).encode('utf-8')
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+
+def cacheable_result(result):
+    """Only verified measurements are cached, never extrapolations, timeouts or errors"""
+    mode = result.get('mode', 'measured' if result.get('status', 'Completed') == 'Completed' else 'error')
+    return mode == 'measured' and result.get('is_correct') is True
+
+
+def cache_key(algorithm_name, func, data_fp, params=None):
+    """Key for one benchmark cell: algorithm version + dataset fingerprint + parameters"""
+    payload = {
+        'algorithm': algorithm_name,
+        'version': algorithm_version(func),
+        'dataset': data_fp,
+        'params': params or {},
+        'python': platform.python_version(),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+class ResultCache:
+    """Thread-safe TTL/LRU cache of JSON-serializable results, with an optional disk tier
+
+    Memory holds up to max_entries values, least recently used evicted
+    first. With directory set every value is also written there and a
+    memory miss falls back to disk. Entries older than ttl_s are ignored
+    and removed in both tiers. The disk tier keeps at most
+    max_disk_entries files, see sweep_disk.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, ttl_s=DEFAULT_TTL_S, max_entries=DEFAULT_MAX_ENTRIES,
+                 max_disk_entries=DEFAULT_MAX_DISK_ENTRIES):
+        self.directory = directory
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_lock = threading.Lock()
+        self._disk_count = 0
+        self.hits = 0
+        self.misses = 0
+        self.sweep_disk()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def get(self, key):
+        """Cached value for key (a copy), or None"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(entry[1])
+            self._entries.pop(key, None)
+
+        entry = self._read_disk(key, now)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._store_memory(key, entry)
+        return copy.deepcopy(entry[1])
+
+    def put(self, key, value):
+        entry = (time.time() + self.ttl_s, copy.deepcopy(value))
+        with self._lock:
+            self._store_memory(key, entry)
+        self._write_disk(key, entry)
+
+    def get_or_compute(self, key, compute, should_cache=None):
+        """(value, hit): the cached value, or compute() stored unless should_cache(value) is False"""
+        value = self.get(key)
+        if value is not None:
+            return value, True
+        value = compute()
+        if should_cache is None or should_cache(value):
+            self.put(key, value)
+        return value, False
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+        with self._disk_lock:
+            for path, _ in self._disk_files():
+                _remove(path)
+            self._disk_count = 0
+
+    def sweep_disk(self, target=None):
+        """Remove expired and leftover temporary files, then the oldest entries down to target
+
+        target defaults to max_disk_entries. Returns the number of files removed.
+        """
+        if target is None:
+            target = self.max_disk_entries
+        with self._disk_lock:
+            # Umur dibaca dari mtime: file ditulis saat put, jadi kadaluarsa di mtime + ttl_s
+            cutoff = time.time() - self.ttl_s
+            kept, removed = [], 0
+            for path, mtime in self._disk_files(include_tmp=True):
+                if path.endswith('.tmp'):
+                    # Sisa penulisan yang terputus; yang masih baru mungkin sedang ditulis
+                    if mtime <= time.time() - STALE_TMP_S:
+                        removed += _remove(path)
+                elif mtime <= cutoff:
+                    removed += _remove(path)
+                else:
+                    kept.append((mtime, path))
+            if len(kept) > target:
+                kept.sort()
+                for _, path in kept[:len(kept) - target]:
+                    removed += _remove(path)
+                kept = kept[len(kept) - target:]
+            self._disk_count = len(kept)
+        return removed
+
+    def _disk_files(self, include_tmp=False):
+        """(path, mtime) of every entry file in the disk tier"""
+        if not self.directory or not os.path.isdir(self.directory):
+            return
+        suffixes = ('.json', '.tmp') if include_tmp else ('.json',)
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if name.endswith(suffixes):
+                    path = os.path.join(root, name)
+                    try:
+                        yield path, os.path.getmtime(path)
+                    except OSError:
+                        continue
+
+    def _store_memory(self, key, entry):
+        # Dipanggil dengan _lock dipegang
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _read_disk(self, key, now):
+        if not self.directory:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, encoding='utf-8') as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if stored.get('expires_at', 0) <= now:
+            _remove(path)
+            return None
+        return stored['expires_at'], stored['value']
+
+    def _write_disk(self, key, entry):
+        if not self.directory:
+            return
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Tulis ke file sementara lalu rename, supaya pembaca lain tidak melihat file setengah jadi
+        fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'expires_at': entry[0], 'value': entry[1]}, f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError):
+            _remove(tmp_path)
+            return
+        with self._disk_lock:
+            self._disk_count += 1
+            over = self._disk_count > self.max_disk_entries
+        if over:
+            self.sweep_disk(int(self.max_disk_entries * DISK_PRUNE_RATIO))
+
+
+def _remove(path):
+    """Delete a file, ignoring one that is already gone; returns 1 if removed"""
+    try:
+        os.remove(path)
+    except OSError:
+        return 0
+    return 1
@@ -0,0 +1,284 @@
+import argparse
+import json
+import math
+import os
+import platform
+import sqlite3
+import subprocess
+import sys
+from datetime import datetime
+
+from timing import t_critical
+
+DEFAULT_DB_PATH = os.path.join("results", "benchmarks.sqlite")
+
+# Kolom statistik yang disalin dari result['time_stats']
+STAT_FIELDS = ['repeats', 'min_ms', 'median_ms', 'mean_ms', 'stdev_ms', 'p95_ms', 'ci_low_ms', 'ci_high_ms']
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at TEXT NOT NULL,
+    source TEXT,
+    git_sha TEXT,
+    python_version TEXT,
+    platform TEXT,
+    cpu_info TEXT,
+    notes TEXT
+);
+CREATE TABLE IF NOT EXISTS cells (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    algorithm TEXT NOT NULL,
+    data_size INTEGER NOT NULL,
+    distribution TEXT,
+    seed INTEGER,
+    status TEXT,
+    is_correct INTEGER,
+    time_ms REAL,
+    repeats INTEGER,
+    min_ms REAL,
+    median_ms REAL,
+    mean_ms REAL,
+    stdev_ms REAL,
+    p95_ms REAL,
+    ci_low_ms REAL,
+    ci_high_ms REAL,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_cells_run ON cells(run_id);
+CREATE INDEX IF NOT EXISTS idx_cells_key ON cells(algorithm, data_size, distribution);
+"""
+
+
+def git_sha():
+    """Current git commit, or None outside a git checkout"""
+    try:
+        out = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                             cwd=os.path.dirname(os.path.abspath(__file__)), timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def cpu_info():
+    """CPU model name and logical core count"""
+    model = platform.processor()
+    try:
+        with open('/proc/cpuinfo', encoding='utf-8') as f:
+            for line in f:
+                if line.startswith('model name'):
+                    model = line.split(':', 1)[1].strip()
+                    break
+    except OSError:
+        pass
+    return f"{model or platform.machine()} ({os.cpu_count()} cores)"
+
+
+def environment_metadata():
+    return {
+        'git_sha': git_sha(),
+        'python_version': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_info': cpu_info(),
+    }
+
+
+class ResultsDB:
+    """Append-only SQLite store of benchmark runs and their cells"""
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def record_run(self, all_results, source=None, notes=None):
+        """Insert a run and all its result cells; returns the new run ID"""
+        meta = environment_metadata()
+        with self.conn:
+            cur = self.conn.execute(
+                "INSERT INTO runs (created_at, source, git_sha, python_version, platform, cpu_info, notes) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (datetime.now().isoformat(timespec='seconds'), source, meta['git_sha'],
+                 meta['python_version'], meta['platform'], meta['cpu_info'], notes))
+            run_id = cur.lastrowid
+            for result in all_results:
+                self.conn.execute(
+                    "INSERT INTO cells (run_id, algorithm, data_size, distribution, seed, status, is_correct, "
+                    "time_ms, " + ", ".join(STAT_FIELDS) + ", extra) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, " + ", ".join("?" * len(STAT_FIELDS)) + ", ?)",
+                    self._cell_values(run_id, result))
+        return run_id
+
+    def _cell_values(self, run_id, result):
+        stats = result.get('time_stats') or {}
+        time_ms = result['time_ms'] if isinstance(result['time_ms'], (int, float)) else None
+        known = {'algorithm', 'data_size', 'distribution', 'seed', 'status', 'is_correct', 'time_ms', 'time_stats'}
+        extra = {key: value for key, value in result.items() if key not in known}
+        is_correct = result.get('is_correct')
+        return (
+            run_id, result['algorithm'], result['data_size'], result.get('distribution'), result.get('seed'),
+            result.get('status'), int(is_correct) if isinstance(is_correct, bool) else None, time_ms,
+            *[stats.get(field) for field in STAT_FIELDS],
+            json.dumps(extra) if extra else None,
+        )
+
+    def list_runs(self, limit=20):
+        rows = self.conn.execute(
+            "SELECT runs.*, COUNT(cells.id) AS cells FROM runs LEFT JOIN cells ON cells.run_id = runs.id "
+            "GROUP BY runs.id ORDER BY runs.id DESC LIMIT ?", (limit,))
+        return [dict(row) for row in rows]
+
+    def latest_run_ids(self, count=2):
+        rows = self.conn.execute("SELECT id FROM runs ORDER BY id DESC LIMIT ?", (count,))
+        return [row['id'] for row in rows][::-1]
+
+    def get_run(self, run_id):
+        row = self.conn.execute("SELECT * FROM runs WHERE id = ?", (run_id,)).fetchone()
+        return dict(row) if row else None
+
+    def get_cells(self, run_id):
+        rows = self.conn.execute("SELECT * FROM cells WHERE run_id = ? ORDER BY id", (run_id,))
+        return [self._cell_dict(row) for row in rows]
+
+    def history(self, algorithm, data_size=None, distribution=None):
+        """All recorded cells of one algorithm (optionally one size/distribution), oldest first"""
+        query = ("SELECT cells.*, runs.created_at, runs.git_sha FROM cells JOIN runs ON runs.id = cells.run_id "
+                 "WHERE algorithm = ?")
+        params = [algorithm]
+        if data_size is not None:
+            query += " AND data_size = ?"
+            params.append(data_size)
+        if distribution is not None:
+            query += " AND distribution = ?"
+            params.append(distribution)
+        rows = self.conn.execute(query + " ORDER BY cells.id", params)
+        return [self._cell_dict(row) for row in rows]
+
+    def _cell_dict(self, row):
+        cell = dict(row)
+        extra = cell.pop('extra')
+        if extra:
+            cell.update(json.loads(extra))
+        return cell
+
+    def compare(self, base_run_id, new_run_id, min_change=0.05):
+        """Compare matching cells of two runs
+
+        A cell is a regression (or improvement) when its mean changed by at
+        least min_change (relative) and Welch's t-test on the stored mean,
+        stdev and repeat count is significant at 95%. Cells with a single
+        sample fall back to the relative change alone.
+        """
+        key = lambda cell: (cell['algorithm'], cell['data_size'], cell['distribution'])
+        base = {key(cell): cell for cell in self.get_cells(base_run_id)}
+        comparisons = []
+        for cell in self.get_cells(new_run_id):
+            old = base.get(key(cell))
+            if old is None or old['mean_ms'] is None or cell['mean_ms'] is None:
+                continue
+            change = (cell['mean_ms'] - old['mean_ms']) / old['mean_ms'] if old['mean_ms'] else 0.0
+            significant = welch_significant(old, cell)
+            if abs(change) >= min_change and significant:
+                verdict = 'regression' if change > 0 else 'improvement'
+            else:
+                verdict = 'unchanged'
+            comparisons.append({
+                'algorithm': cell['algorithm'],
+                'data_size': cell['data_size'],
+                'distribution': cell['distribution'],
+                'base_ms': old['mean_ms'],
+                'new_ms': cell['mean_ms'],
+                'change': change,
+                'significant': significant,
+                'verdict': verdict,
+            })
+        return comparisons
+
+
+def welch_significant(a, b):
+    """Welch's t-test (two-sided, 95%) on the summary statistics of two cells"""
+    n1, n2 = a['repeats'] or 1, b['repeats'] or 1
+    if n1 < 2 or n2 < 2:
+        return True
+    v1 = (a['stdev_ms'] or 0.0) ** 2 / n1
+    v2 = (b['stdev_ms'] or 0.0) ** 2 / n2
+    if v1 + v2 == 0:
+        return a['mean_ms'] != b['mean_ms']
+    t = (b['mean_ms'] - a['mean_ms']) / math.sqrt(v1 + v2)
+    df = (v1 + v2) ** 2 / ((v1 ** 2) / (n1 - 1) + (v2 ** 2) / (n2 - 1))
+    return abs(t) > t_critical(max(1, int(df)))
+
+
+def print_comparison(comparisons):
+    print(f"{'ALGORITMA':<18} {'SIZE':>10} {'DISTRIBUSI':<14} {'BASE (ms)':>12} {'NEW (ms)':>12} {'CHANGE':>9}  HASIL")
+    print("-" * 92)
+    icons = {'regression': '🔴 regresi', 'improvement': '🟢 lebih cepat', 'unchanged': '⚪ sama'}
+    for c in comparisons:
+        print(f"{c['algorithm']:<18} {c['data_size']:>10,} {str(c['distribution']):<14} {c['base_ms']:>12,.2f} "
+              f"{c['new_ms']:>12,.2f} {c['change']:>+8.1%}  {icons[c['verdict']]}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Riwayat hasil benchmark sorting")
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help="lokasi file SQLite")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    list_cmd = sub.add_parser('list', help="tampilkan run terakhir")
+    list_cmd.add_argument('--limit', type=int, default=20)
+
+    show_cmd = sub.add_parser('show', help="tampilkan semua cell dari satu run")
+    show_cmd.add_argument('run_id', type=int)
+
+    history_cmd = sub.add_parser('history', help="riwayat satu algoritma")
+    history_cmd.add_argument('algorithm')
+    history_cmd.add_argument('--size', type=int)
+    history_cmd.add_argument('--distribution')
+
+    compare_cmd = sub.add_parser('compare', help="bandingkan dua run, exit code 1 jika ada regresi")
+    compare_cmd.add_argument('base', type=int, nargs='?', help="run dasar (default: run kedua terakhir)")
+    compare_cmd.add_argument('new', type=int, nargs='?', help="run baru (default: run terakhir)")
+    compare_cmd.add_argument('--min-change', type=float, default=0.05,
+                             help="perubahan relatif minimum yang dianggap berarti (default 0.05)")
+
+    args = parser.parse_args(argv)
+    db = ResultsDB(args.db)
+    try:
+        if args.command == 'list':
+            for run in db.list_runs(args.limit):
+                print(f"#{run['id']:<5} {run['created_at']}  {str(run['source']):<8} "
+                      f"{(run['git_sha'] or '-')[:10]:<10}  py{run['python_version']}  {run['cells']} cell")
+        elif args.command == 'show':
+            for cell in db.get_cells(args.run_id):
+                print(json.dumps(cell, ensure_ascii=False))
+        elif args.command == 'history':
+            for cell in db.history(args.algorithm, args.size, args.distribution):
+                print(f"#{cell['run_id']:<5} {cell['created_at']}  {(cell['git_sha'] or '-')[:10]:<10} "
+                      f"{cell['data_size']:>10,} {str(cell['distribution']):<14} {cell['time_ms']} ms")
+        elif args.command == 'compare':
+            base, new = args.base, args.new
+            if base is None or new is None:
+                latest = db.latest_run_ids(2)
+                if len(latest) < 2:
+                    print("Butuh minimal dua run untuk dibandingkan")
+                    return 2
+                base, new = latest
+            comparisons = db.compare(base, new, args.min_change)
+            print(f"Perbandingan run #{base} -> #{new}")
+            print_comparison(comparisons)
+            if any(c['verdict'] == 'regression' for c in comparisons):
+                return 1
+    finally:
+        db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,275 @@
+import argparse
+import math
+import sys
+import time
+
+from budget import COST_MODELS
+from cancellation import CancellationToken, Cancelled
+from distributions import DEFAULT_DISTRIBUTION, DISTRIBUTIONS, generate_data
+import sort_registry
+from timing import measure
+
+# Analisis skala: setiap algoritma dijalankan pada tangga ukuran geometris
+# (2^8, 2^9, ...) sampai budget waktunya habis, lalu kurva waktu di-fit di
+# ruang log-log. Hasilnya: eksponen empiris, model terbaik (n, n log n, n²)
+# beserta R², ukuran crossover antar algoritma, dan rekomendasi algoritma
+# untuk ukuran data dan SLO latensi tertentu.
+
+DEFAULT_MIN_EXP = 8
+DEFAULT_MAX_EXP = 22
+DEFAULT_BUDGET_S = 20.0
+SWEEP_OPTIONS = {'warmup': 1, 'min_repeats': 3, 'max_repeats': 7, 'max_time_s': 2.0}
+
+# Rentang pencarian crossover (n) dan jumlah titik grid per oktaf
+CROSSOVER_RANGE = (2, 2 ** 40)
+CROSSOVER_STEPS_PER_OCTAVE = 4
+
+
+def size_ladder(min_exp=DEFAULT_MIN_EXP, max_exp=DEFAULT_MAX_EXP):
+    return [2 ** k for k in range(min_exp, max_exp + 1)]
+
+
+def sweep(name, ladder, budget_s=DEFAULT_BUDGET_S, distribution=DEFAULT_DISTRIBUTION, seed=0,
+          timing_options=None):
+    """Time one registered algorithm up the size ladder within budget_s seconds
+
+    Before each size the next time is predicted from the slope so far;
+    the sweep stops when it would not fit in the remaining budget. A run
+    that still overshoots is stopped at its next checkpoint (O(n²) sorts)
+    and ends the sweep. Returns {'points': [(n, median_ms)], 'stopped_at',
+    'reason'}.
+    """
+    algorithm = sort_registry.get(name)
+    options = dict(SWEEP_OPTIONS, **(timing_options or {}))
+    token = None
+
+    def checkpoint(algorithm_name, i, n):
+        if token is not None:
+            token.check(algorithm_name, (i / n) * 100)
+
+    func = algorithm.bind(checkpoint)
+    points = []
+    start = time.perf_counter()
+    for n in ladder:
+        remaining = budget_s - (time.perf_counter() - start)
+        if points:
+            predicted_ms = predict_next_ms(points, n)
+            if predicted_ms / 1000 > remaining:
+                return {'points': points, 'stopped_at': n, 'reason': 'budget'}
+        if remaining <= 0:
+            return {'points': points, 'stopped_at': n, 'reason': 'budget'}
+        data = generate_data(distribution, n, seed)
+        if sort_registry.not_applicable_reason(name, data) is not None:
+            return {'points': points, 'stopped_at': n, 'reason': 'not_applicable'}
+        token = CancellationToken(remaining)
+        try:
+            stats, _ = measure(func, data, **dict(options, max_time_s=min(options['max_time_s'], remaining)))
+        except Cancelled:
+            return {'points': points, 'stopped_at': n, 'reason': 'timeout'}
+        finally:
+            token = None
+        points.append((n, stats['median_ms']))
+    return {'points': points, 'stopped_at': None, 'reason': 'ladder'}
+
+
+def predict_next_ms(points, n):
+    """Extrapolate the next size from the last two points (at least linear growth)"""
+    last_n, last_ms = points[-1]
+    exponent = 1.0
+    if len(points) > 1:
+        exponent = max(exponent, loglog_slope(points[-2:])[0])
+    return last_ms * (n / last_n) ** exponent
+
+
+def _least_squares(xs, ys):
+    """Slope, intercept and R² of the ordinary least-squares line through (xs, ys)"""
+    k = len(xs)
+    mean_x = sum(xs) / k
+    mean_y = sum(ys) / k
+    sxx = sum((x - mean_x) ** 2 for x in xs)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    slope = sxy / sxx if sxx else 0.0
+    intercept = mean_y - slope * mean_x
+    return slope, intercept, _r_squared(ys, [intercept + slope * x for x in xs])
+
+
+def _r_squared(ys, predicted):
+    mean_y = sum(ys) / len(ys)
+    ss_tot = sum((y - mean_y) ** 2 for y in ys)
+    ss_res = sum((y - p) ** 2 for y, p in zip(ys, predicted))
+    return 1 - ss_res / ss_tot if ss_tot else 1.0
+
+
+def loglog_slope(points):
+    """Empirical exponent b in time ≈ c · n^b, with the R² of the log-log fit"""
+    points = [(n, t) for n, t in points if t > 0]
+    if len(points) < 2:
+        return float('nan'), float('nan')
+    slope, _, r2 = _least_squares([math.log(n) for n, _ in points], [math.log(t) for _, t in points])
+    return slope, r2
+
+
+def fit_models(points):
+    """Least-squares fit of time ≈ a · f(n) for every cost model, best first
+
+    The fit is done on log time, so small and large sizes weigh equally:
+    log a is the mean residual of log t − log f(n), and R² is measured on
+    log t. Returns [{'model', 'coefficient', 'r2'}].
+    """
+    points = [(n, t) for n, t in points if t > 0]
+    if len(points) < 2:
+        return []
+    log_t = [math.log(t) for _, t in points]
+    fits = []
+    for model, f in COST_MODELS.items():
+        log_f = [math.log(f(n)) for n, _ in points]
+        log_a = sum(t - g for t, g in zip(log_t, log_f)) / len(points)
+        r2 = _r_squared(log_t, [log_a + g for g in log_f])
+        fits.append({'model': model, 'coefficient': math.exp(log_a), 'r2': r2})
+    return sorted(fits, key=lambda fit: fit['r2'], reverse=True)
+
+
+def predict(fit, n):
+    return fit['coefficient'] * COST_MODELS[fit['model']](n)
+
+
+def crossovers(fit_a, fit_b, lo=CROSSOVER_RANGE[0], hi=CROSSOVER_RANGE[1]):
+    """Sizes where the fitted curves of two algorithms cross, in increasing order"""
+    diff = lambda n: math.log(predict(fit_a, n)) - math.log(predict(fit_b, n))
+    steps = int(math.log2(hi / lo) * CROSSOVER_STEPS_PER_OCTAVE)
+    grid = [lo * 2 ** (i / CROSSOVER_STEPS_PER_OCTAVE) for i in range(steps + 1)]
+    found = []
+    for left, right in zip(grid, grid[1:]):
+        if (diff(left) > 0) == (diff(right) > 0):
+            continue
+        # Bisection di ruang log n
+        for _ in range(40):
+            middle = math.sqrt(left * right)
+            if (diff(middle) > 0) == (diff(left) > 0):
+                left = middle
+            else:
+                right = middle
+        found.append(round(math.sqrt(left * right)))
+    return found
+
+
+class ScalingReport:
+    """Sweeps, fits and crossovers for a set of algorithms"""
+
+    def __init__(self, sweeps):
+        self.sweeps = sweeps
+        self.fits = {}
+        self.exponents = {}
+        for name, result in sweeps.items():
+            fits = fit_models(result['points'])
+            if fits:
+                self.fits[name] = fits[0]
+                self.exponents[name] = loglog_slope(result['points'])
+
+    def crossover_table(self):
+        """[(faster_below, faster_above, n)] for every pair of fitted algorithms
+
+        Only sizes from the smallest measured n upward are searched; below
+        that the fits say nothing.
+        """
+        names = list(self.fits)
+        rows = []
+        for i, a in enumerate(names):
+            for b in names[i + 1:]:
+                lo = min(self.sweeps[a]['points'][0][0], self.sweeps[b]['points'][0][0])
+                for n in crossovers(self.fits[a], self.fits[b], lo=lo):
+                    below = a if predict(self.fits[a], n / 2) < predict(self.fits[b], n / 2) else b
+                    rows.append((below, b if below == a else a, n))
+        return sorted(rows, key=lambda row: row[2])
+
+    def recommend(self, n, slo_ms=None):
+        """Fastest algorithm predicted at n, and the ones that meet slo_ms
+
+        Predictions beyond the largest measured size are extrapolations;
+        'extrapolated' lists the algorithms for which that is the case.
+        """
+        predictions = sorted((predict(fit, n), name) for name, fit in self.fits.items())
+        meeting = [(ms, name) for ms, name in predictions if slo_ms is None or ms <= slo_ms]
+        return {
+            'n': n,
+            'slo_ms': slo_ms,
+            'recommended': meeting[0][1] if meeting else None,
+            'predictions': [{'algorithm': name, 'predicted_ms': round(ms, 3)} for ms, name in predictions],
+            'meets_slo': [name for _, name in meeting],
+            'extrapolated': [name for name, result in self.sweeps.items()
+                             if name in self.fits and n > result['points'][-1][0]],
+        }
+
+    def display(self):
+        print(f"\n{'=' * 80}")
+        print("📐 ANALISIS SKALA (fit log-log)")
+        print(f"{'=' * 80}")
+        print(f"{'ALGORITMA':<16} {'n MAKS':>10} {'EKSPONEN':>9} {'R²':>6}  {'MODEL':<9} {'R²':>6}  BERHENTI")
+        for name, result in self.sweeps.items():
+            if name not in self.fits:
+                print(f"{name:<16} {'-':>10}  titik ukur kurang dari 2 ({result['reason']})")
+                continue
+            exponent, exponent_r2 = self.exponents[name]
+            fit = self.fits[name]
+            stop = f"{result['reason']} @ {result['stopped_at']:,}" if result['stopped_at'] else result['reason']
+            print(f"{name:<16} {result['points'][-1][0]:>10,} {exponent:>9.2f} {exponent_r2:>6.3f}  "
+                  f"{fit['model']:<9} {fit['r2']:>6.3f}  {stop}")
+
+        rows = self.crossover_table()
+        if rows:
+            print("\n🔀 CROSSOVER (menurut model terbaik):")
+            for below, above, n in rows:
+                print(f"   n ≈ {n:>14,}: {below} lebih cepat di bawah, {above} di atas")
+
+    def display_recommendation(self, n, slo_ms=None):
+        advice = self.recommend(n, slo_ms)
+        slo = f", SLO {slo_ms:,.0f} ms" if slo_ms is not None else ""
+        print(f"\n🎯 REKOMENDASI UNTUK n = {n:,}{slo}:")
+        for row in advice['predictions'][:5]:
+            mark = "✅" if row['algorithm'] in advice['meets_slo'] else "❌"
+            note = " (ekstrapolasi)" if row['algorithm'] in advice['extrapolated'] else ""
+            print(f"   {mark} {row['algorithm']:<16} ~{row['predicted_ms']:,.1f} ms{note}")
+        if advice['recommended']:
+            print(f"   👉 Pakai {advice['recommended']}")
+        else:
+            print("   ⚠️  Tidak ada algoritma yang diprediksi memenuhi SLO")
+        return advice
+
+
+def run_scaling_analysis(names=None, ladder=None, budget_s=DEFAULT_BUDGET_S, distribution=DEFAULT_DISTRIBUTION,
+                         seed=0):
+    """Sweep every algorithm (default: the whole registry) and build a ScalingReport"""
+    names = names or sort_registry.algorithm_names()
+    ladder = ladder or size_ladder()
+    sweeps = {}
+    for name in names:
+        print(f"   📏 {name}...", end='\r')
+        sweeps[name] = sweep(name, ladder, budget_s, distribution, seed)
+        print(' ' * 50, end='\r')
+    return ScalingReport(sweeps)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fit kurva skala algoritma sorting dan rekomendasi per ukuran/SLO")
+    parser.add_argument('--algorithms', nargs='+', default=None, choices=sort_registry.algorithm_names(),
+                        help="algoritma yang diukur (default: semua di registry)")
+    parser.add_argument('--min-exp', type=int, default=DEFAULT_MIN_EXP, help="ukuran terkecil 2^N (default: %(default)s)")
+    parser.add_argument('--max-exp', type=int, default=DEFAULT_MAX_EXP, help="ukuran terbesar 2^N (default: %(default)s)")
+    parser.add_argument('--budget', type=float, default=DEFAULT_BUDGET_S,
+                        help="budget waktu per algoritma dalam detik (default: %(default)s)")
+    parser.add_argument('--distribution', choices=list(DISTRIBUTIONS), default=DEFAULT_DISTRIBUTION)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--n', type=int, default=None, help="ukuran data untuk rekomendasi")
+    parser.add_argument('--slo-ms', type=float, default=None, help="batas latensi untuk rekomendasi (ms)")
+    args = parser.parse_args(argv)
+
+    report = run_scaling_analysis(args.algorithms, size_ladder(args.min_exp, args.max_exp), args.budget,
+                                  args.distribution, args.seed)
+    report.display()
+    if args.n:
+        report.display_recommendation(args.n, args.slo_ms)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+import functools
+
+from basic_sorts import bubble_sort, heap_sort, merge_sort, quick_sort, selection_sort
+from external_sort import external_sort
+from fast_sorts import introsort, merge_sort_bottomup, quick_sort_inplace
+from integer_sorts import bucket_sort, counting_skip_reason, counting_sort, integer_sort, radix_sort_lsd
+from numpy_tier import numpy_algorithms
+
+# Satu daftar algoritma untuk semua entry point (app.py, kedua comparator,
+# job, plot). Algoritma baru cukup didaftarkan di sini.
+
+
+class SortAlgorithm:
+    """A registered sort plus the metadata every entry point reads"""
+
+    def __init__(self, name, func, complexity, stable, in_place, recursive=False,
+                 max_practical_n=None, checkpoints=False, buffers=False, family='comparison', skip_reason=None):
+        self.name = name
+        self.func = func
+        self.complexity = complexity
+        self.stable = stable
+        self.in_place = in_place
+        self.recursive = recursive
+        # n terbesar yang masih praktis; di atasnya comparator skip tidak menjalankannya
+        self.max_practical_n = max_practical_n
+        # True kalau func menerima hook checkpoint(nama, i, n)
+        self.checkpoints = checkpoints
+        # True kalau func membuat buffer bantunya lewat hook new_buffer(values)
+        self.buffers = buffers
+        self.family = family
+        # skip_reason(data) -> alasan algoritma tidak berlaku untuk data ini, atau None
+        self.skip_reason = skip_reason
+
+    def bind(self, checkpoint=None, new_buffer=None):
+        """The callable to benchmark, with the checkpoint and new_buffer hooks attached when supported"""
+        hooks = {}
+        if self.checkpoints and checkpoint is not None:
+            hooks['checkpoint'] = checkpoint
+        if self.buffers and new_buffer is not None:
+            hooks['new_buffer'] = new_buffer
+        return functools.partial(self.func, **hooks) if hooks else self.func
+
+    def info(self):
+        return {
+            'name': self.name,
+            'complexity': self.complexity,
+            'stable': self.stable,
+            'in_place': self.in_place,
+            'recursive': self.recursive,
+            'max_practical_n': self.max_practical_n,
+            'family': self.family,
+        }
+
+
+def _build_registry():
+    algorithms = [
+        SortAlgorithm("Selection Sort", selection_sort, "O(n²) - Quadratic", stable=False, in_place=True,
+                      max_practical_n=5000, checkpoints=True),
+        SortAlgorithm("Bubble Sort", bubble_sort, "O(n²) - Quadratic, O(n) untuk data urut", stable=True,
+                      in_place=True, max_practical_n=5000, checkpoints=True),
+        SortAlgorithm("Quick Sort", quick_sort, "O(n log n) - Linearithmic (average)", stable=True, in_place=False,
+                      buffers=True),
+        SortAlgorithm("Merge Sort", merge_sort, "O(n log n) - Linearithmic", stable=True, in_place=False,
+                      buffers=True),
+        SortAlgorithm("Heap Sort", heap_sort, "O(n log n) - Linearithmic", stable=False, in_place=True),
+        SortAlgorithm("In-place Quick", quick_sort_inplace, "O(n log n) - Linearithmic (average), O(log n) ruang",
+                      stable=False, in_place=True),
+        SortAlgorithm("Bottom-up Merge", merge_sort_bottomup, "O(n log n) - Linearithmic, satu buffer O(n)",
+                      stable=True, in_place=False, buffers=True),
+        SortAlgorithm("Introsort", introsort, "O(n log n) - Linearithmic (worst case, fallback heap sort)",
+                      stable=False, in_place=True),
+        SortAlgorithm("Built-in sorted", sorted, "O(n log n) - Timsort (C), O(n) untuk data hampir urut",
+                      stable=True, in_place=False, family='native'),
+        SortAlgorithm("External Merge", external_sort, "O(n log n) - run di disk + k-way merge, memori terbatas",
+                      stable=True, in_place=False, family='external'),
+        # Sort integer menulis hasil kembali ke arr, tapi memakai tabel hitung O(k)
+        # atau buffer O(n) - jadi bukan in-place
+        SortAlgorithm("Counting Sort", counting_sort, "O(n + k) - k = rentang kunci",
+                      stable=False, in_place=False, family='integer', skip_reason=counting_skip_reason),
+        SortAlgorithm("Radix Sort LSD", radix_sort_lsd, "O(n · w/8) - w = bit rentang kunci",
+                      stable=True, in_place=False, family='integer'),
+        SortAlgorithm("Bucket Sort", bucket_sort, "O(n) rata-rata untuk data uniform, O(n²) terburuk",
+                      stable=True, in_place=False, family='integer'),
+        SortAlgorithm("Integer Auto", integer_sort, "Counting atau radix, dipilih dari rentang kunci",
+                      stable=False, in_place=False, family='integer'),
+    ]
+    for func, name in numpy_algorithms():
+        stable = name.endswith(('mergesort', 'stable'))
+        algorithms.append(SortAlgorithm(name, func, "O(n log n) - native (C), baseline",
+                                        stable=stable, in_place=False, family='native'))
+    return algorithms
+
+
+REGISTRY = _build_registry()
+_BY_NAME = {algorithm.name: algorithm for algorithm in REGISTRY}
+
+
+def get(name):
+    """The SortAlgorithm registered under name, or None"""
+    return _BY_NAME.get(name)
+
+
+def algorithm_names():
+    return [algorithm.name for algorithm in REGISTRY]
+
+
+def get_algorithms(checkpoint=None):
+    """(function, name) pairs for every registered algorithm, in registry order"""
+    return [(algorithm.bind(checkpoint), algorithm.name) for algorithm in REGISTRY]
+
+
+def exceeds_practical_limit(name, n):
+    """Skip policy: True when n is above the algorithm's practical limit"""
+    algorithm = _BY_NAME.get(name)
+    return algorithm is not None and algorithm.max_practical_n is not None and n > algorithm.max_practical_n
+
+
+def not_applicable_reason(name, data):
+    """Skip policy: why the algorithm does not apply to data (e.g. key range too wide), or None"""
+    algorithm = _BY_NAME.get(name)
+    if algorithm is None or algorithm.skip_reason is None:
+        return None
+    return algorithm.skip_reason(data)
+
+
+def skipped_result(algorithm_name, data_size, reason=None):
+    """Result dict for a cell that is not run: above the practical n limit, or not applicable (reason)"""
+    result = {
+        'algorithm': algorithm_name,
+        'time_ms': 'Skipped',
+        'data_size': data_size,
+        'is_correct': True if reason is None else None,
+        'status': 'Skipped (too slow)' if reason is None else 'Skipped (not applicable)',
+        'mode': 'skipped',
+    }
+    if reason is not None:
+        result['reason'] = reason
+    return result
+
+
+def print_complexity_table(names=None):
+    """Print complexity and properties of the registered (or the given) algorithms"""
+    yes_no = lambda flag: "ya" if flag else "-"
+    print(f"   {'ALGORITMA':<16} {'STABIL':<7} {'IN-PLACE':<9} {'REKURSIF':<9} {'BATAS n':>9}  KOMPLEKSITAS")
+    for algorithm in REGISTRY:
+        if names is not None and algorithm.name not in names:
+            continue
+        limit = f"{algorithm.max_practical_n:,}" if algorithm.max_practical_n else "-"
+        print(f"   {algorithm.name:<16} {yes_no(algorithm.stable):<7} {yes_no(algorithm.in_place):<9} "
+              f"{yes_no(algorithm.recursive):<9} "
+              f"{limit:>9}  {algorithm.complexity}")
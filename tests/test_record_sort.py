@@ -0,0 +1,32 @@
+import io
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from record_sort import MixedColumnError, load_table, pack_keys, parse_keys, unpack_permutation  # noqa: E402
+
+
+def sorted_column(csv_text, keys, column):
+    table = load_table(io.BytesIO(csv_text.encode('utf-8')))
+    permutation = unpack_permutation(sorted(pack_keys(table, parse_keys(keys))), len(table))
+    return [table.cell_text(column, i) for i in permutation]
+
+
+def test_blank_cell_sorts_last_and_column_stays_numeric():
+    csv_text = "name,salary\na,10000.50\nb,\nc,500.25\nd,9000.00\n"
+    assert sorted_column(csv_text, 'salary', 'salary') == ['500.25', '9000.00', '10000.50', '']
+    assert sorted_column(csv_text, '-salary', 'salary') == ['10000.50', '9000.00', '500.25', '']
+
+
+def test_numeric_column_detected_without_whitelist():
+    csv_text = "score\n10\n9.5\n100\n"
+    assert sorted_column(csv_text, 'score', 'score') == ['9.5', '10', '100']
+
+
+def test_mixed_column_is_rejected():
+    table = load_table(io.BytesIO(b"salary\n100\nN/A\n20\n"))
+    with pytest.raises(MixedColumnError):
+        pack_keys(table, parse_keys('salary'))
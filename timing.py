@@ -0,0 +1,155 @@
+import gc
+import math
+import statistics
+import time
+
+from cancellation import DeadlineExceeded
+
+# Nilai kritis Student t (two-sided 95%) untuk derajat kebebasan 1..30
+T_CRITICAL_95 = [
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042,
+]
+
+DEFAULT_OPTIONS = {
+    'warmup': 1,                # jumlah run pemanasan yang tidak dihitung
+    'min_repeats': 3,
+    'max_repeats': 30,
+    'target_rel_error': 0.02,   # berhenti kalau setengah lebar CI <= 2% dari mean
+    'max_time_s': 5.0,          # batas total waktu per cell (termasuk warmup)
+    'disable_gc': True,
+}
+
+
+def t_critical(df):
+    if df < 1:
+        return float('nan')
+    if df <= len(T_CRITICAL_95):
+        return T_CRITICAL_95[df - 1]
+    return 1.96
+
+
+def percentile(sorted_samples, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    rank = max(1, math.ceil(pct / 100 * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+def summarize(samples_ns):
+    """Return min/median/mean/stdev/p95 and a 95% confidence interval, in milliseconds"""
+    samples = sorted(ns / 1e6 for ns in samples_ns)
+    n = len(samples)
+    mean = statistics.fmean(samples)
+    stdev = statistics.stdev(samples) if n > 1 else 0.0
+    half_width = t_critical(n - 1) * stdev / math.sqrt(n) if n > 1 else float('nan')
+    return {
+        'repeats': n,
+        'min_ms': samples[0],
+        'median_ms': statistics.median(samples),
+        'mean_ms': mean,
+        'stdev_ms': stdev,
+        'p95_ms': percentile(samples, 95),
+        'ci_low_ms': mean - half_width,
+        'ci_high_ms': mean + half_width,
+        'rel_error': half_width / mean if mean > 0 else float('nan'),
+    }
+
+
+def _timed_run(func, data, disable_gc):
+    # Copy data di luar region yang diukur
+    test_data = data.copy()
+    gc_was_enabled = gc.isenabled()
+    if disable_gc:
+        gc.collect()
+        gc.disable()
+    try:
+        start = time.perf_counter_ns()
+        output = func(test_data)
+        elapsed = time.perf_counter_ns() - start
+    finally:
+        if disable_gc and gc_was_enabled:
+            gc.enable()
+    return elapsed, output
+
+
+def measure(func, data, before_run=None, **options):
+    """Time func(copy of data) with warmup and adaptive repetitions
+
+    Repeats until the 95% confidence interval half-width falls under
+    target_rel_error of the mean, max_repeats is reached, or max_time_s
+    has been spent. A run that alone exceeds max_time_s is kept as the
+    only sample rather than repeated. Returns (stats, output of the last
+    completed run); stats values are in milliseconds.
+
+    before_run() is called before every run, e.g. to restart a per-run
+    deadline. If a repetition hits its deadline (DeadlineExceeded) after
+    at least one sample was taken, measuring stops and the samples so far
+    are kept (stats['truncated'] is True).
+    """
+    opts = dict(DEFAULT_OPTIONS, **options)
+    budget_ns = opts['max_time_s'] * 1e9
+    spent_ns = 0
+    warmups = 0
+    samples = []
+    truncated = False
+
+    for _ in range(opts['warmup']):
+        if before_run is not None:
+            before_run()
+        elapsed, output = _timed_run(func, data, opts['disable_gc'])
+        spent_ns += elapsed
+        warmups += 1
+        if elapsed >= budget_ns:
+            # Terlalu lama untuk diulang - pakai run ini sebagai satu-satunya sampel
+            samples.append(elapsed)
+            warmups -= 1
+            break
+
+    while not samples or (len(samples) < opts['max_repeats'] and spent_ns < budget_ns):
+        if before_run is not None:
+            before_run()
+        try:
+            elapsed, output = _timed_run(func, data, opts['disable_gc'])
+        except DeadlineExceeded:
+            if not samples:
+                raise
+            truncated = True
+            break
+        spent_ns += elapsed
+        samples.append(elapsed)
+        if len(samples) >= opts['min_repeats']:
+            stats = summarize(samples)
+            if stats['rel_error'] <= opts['target_rel_error']:
+                break
+
+    stats = summarize(samples)
+    stats['warmup'] = warmups
+    stats['truncated'] = truncated
+    return stats, output
+
+
+def limited_options(options, limit_s):
+    """options with max_time_s capped at limit_s, so the repetitions fit in a per-cell timeout"""
+    max_time_s = options.get('max_time_s', DEFAULT_OPTIONS['max_time_s'])
+    return dict(options, max_time_s=min(max_time_s, limit_s))
+
+
+def round_stats(stats, digits=3):
+    """Round the float fields of a stats dict for display or JSON output (NaN becomes None)"""
+    rounded = {}
+    for key, value in stats.items():
+        if isinstance(value, float):
+            value = round(value, digits) if math.isfinite(value) else None
+        rounded[key] = value
+    return rounded
+
+
+def format_spread(stats):
+    """Short '±half-width (n=repeats)' label for tables and result files"""
+    if not stats:
+        return '-'
+    low, high = stats.get('ci_low_ms'), stats.get('ci_high_ms')
+    if low is None or high is None:
+        return f"n={stats['repeats']}"
+    return f"±{(high - low) / 2:,.2f} (n={stats['repeats']})"
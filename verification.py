@@ -0,0 +1,78 @@
+import functools
+import itertools
+import operator
+import random
+
+from numpy_tier import np
+
+# Verifikasi hasil sorting di luar region yang diukur:
+#   1. urutan non-decreasing (pairwise, atau vectorized dengan NumPy)
+#   2. output adalah permutasi input, lewat fingerprint multiset yang tidak
+#      bergantung urutan (jumlah elemen, sum, sum kuadrat, xor)
+# Sort yang membuang atau menggandakan elemen tidak lagi lolos.
+
+try:
+    pairwise = itertools.pairwise
+except AttributeError:  # Python < 3.10
+    def pairwise(iterable):
+        a, b = itertools.tee(iterable)
+        next(b, None)
+        return zip(a, b)
+
+
+def _as_list(values):
+    # array('q') / np.ndarray -> list int Python, supaya aritmetika tidak overflow
+    return values.tolist() if hasattr(values, 'tolist') else values
+
+
+def is_monotonic(arr):
+    """Check that arr is in non-decreasing order in one O(n) pass"""
+    if len(arr) < 2:
+        return True
+    if np is not None:
+        a = np.asarray(arr)
+        if a.dtype != object:
+            return bool(np.all(a[:-1] <= a[1:]))
+    return all(x <= y for x, y in pairwise(arr))
+
+
+def is_monotonic_sampled(arr, sample_size, seed=0):
+    """Probabilistic order check on sample_size random adjacent pairs plus their sorted positions"""
+    n = len(arr)
+    if n <= sample_size + 1:
+        return is_monotonic(arr)
+    positions = sorted(random.Random(seed).sample(range(n - 1), sample_size))
+    if any(arr[i] > arr[i + 1] for i in positions):
+        return False
+    return all(arr[i] <= arr[j] for i, j in pairwise(positions))
+
+
+def fingerprint(values):
+    """Order-independent multiset fingerprint: (count, sum, sum of squares, xor)"""
+    values = _as_list(values)
+    return (
+        len(values),
+        sum(values),
+        sum(map(operator.mul, values, values)),
+        functools.reduce(operator.xor, values, 0),
+    )
+
+
+def verify_output(output, input_fingerprint, sample_size=None):
+    """Check that output is sorted and a permutation of the fingerprinted input
+
+    With sample_size the order check is sampled (for huge n); the
+    fingerprint always covers every element, it runs at C speed.
+    Returns a dict with is_sorted, is_permutation, sampled and
+    is_correct.
+    """
+    output = _as_list(output)
+    sampled = sample_size is not None and len(output) > sample_size + 1
+    ordered = is_monotonic_sampled(output, sample_size) if sampled else is_monotonic(output)
+    permutation = fingerprint(output) == input_fingerprint
+    return {
+        'is_sorted': ordered,
+        'is_permutation': permutation,
+        'sampled': sampled,
+        'is_correct': ordered and permutation,
+    }